@@ -1,24 +1,44 @@
 from flask import Flask, request, jsonify, render_template
-import pickle
 import numpy as np
 import os
+from drift_monitor import start_drift_monitor
+from inference import PREDICTION_CACHE, predict_with_proba
+from screening import SCREENING_FIELDS, screen
+from warmup import api_loaders, start_warmup
 
 app = Flask(__name__)
 
-# Load models
-try:
-    diabetes_model = pickle.load(open('diabetes_model.sav', 'rb'))
-    heart_model = pickle.load(open('heart_disease_model.sav', 'rb'))
-    parkinsons_model = pickle.load(open('parkinsons_model.sav', 'rb'))
-except:
-    diabetes_model = None
-    heart_model = None
-    parkinsons_model = None
+# Models (with their training scalers) are loaded and warmed on a background
+# thread at import; /ready reports 200 once every model has served a dummy
+# batch. A request that arrives earlier waits up to WARMUP_WAIT_SECONDS.
+WARMUP = start_warmup(api_loaders())
+WARMUP_WAIT_SECONDS = float(os.getenv("WARMUP_WAIT_SECONDS", "30"))
+
+# Inputs of every prediction feed the streaming drift statistics in users.db.
+DRIFT = start_drift_monitor()
+
+def _model(disease):
+    WARMUP.wait(WARMUP_WAIT_SECONDS)
+    return WARMUP.bundles.get(disease)
 
 @app.route('/')
 def home():
     return render_template('index.html')
 
+@app.route('/ready')
+def ready():
+    return jsonify(WARMUP.snapshot()), 200 if WARMUP.ready else 503
+
+@app.route('/metrics/inference-cache')
+def inference_cache_metrics():
+    return jsonify(PREDICTION_CACHE.stats())
+
+@app.route('/metrics/drift')
+def drift_metrics():
+    if DRIFT is None:
+        return jsonify({"error": "Drift monitoring is not running"}), 503
+    return jsonify(DRIFT.snapshots())
+
 @app.route('/predict/diabetes', methods=['POST'])
 def predict_diabetes():
     try:
@@ -34,8 +54,9 @@ def predict_diabetes():
             float(data['age'])
         ]
         
+        diabetes_model = _model('diabetes')
         if diabetes_model:
-            prediction = diabetes_model.predict([features])
+            prediction, _ = predict_with_proba(diabetes_model, features)
             result = "Diabetic" if prediction[0] == 1 else "Not Diabetic"
         else:
             result = "Model not available"
@@ -64,8 +85,9 @@ def predict_heart():
             float(data['thal'])
         ]
         
+        heart_model = _model('heart')
         if heart_model:
-            prediction = heart_model.predict([features])
+            prediction, _ = predict_with_proba(heart_model, features)
             result = "Heart Disease" if prediction[0] == 1 else "No Heart Disease"
         else:
             result = "Model not available"
@@ -80,8 +102,9 @@ def predict_parkinsons():
         data = request.json
         features = list(data.values())
         
+        parkinsons_model = _model('parkinsons')
         if parkinsons_model:
-            prediction = parkinsons_model.predict([features])
+            prediction, _ = predict_with_proba(parkinsons_model, features)
             result = "Parkinson's Disease" if prediction[0] == 1 else "No Parkinson's Disease"
         else:
             result = "Model not available"
@@ -90,5 +113,16 @@ def predict_parkinsons():
     except Exception as e:
         return jsonify({'error': str(e)}), 400
 
+@app.route('/predict/screening', methods=['POST'])
+def predict_screening():
+    # All three models in one call: shared fields (e.g. age) are sent once and
+    # the models run concurrently (see screening.py).
+    try:
+        data = request.json
+        bundles = {disease: _model(disease) for disease in SCREENING_FIELDS}
+        return jsonify(screen(bundles, data))
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
 if __name__ == '__main__':
     app.run(debug=True)
@@ -0,0 +1,153 @@
+"""About page."""
+import streamlit as st
+
+from ui_components import render_doc_grid, render_feature_grid, render_page_hero
+
+render_page_hero(
+    "About Health AI Studio",
+    "Understand how the platform structures screening workflows, interprets model output, and keeps account-linked history organized.",
+    "Reference"
+)
+
+render_feature_grid([
+    {
+        "tag": "Scope",
+        "title": "Three integrated screening modules",
+        "body": "The workspace brings diabetes, heart disease, and Parkinson's screening into one account-linked interface."
+    },
+    {
+        "tag": "Output",
+        "title": "Confidence-aware interpretation",
+        "body": "Results are shown with supporting visual context so users can review both model direction and confidence."
+    },
+    {
+        "tag": "Continuity",
+        "title": "History stays tied to the account",
+        "body": "Saved assessments remain grouped by user, making repeat screening and follow-up review easier."
+    }
+])
+
+overview_col, workflow_col = st.columns([1.35, 1], gap="large")
+with overview_col:
+    st.markdown("""
+<section class="section-card">
+<span class="mini-tag">Platform overview</span>
+<h3>Built for structured screening, not final diagnosis</h3>
+<p>
+                Health AI Studio is a machine-learning-assisted screening workspace designed to organize patient-style inputs,
+                generate model predictions, and keep outcomes visible across multiple modules. It is intended to support early
+                awareness, education, and workflow continuity rather than replace clinical judgment.
+</p>
+<p>
+                Each prediction workflow is centered on guided data entry, confidence scoring, and saved account history so
+                users can revisit prior assessments without losing context.
+</p>
+</section>
+        """, unsafe_allow_html=True)
+
+with workflow_col:
+    st.markdown("""
+<section class="section-card dark">
+<span class="mini-tag">Workflow</span>
+<h3>How the platform handles a screening run</h3>
+<ol>
+<li>Validate numeric or structured input fields for the selected module.</li>
+<li>Apply the trained model for that disease-specific screening task.</li>
+<li>Estimate confidence and present a readable risk-oriented summary.</li>
+<li>Store the result in the signed-in user's prediction history.</li>
+</ol>
+</section>
+        """, unsafe_allow_html=True)
+
+render_doc_grid([
+    {
+        "title": "Modeling approach",
+        "body": "The platform uses supervised classification models such as random forests, support vector machines, and boosting-based methods depending on the screening dataset."
+    },
+    {
+        "title": "Data processing",
+        "body": "Inputs pass through validation, scaling, and disease-specific feature handling before prediction and confidence presentation."
+    },
+    {
+        "title": "Visual interpretation",
+        "body": "Probability charts, confidence indicators, distribution views, and contextual tips help users interpret output more clearly."
+    }
+])
+
+st.markdown("""
+<section class="section-card">
+<span class="mini-tag">Disease reference</span>
+<h3>Condition summaries and prevention context</h3>
+<p>Use the tabs below for a high-level review of what each module is screening for, which factors matter most, and which preventive habits remain broadly useful.</p>
+</section>
+    """, unsafe_allow_html=True)
+
+tab1, tab2, tab3 = st.tabs(["Diabetes", "Heart Disease", "Parkinson's Disease"])
+
+with tab1:
+    render_feature_grid([
+        {
+            "tag": "Definition",
+            "title": "Glucose regulation disorder",
+            "body": "Diabetes involves impaired insulin production, insulin response, or both, which can lead to consistently elevated blood glucose."
+        },
+        {
+            "tag": "Risk factors",
+            "title": "Metabolic and family history signals",
+            "body": "High glucose, obesity, inactivity, high blood pressure, abnormal lipids, age, and family history all increase screening concern."
+        },
+        {
+            "tag": "Prevention",
+            "title": "Lifestyle remains the first lever",
+            "body": "Weight control, regular movement, balanced nutrition, and repeat health checks remain central to prevention and monitoring."
+        }
+    ])
+
+with tab2:
+    render_feature_grid([
+        {
+            "tag": "Definition",
+            "title": "Broad cardiovascular disease category",
+            "body": "Heart disease includes coronary artery disease, rhythm disorders, and other conditions that affect heart function or circulation."
+        },
+        {
+            "tag": "Risk factors",
+            "title": "Pressure, lipids, and lifestyle profile",
+            "body": "Blood pressure, cholesterol, smoking, diabetes, age, family history, inactivity, obesity, and stress are major contributors."
+        },
+        {
+            "tag": "Prevention",
+            "title": "Control the modifiable drivers",
+            "body": "Regular exercise, balanced diet, weight management, limited alcohol intake, smoking avoidance, and routine checkups lower risk."
+        }
+    ])
+
+with tab3:
+    render_feature_grid([
+        {
+            "tag": "Definition",
+            "title": "Progressive movement disorder",
+            "body": "Parkinson's disease affects the nervous system and commonly presents with tremor, slowed movement, rigidity, and balance changes."
+        },
+        {
+            "tag": "Risk factors",
+            "title": "Age, heredity, and exposure history",
+            "body": "Increasing age, family history, toxin exposure, sex distribution, and past head injury can shape the screening context."
+        },
+        {
+            "tag": "Early signs",
+            "title": "Voice and movement changes matter",
+            "body": "Tremor, bradykinesia, rigidity, speech changes, posture shifts, and altered handwriting are common early warning signs."
+        }
+    ])
+
+st.markdown("""
+<section class="section-card">
+<span class="mini-tag">Sources</span>
+<h3>Data references and further reading</h3>
+<p>Datasets include the UCI diabetes dataset, the Cleveland heart disease dataset, and a Parkinson's disease classification dataset. For public health information, review the American Diabetes Association, American Heart Association, Parkinson's Foundation, and World Health Organization websites.</p>
+</section>
+<div class="disclaimer-note">
+<strong>Clinical note:</strong> This application supports screening and education only. It does not replace medical advice, diagnosis, or treatment from a licensed clinician.
+</div>
+    """, unsafe_allow_html=True)
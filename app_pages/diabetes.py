@@ -0,0 +1,300 @@
+"""Diabetes prediction page."""
+import numpy as np
+import streamlit as st
+
+from auth import save_prediction
+from charts import (
+    plot_prediction_proba, create_metrics_chart,
+    create_distribution_plot, create_comparison_chart
+)
+from inference import predict_with_proba
+from model_loaders import load_diabetes_model, require_model
+from population_stats import get_population_stats
+from ui_components import (
+    add_tooltip, calculate_confidence, count_form_run, finish_prediction_reruns, positive_probability,
+    render_page_hero, show_feature_attributions, show_help_button, show_result_popup, show_similar_patients,
+    show_what_if
+)
+
+diabetes_model = require_model(load_diabetes_model)
+
+# Show help button
+show_help_button()
+
+render_page_hero(
+    "Diabetes Prediction",
+    "Enter metabolic indicators to evaluate diabetes likelihood and confidence score.",
+    "Prediction Module"
+)
+
+# Add tooltips for input fields
+add_tooltip("glucose", "Fasting blood sugar level in mg/dL")
+add_tooltip("bmi", "Body Mass Index - weight (kg) / height (m)^2")
+add_tooltip("age", "Age in years")
+add_tooltip("insulin", "2-Hour serum insulin (mu U/ml)")
+add_tooltip("skin", "Triceps skin fold thickness (mm)")
+add_tooltip("bp", "Diastolic blood pressure (mm Hg)")
+add_tooltip("dpf", "Diabetes Pedigree Function")
+add_tooltip("pregnancies", "Number of pregnancies")
+
+
+@st.fragment
+def diabetes_form():
+    count_form_run("diabetes_form")
+
+    # Inputs are sent with the submit button: editing a field reruns nothing.
+    with st.form("diabetes_inputs", border=False):
+        # Getting the input data from the user
+        st.markdown('<div class="input-group-header"><span class="group-icon">📊</span><span>Reproductive &amp; Metabolic</span></div>', unsafe_allow_html=True)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            Pregnancies = st.number_input('Number of Pregnancies', 
+                                         min_value=0, 
+                                         max_value=20, 
+                                         value=0, 
+                                         step=1,
+                                         help="Enter number of pregnancies (0-20)",
+                                         key="pregnancies")
+        with col2:
+            Glucose = st.number_input('Glucose Level (mg/dL)', 
+                                     min_value=70, 
+                                     max_value=200, 
+                                     value=120, 
+                                     step=1,
+                                     help="Normal range: 70-140 mg/dL",
+                                     key="glucose")
+        with col3:
+            BloodPressure = st.number_input('Blood Pressure (mm Hg)', 
+                                           min_value=40, 
+                                           max_value=130, 
+                                           value=80, 
+                                           step=1,
+                                           help="Normal range: 60-90 mm Hg",
+                                           key="bp")
+
+        st.markdown('<div class="input-group-header"><span class="group-icon">🧪</span><span>Lab Values</span></div>', unsafe_allow_html=True)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            SkinThickness = st.number_input('Skin Thickness (mm)', 
+                                           min_value=0, 
+                                           max_value=100, 
+                                           value=20, 
+                                           step=1,
+                                           help="Normal range: 10-50 mm",
+                                           key="skin")
+        with col2:
+            Insulin = st.number_input('Insulin Level (mu U/ml)', 
+                                     min_value=0, 
+                                     max_value=850, 
+                                     value=80, 
+                                     step=1,
+                                     help="Normal range: 16-166 mu U/ml",
+                                     key="insulin")
+        with col3:
+            BMI = st.number_input('BMI value', 
+                                 min_value=10.0, 
+                                 max_value=50.0, 
+                                 value=25.0, 
+                                 step=0.1,
+                                 help="Normal range: 18.5-24.9",
+                                 key="bmi")
+
+        st.markdown('<div class="input-group-header"><span class="group-icon">👤</span><span>Demographics &amp; Family History</span></div>', unsafe_allow_html=True)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            DiabetesPedigreeFunction = st.number_input('Diabetes Pedigree Function', 
+                                                      min_value=0.0, 
+                                                      max_value=2.5, 
+                                                      value=0.5, 
+                                                      step=0.01,
+                                                      help="Diabetes hereditary score (0.0-2.5)",
+                                                      key="dpf")
+        with col2:
+            Age = st.number_input('Age (years)', 
+                                 min_value=21, 
+                                 max_value=90, 
+                                 value=35, 
+                                 step=1,
+                                 help="Enter age between 21-90 years",
+                                 key="age")
+
+        # Center the predict button
+        col1, col2, col3 = st.columns([1,2,1])
+        with col2:
+            predict_diabetes = st.form_submit_button("Predict Diabetes Risk", use_container_width=True)
+
+    # Information about the parameters
+    with st.expander("Learn about these parameters"):
+        st.markdown("""
+<section class="section-card">
+<span class="mini-tag">Ranges</span>
+<h4>Parameter normal ranges</h4>
+<ul>
+<li><strong>Glucose Level</strong>: 70-140 mg/dL (fasting)</li>
+<li><strong>Blood Pressure</strong>: 60-90 mm Hg (diastolic)</li>
+<li><strong>Skin Thickness</strong>: 10-50 mm (triceps fold)</li>
+<li><strong>Insulin</strong>: 16-166 mu U/ml (2-hour serum)</li>
+<li><strong>BMI</strong>: 18.5-24.9 (normal weight)</li>
+<li><strong>Diabetes Pedigree Function</strong>: Scores likelihood of diabetes based on family history</li>
+</ul>
+<p><em>Note: Values outside normal ranges may indicate higher risk for diabetes.</em></p>
+</section>
+        """, unsafe_allow_html=True)
+    
+    # code for Prediction
+    diab_diagnosis = ''
+    
+    # creating a button for Prediction
+    if predict_diabetes:
+        
+        try:
+            with st.spinner("Analyzing your health parameters..."):
+                # Get input values
+                pregnancies = float(Pregnancies)
+                glucose = float(Glucose)
+                blood_pressure = float(BloodPressure)
+                skin_thickness = float(SkinThickness)
+                insulin = float(Insulin)
+                bmi = float(BMI)
+                dpf = float(DiabetesPedigreeFunction)
+                age = float(Age)
+                
+                # Create input data for prediction
+                diab_diagnosis = ''
+                input_data = np.array([[pregnancies, glucose, blood_pressure, skin_thickness, insulin, bmi, dpf, age]])
+                
+                # Get prediction and probability
+                prediction, prediction_proba = predict_with_proba(diabetes_model, input_data[0])
+                
+                # Process prediction result
+                if prediction[0] == 1:
+                    diab_diagnosis = 'The person is diabetic'
+                    is_positive = True
+                    risk_level = "High Risk"
+                else:
+                    diab_diagnosis = 'The person is not diabetic'
+                    is_positive = False
+                    risk_level = "Low Risk"
+                
+                # Show main prediction result
+                show_result_popup(diab_diagnosis, calculate_confidence(prediction_proba), is_positive)
+                
+                # Create three columns for metrics
+                col1, col2, col3 = st.columns([1,2,1])
+                
+                with col2:
+                    st.markdown(f"""
+<div class="prediction-result {'positive' if is_positive else 'negative'}">
+<h3>Prediction Result</h3>
+<p class="diagnosis">{diab_diagnosis}</p>
+<div class="risk-level {risk_level.lower().replace(' ', '-')}">
+<span class="risk-label">Risk Level:</span>
+<span class="risk-value">{risk_level}</span>
+</div>
+<div class="confidence">
+<span class="confidence-label">Confidence:</span>
+<span class="confidence-value">{calculate_confidence(prediction_proba):.1f}%</span>
+</div>
+</div>
+                    """, unsafe_allow_html=True)
+                
+                # Create tabs for analysis and metrics
+                analysis_tab, metrics_tab, what_if_tab = st.tabs(["Analysis", "Health Metrics", "What-if"])
+                
+                with analysis_tab:
+                    # Per-patient feature contributions (explanations.py)
+                    st.subheader("Feature Importance")
+                    show_feature_attributions(diabetes_model, "diabetes", input_data[0])
+                    
+                    # Nearest reference patients (similar_patients.py)
+                    st.subheader("Similar Patients")
+                    show_similar_patients(diabetes_model, "diabetes", input_data[0])
+                    
+                    # Show prediction probability
+                    st.plotly_chart(plot_prediction_proba(prediction_proba[0]))
+                
+                with metrics_tab:
+                    # Define metrics values and ranges
+                    metrics_values = [glucose, blood_pressure, bmi]
+                    metrics_labels = ['Glucose Level', 'Blood Pressure', 'BMI']
+                    metrics_ranges = [(70, 140), (60, 90), (18.5, 24.9)]
+                    
+                    # Show health metrics
+                    st.plotly_chart(create_metrics_chart(metrics_values, metrics_labels, metrics_ranges))
+                    
+                    # Add distribution plot for glucose levels (population_stats.py)
+                    st.subheader("Glucose Level Distribution")
+                    population = get_population_stats()
+                    glucose_edges, glucose_counts = population.histogram("diabetes", "Glucose", "0")
+                    _, diabetic_glucose_counts = population.histogram("diabetes", "Glucose", "1")
+                    st.plotly_chart(create_distribution_plot(
+                        glucose_edges,
+                        [("No diabetes", glucose_counts), ("Diabetes", diabetic_glucose_counts)],
+                        "Glucose Level Distribution",
+                        normal_range=(70, 140),
+                        marker=glucose
+                    ))
+                    glucose_percentile = population.percentile("diabetes", "Glucose", glucose)
+                    if glucose_percentile is not None:
+                        st.caption(
+                            f"Your glucose level is higher than {glucose_percentile:.0f}% of the "
+                            f"{population.count('diabetes', 'Glucose')} people in the bundled dataset."
+                        )
+                    
+                    # Add comparison chart
+                    st.subheader("Your Values vs Population Average")
+                    user_values = [glucose, blood_pressure, bmi]
+                    population_means = population.means("diabetes", ["Glucose", "BloodPressure", "BMI"])
+                    labels = ['Glucose', 'Blood Pressure', 'BMI']
+                    st.plotly_chart(create_comparison_chart(user_values, population_means, labels))
+                    
+                    # Add explanatory text
+                    st.markdown("""
+<section class="section-card" style="margin-top: 20px;">
+<span class="mini-tag">Interpretation</span>
+<h4>Understanding your metrics</h4>
+                        
+<p><strong>Glucose Level</strong>:</p>
+<ul>
+<li>Normal: 70-140 mg/dL</li>
+<li>Prediabetes: 140-199 mg/dL</li>
+<li>Diabetes: 200+ mg/dL</li>
+</ul>
+                        
+<p><strong>Blood Pressure</strong>:</p>
+<ul>
+<li>Normal: Below 80 mmHg (diastolic)</li>
+<li>Elevated: 80-89 mmHg</li>
+<li>High: 90+ mmHg</li>
+</ul>
+                        
+<p><strong>BMI (Body Mass Index)</strong>:</p>
+<ul>
+<li>Underweight: Below 18.5</li>
+<li>Normal: 18.5-24.9</li>
+<li>Overweight: 25-29.9</li>
+<li>Obese: 30+</li>
+</ul>
+</section>
+                    """, unsafe_allow_html=True)
+                
+                with what_if_tab:
+                    # Risk response to the key inputs (inference.what_if_curves)
+                    show_what_if(diabetes_model, "diabetes", input_data[0])
+                
+                if diab_diagnosis:
+                    save_prediction(
+                        st.session_state['user']['id'],
+                        "Diabetes",
+                        input_data.tolist()[0],
+                        diab_diagnosis,
+                        calculate_confidence(prediction_proba),
+                        is_positive=is_positive,
+                        probability=positive_probability(diabetes_model, prediction_proba)
+                    )
+                    finish_prediction_reruns("diabetes_form")
+        except Exception as e:
+            st.error(f"An error occurred: {e}")
+            st.info("Please ensure all fields contain valid numeric values.")
+
+diabetes_form()
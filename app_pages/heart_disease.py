@@ -0,0 +1,285 @@
+"""Heart disease prediction page."""
+import streamlit as st
+
+from auth import save_prediction
+from charts import plot_prediction_proba, create_metrics_chart
+from inference import predict_with_proba
+from model_loaders import load_heart_disease_model, require_model
+from ui_components import (
+    calculate_confidence, count_form_run, finish_prediction_reruns, positive_probability, render_page_hero,
+    show_feature_attributions, show_help_button, show_similar_patients, show_what_if
+)
+
+heart_disease_model = require_model(load_heart_disease_model)
+
+# Show help button
+show_help_button()
+
+render_page_hero(
+    "Heart Disease Prediction",
+    "Assess cardiovascular risk using vitals, lipid profile, and symptom-linked parameters.",
+    "Prediction Module"
+)
+
+# Add information about heart parameters
+with st.expander("Understanding Heart Health Parameters"):
+    st.markdown("""
+        ### Normal Ranges for Heart Health Parameters:
+        - **Age**: Adult patients (29-77 years)
+        - **Blood Pressure**: 90/60-120/80 mmHg (Normal)
+        - **Cholesterol**: < 200 mg/dL (Desirable)
+        - **Heart Rate**: 60-100 beats per minute (Rest)
+        - **Blood Sugar**: < 140 mg/dL (Fasting)
+        """)
+
+
+@st.fragment
+def heart_disease_form():
+    count_form_run("heart_disease_form")
+
+    # Inputs are sent with the submit button: editing a field reruns nothing.
+    with st.form("heart_disease_inputs", border=False):
+        st.markdown('<div class="input-group-header"><span class="group-icon">👤</span><span>Demographics</span></div>', unsafe_allow_html=True)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            age = st.number_input('Age', 
+                                min_value=29, 
+                                max_value=77, 
+                                value=45,
+                                help="Patient's age in years (29-77)")
+        with col2:
+            sex = st.selectbox('Sex',
+                              options=['Male', 'Female'],
+                              help="Patient's biological sex")
+            sex = 1 if sex == 'Male' else 0
+        with col3:
+            cp = st.selectbox('Chest Pain Type',
+                             options=['Typical Angina', 
+                                     'Atypical Angina', 
+                                     'Non-anginal Pain', 
+                                     'Asymptomatic'],
+                             help="""
+                             - Typical Angina: Chest pain related to heart
+                             - Atypical Angina: Chest pain not related to heart
+                             - Non-anginal Pain: Pain not related to angina
+                             - Asymptomatic: No pain
+                             """)
+            cp = ['Typical Angina', 'Atypical Angina', 
+                  'Non-anginal Pain', 'Asymptomatic'].index(cp)
+
+        st.markdown('<div class="input-group-header"><span class="group-icon">❤️</span><span>Cardiovascular Vitals</span></div>', unsafe_allow_html=True)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            trestbps = st.number_input('Resting Blood Pressure (mmHg)', 
+                                      min_value=90, 
+                                      max_value=200, 
+                                      value=120,
+                                      help="Normal: 90-120 mmHg")
+        with col2:
+            chol = st.number_input('Cholesterol (mg/dl)', 
+                                  min_value=126, 
+                                  max_value=564, 
+                                  value=200,
+                                  help="""
+                                  Cholesterol levels:
+                                  - Normal: < 200 mg/dL
+                                  - Borderline: 200-239 mg/dL
+                                  - High: >= 240 mg/dL
+                                  """)
+        with col3:
+            fbs = st.selectbox('Fasting Blood Sugar > 120 mg/dl',
+                              options=['No', 'Yes'],
+                              help="Fasting blood sugar > 120 mg/dl")
+            fbs = 1 if fbs == 'Yes' else 0
+
+        st.markdown('<div class="input-group-header"><span class="group-icon">🧪</span><span>Lab Results</span></div>', unsafe_allow_html=True)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            restecg = st.selectbox('Resting ECG Results',
+                                  options=['Normal',
+                                          'ST-T Wave Abnormality',
+                                          'Left Ventricular Hypertrophy'],
+                                  help="""
+                                  - Normal: No abnormalities
+                                  - ST-T Wave Abnormality: ST-T wave changes
+                                  - Left Ventricular Hypertrophy: Showing probable or definite left ventricular hypertrophy
+                                  """)
+            restecg = ['Normal', 
+                       'ST-T Wave Abnormality',
+                       'Left Ventricular Hypertrophy'].index(restecg)
+        with col2:
+            thalach = st.number_input('Maximum Heart Rate',
+                                     min_value=71,
+                                     max_value=202,
+                                     value=150,
+                                     help="Maximum heart rate achieved (71-202)")
+        with col3:
+            exang = st.selectbox('Exercise Induced Angina',
+                                options=['No', 'Yes'],
+                                help="Angina induced by exercise")
+            exang = 1 if exang == 'Yes' else 0
+
+        st.markdown('<div class="input-group-header"><span class="group-icon">📈</span><span>Exercise &amp; Stress Test</span></div>', unsafe_allow_html=True)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            oldpeak = st.number_input('ST Depression',
+                                     min_value=0.0,
+                                     max_value=6.2,
+                                     value=0.0,
+                                     step=0.1,
+                                     format="%.1f",
+                                     help="ST depression induced by exercise relative to rest")
+        with col2:
+            slope = st.selectbox('Slope of Peak ST Segment',
+                                options=['Upsloping', 'Flat', 'Downsloping'],
+                                help="""
+                                The slope of the peak exercise ST segment:
+                                - Upsloping: Better prognosis
+                                - Flat: Moderate prognosis
+                                - Downsloping: Poor prognosis
+                                """)
+            slope = ['Upsloping', 'Flat', 'Downsloping'].index(slope)
+        with col3:
+            ca = st.number_input('Number of Major Vessels',
+                                min_value=0,
+                                max_value=3,
+                                value=0,
+                                help="Number of major vessels colored by fluoroscopy (0-3)")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            thal = st.selectbox('Thalassemia',
+                               options=['Normal', 'Fixed Defect', 'Reversible Defect'],
+                               help="""
+                               Blood disorder called thalassemia:
+                               - Normal: Normal blood flow
+                               - Fixed Defect: No blood flow in some part
+                               - Reversible Defect: A blood flow is observed but it is not normal
+                               """)
+            thal = ['Normal', 'Fixed Defect', 'Reversible Defect'].index(thal) + 1
+
+
+        # Create a styled container for the predict button
+        col1, col2, col3 = st.columns([1,2,1])
+        with col2:
+            predict_heart = st.form_submit_button("Predict Heart Disease Risk", use_container_width=True)
+     
+    # code for Prediction
+    if predict_heart:
+        try:
+            with st.spinner("Analyzing heart health parameters..."):
+                # Make prediction
+                heart_input_data = [age, sex, cp, trestbps, chol, fbs, restecg,
+                                    thalach, exang, oldpeak, slope, ca, thal]
+                heart_prediction, prediction_proba = predict_with_proba(heart_disease_model, heart_input_data)
+                
+                # Calculate risk metrics
+                risk_factors = 0
+                risk_messages = []
+                
+                if age > 55:
+                    risk_factors += 1
+                    risk_messages.append("Age above 55")
+                if trestbps > 140:
+                    risk_factors += 1
+                    risk_messages.append("High blood pressure")
+                if chol > 200:
+                    risk_factors += 1
+                    risk_messages.append("High cholesterol")
+                if fbs == 1:
+                    risk_factors += 1
+                    risk_messages.append("High blood sugar")
+                if thalach > 170:
+                    risk_factors += 1
+                    risk_messages.append("High maximum heart rate")
+                
+                # Show prediction result
+                if heart_prediction[0] == 1:
+                    st.error("High risk of heart disease detected")
+                    risk_level = "High Risk"
+                else:
+                    st.success("Low risk of heart disease")
+                    risk_level = "Low Risk"
+                
+                # Create three columns for metrics
+                col1, col2, col3 = st.columns([1,2,1])
+                
+                with col2:
+                    st.markdown(f"""
+<section class="section-card">
+<span class="mini-tag">Result</span>
+<h3 style="text-align: center;">Heart health analysis</h3>
+<p style="text-align: center; font-size: 1.2rem;">Risk level: {risk_level}</p>
+<p style="text-align: center;">Confidence: {calculate_confidence(prediction_proba):.1f}%</p>
+</section>
+                    """, unsafe_allow_html=True)
+                
+                # Create tabs for different visualizations
+                analysis_tab, metrics_tab, what_if_tab = st.tabs(["Analysis", "Health Metrics", "What-if"])
+                
+                with analysis_tab:
+                    # Show risk factors
+                    if risk_messages:
+                        st.warning("Risk Factors Identified:")
+                        for msg in risk_messages:
+                            st.write(f"- {msg}")
+                    else:
+                        st.info("No major risk factors identified")
+                    
+                    # Per-patient feature contributions (explanations.py)
+                    show_feature_attributions(heart_disease_model, "heart", heart_input_data)
+                    
+                    # Nearest reference patients (similar_patients.py)
+                    st.subheader("Similar Patients")
+                    show_similar_patients(heart_disease_model, "heart", heart_input_data)
+                    
+                    # Show prediction probability
+                    st.plotly_chart(plot_prediction_proba(prediction_proba))
+                
+                with metrics_tab:
+                    # Show health metrics comparison
+                    metrics_values = [trestbps, chol, thalach]
+                    metrics_labels = ['Blood Pressure', 'Cholesterol', 'Max Heart Rate']
+                    metrics_ranges = [(90, 120), (150, 200), (60, 100)]
+                    st.plotly_chart(create_metrics_chart(metrics_values, metrics_labels, metrics_ranges))
+                    
+                    # Add recommendations based on prediction
+                    st.markdown("### Personalized Recommendations")
+                    if heart_prediction[0] == 1:
+                        st.warning("""
+                        Based on your heart health analysis:
+                        1. Consult a cardiologist for detailed evaluation
+                        2. Monitor blood pressure and cholesterol regularly
+                        3. Consider lifestyle modifications
+                        4. Follow up with regular check-ups
+                        """)
+                    else:
+                        st.info("""
+                        To maintain heart health:
+                        1. Continue regular exercise
+                        2. Maintain a heart-healthy diet
+                        3. Regular health check-ups
+                        4. Manage stress levels
+                        """)
+                
+                with what_if_tab:
+                    # Risk response to the key inputs (inference.what_if_curves)
+                    show_what_if(heart_disease_model, "heart", heart_input_data)
+                
+                if heart_prediction is not None:
+                    result = "The person has heart disease" if heart_prediction[0] == 1 else "The person does not have heart disease"
+                    save_prediction(
+                        st.session_state['user']['id'],
+                        "Heart Disease",
+                        heart_input_data,
+                        result,
+                        calculate_confidence(prediction_proba),
+                        is_positive=heart_prediction[0] == 1,
+                        probability=positive_probability(heart_disease_model, prediction_proba)
+                    )
+                    finish_prediction_reruns("heart_disease_form")
+        
+        except Exception as e:
+            st.error(f"An error occurred: {e}")
+            st.info("Please ensure all fields contain valid numeric values.")
+
+heart_disease_form()
@@ -0,0 +1,226 @@
+"""Prediction history page."""
+import math
+
+import pandas as pd
+import streamlit as st
+
+from auth import count_user_predictions, get_prediction_summary, get_user_predictions_page
+from charts import plot_prediction_distribution
+from history_export import available_formats, export_predictions
+from ui_components import render_page_hero
+
+HISTORY_PAGE_SIZES = [10, 25, 50, 100]
+
+
+def history_entries_html(page_df):
+    """Render one page of saved predictions as a single HTML block."""
+    is_positive = page_df["is_positive"].fillna(0).astype(bool)
+    status_class = is_positive.map({True: "positive", False: "negative"})
+    tone_class = is_positive.map({True: "alert", False: "safe"})
+    signal_text = is_positive.map({True: "Positive signal", False: "No positive signal"})
+    confidence = pd.to_numeric(page_df["confidence"], errors="coerce")
+    confidence_text = confidence.map("{:.1f}%".format).where(confidence.notna(), "N/A")
+    stamp = pd.to_datetime(page_df["created_at"], errors="coerce").dt.strftime("%Y-%m-%d %H:%M").fillna("Unavailable")
+
+    entries = (
+        '<article class="history-entry ' + status_class + '">'
+        '<div class="history-head"><div>'
+        '<span class="mini-tag">' + page_df["prediction_type"].fillna("Unknown") + '</span>'
+        '<h3>' + page_df["result"].fillna("No result recorded") + '</h3>'
+        '</div><span class="history-stamp">' + stamp + '</span></div>'
+        '<p class="history-summary">Saved account-linked prediction record from the selected screening workflow.</p>'
+        '<div class="history-meta">'
+        '<span class="history-pill ' + tone_class + '">' + signal_text + '</span>'
+        '<span class="history-pill">Confidence ' + confidence_text + '</span>'
+        '</div></article>'
+    )
+    return "".join(entries)
+
+
+@st.fragment
+def history_list(module_options, date_min, date_max):
+    """Filtered, paginated history; filter and page changes rerun only this block."""
+    col1, col2 = st.columns(2)
+    with col1:
+        disease_filter = st.multiselect(
+            "Filter by Disease Type",
+            options=module_options,
+            default=module_options
+        )
+
+    with col2:
+        date_range = st.date_input(
+            "Date Range",
+            value=(date_min.date(), date_max.date()) if pd.notna(date_min) and pd.notna(date_max) else None
+        )
+
+    if isinstance(date_range, tuple):
+        date_start = date_range[0] if date_range else None
+        date_end = date_range[1] if len(date_range) == 2 else None
+    else:
+        date_start = date_end = date_range
+
+    user_id = st.session_state['user']['id']
+    total = count_user_predictions(user_id, disease_filter, date_start, date_end)
+    if total == 0:
+        st.info("No saved assessments match the current filters.")
+        return
+
+    col1, col2 = st.columns(2)
+    with col1:
+        page_size = st.selectbox("Entries per page", HISTORY_PAGE_SIZES, index=1, key="history_page_size")
+    page_count = math.ceil(total / page_size)
+    # Start from the first page whenever the result set changes.
+    filter_state = (tuple(disease_filter), date_start, date_end, page_size)
+    if st.session_state.get("history_filter_state") != filter_state:
+        st.session_state["history_filter_state"] = filter_state
+        st.session_state["history_page"] = 1
+    with col2:
+        page_number = st.number_input("Page", min_value=1, max_value=page_count, step=1, key="history_page")
+
+    offset = (page_number - 1) * page_size
+    page_df = get_user_predictions_page(user_id, page_size, offset, disease_filter, date_start, date_end)
+    st.caption(f"Showing {offset + 1}-{offset + len(page_df)} of {total} saved assessments (page {page_number} of {page_count}).")
+    st.markdown(history_entries_html(page_df), unsafe_allow_html=True)
+
+    with st.expander("Export filtered history"):
+        formats = available_formats()
+        export_format = st.selectbox(
+            "Format",
+            options=list(formats),
+            format_func=lambda key: formats[key].label,
+            key="history_export_format"
+        )
+        export_request = (export_format, filter_state)
+        if st.button("Prepare export", key="history_export_prepare"):
+            st.session_state["history_export"] = (
+                export_request,
+                export_predictions(user_id, export_format, disease_filter, date_start, date_end),
+            )
+        prepared = st.session_state.get("history_export")
+        if prepared and prepared[0] == export_request:
+            export_file = prepared[1]
+            try:
+                fh = open(export_file.path, "rb")
+            except FileNotFoundError:
+                # Evicted from the export cache since it was prepared.
+                del st.session_state["history_export"]
+                st.info("That export has expired. Prepare it again to download.")
+            else:
+                with fh:
+                    st.caption(f"{export_file.rows} saved assessments ready to download.")
+                    st.download_button(
+                        label=f"Download {formats[export_format].label}",
+                        data=fh,
+                        file_name=export_file.file_name,
+                        mime=export_file.mime,
+                        key="history_export_download"
+                    )
+
+
+render_page_hero(
+    "Your Prediction History",
+    "Review previous assessments, filter by disease type, and track confidence trends over time.",
+    "History"
+)
+
+summary = get_prediction_summary(st.session_state['user']['id'])
+
+if not summary['total']:
+    st.markdown("""
+<section class="section-card">
+<h3>No saved assessments yet</h3>
+<p>Run any screening module to start building an account-linked prediction history.</p>
+</section>
+        """, unsafe_allow_html=True)
+else:
+    total_count = summary['total']
+    latest_stamp = pd.to_datetime(summary['latest_at'], errors="coerce")
+    latest_text = latest_stamp.strftime("%d %b %Y") if pd.notna(latest_stamp) else "Unavailable"
+    avg_confidence = summary['avg_confidence']
+    avg_confidence_text = f"{avg_confidence:.1f}%" if avg_confidence is not None else "N/A"
+
+    st.markdown(f"""
+<section class="stat-grid" style="margin-bottom: 1rem;">
+<article class="feature-card">
+<span class="tag">Volume</span>
+<h4>{total_count}</h4>
+<p>Total predictions stored for the current account.</p>
+</article>
+<article class="feature-card">
+<span class="tag">Coverage</span>
+<h4>{len(summary['by_type'])}</h4>
+<p>Distinct screening modules represented in saved history.</p>
+</article>
+<article class="feature-card">
+<span class="tag">Confidence</span>
+<h4>{avg_confidence_text}</h4>
+<p>Average confidence across all completed assessments.</p>
+</article>
+</section>
+<section class="section-card dark">
+<h3>History overview</h3>
+<p>Latest recorded activity: {latest_text}. Use the filters below to isolate disease modules and export the current dataset when needed.</p>
+</section>
+        """, unsafe_allow_html=True)
+
+    tab1, tab2 = st.tabs(["Predictions", "Analysis"])
+
+    with tab1:
+        module_options = sorted(row['prediction_type'] for row in summary['by_type'])
+        date_min = pd.to_datetime(summary['first_at'], errors="coerce")
+        date_max = pd.to_datetime(summary['latest_at'], errors="coerce")
+        history_list(module_options, date_min, date_max)
+
+    with tab2:
+        st.subheader("Prediction Analysis")
+
+        fig_pie = plot_prediction_distribution(
+            [row['prediction_type'] for row in summary['by_type']],
+            [row['total'] for row in summary['by_type']]
+        )
+        st.plotly_chart(fig_pie, use_container_width=True)
+
+        st.subheader("Summary Statistics")
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.metric(
+                "Total Predictions",
+                total_count,
+                help="Total number of predictions made"
+            )
+
+        with col2:
+            st.metric(
+                "Average Confidence",
+                avg_confidence_text,
+                help="Average confidence across all predictions"
+            )
+
+        with col3:
+            positive_predictions = summary['positive']
+            st.metric(
+                "Positive Predictions",
+                f"{positive_predictions}",
+                f"{(positive_predictions/total_count*100):.1f}%",
+                help="Number of positive disease predictions"
+            )
+
+        st.markdown("---")
+
+        st.subheader("Disease-wise Breakdown")
+        breakdown_cards = []
+        for row in summary['by_type']:
+            disease_avg_text = f"{row['avg_confidence']:.1f}%" if row['avg_confidence'] is not None else "N/A"
+            breakdown_cards.append(
+                f"""
+<article class="doc-card">
+<span class="mini-tag">{row['prediction_type']}</span>
+<h3>{row['total']} saved assessments</h3>
+<p>{row['positive']} positive signals recorded. Average confidence: {disease_avg_text}.</p>
+</article>
+                    """
+            )
+
+        st.markdown(f"<section class='doc-grid'>{''.join(breakdown_cards)}</section>", unsafe_allow_html=True)
@@ -0,0 +1,48 @@
+"""Model input drift page (admin only)."""
+import pandas as pd
+import streamlit as st
+
+from drift_monitor import MIN_OBSERVATIONS, PSI_ALERT, PSI_WARN, start_drift_monitor
+from ui_components import OUTCOME_NAMES, render_page_hero
+
+user = st.session_state.get('user') or {}
+if user.get('role') != 'admin':
+    st.error("This page is only available to administrators.")
+    st.stop()
+
+render_page_hero(
+    "Input Drift Monitor",
+    "How the inputs submitted for prediction compare with the datasets the models were trained on.",
+    "Administration"
+)
+
+st.caption(
+    f"Population stability index (PSI) per input against the training data: below {PSI_WARN} is stable, "
+    f"{PSI_WARN}-{PSI_ALERT} is worth watching, {PSI_ALERT} and above indicates drift. Inputs with fewer than "
+    f"{MIN_OBSERVATIONS} values are not judged yet. Totals are shared by every app process using this database "
+    "and are updated about once a minute."
+)
+
+monitor = start_drift_monitor()
+if monitor is None:
+    st.warning("Drift monitoring is not running in this process; see the server log for why.")
+    st.stop()
+for disease, report in monitor.snapshots().items():
+    st.subheader(OUTCOME_NAMES[disease])
+    if not report["count"]:
+        st.info("No predictions recorded yet.")
+        continue
+    table = pd.DataFrame(report["features"]).sort_values("psi", ascending=False)
+    table[["missing", "out_of_range"]] *= 100
+    drifting = int((table["status"] == "drift").sum())
+    col1, col2 = st.columns(2)
+    col1.metric("Predictions observed", f"{report['count']:,}")
+    col2.metric("Inputs drifting", f"{drifting} of {len(table)}")
+    st.dataframe(
+        table.rename(columns={
+            "feature": "Input", "mean": "Mean", "std": "Std", "baseline_mean": "Training mean",
+            "baseline_std": "Training std", "mean_shift_sd": "Mean shift (SD)", "psi": "PSI",
+            "missing": "Missing (%)", "out_of_range": "Outside training range (%)", "status": "Status",
+        }).round(3),
+        hide_index=True,
+    )
@@ -0,0 +1,435 @@
+"""Parkinson's disease prediction page."""
+import pandas as pd
+import streamlit as st
+
+from auth import save_prediction
+from charts import plot_prediction_proba, create_metrics_chart, create_comparison_chart
+from inference import predict_with_proba
+from model_loaders import load_parkinsons_model, require_model
+from population_stats import get_population_stats
+from ui_components import (
+    calculate_confidence, count_form_run, finish_prediction_reruns, positive_probability, render_page_hero,
+    show_feature_attributions, show_help_button, show_similar_patients
+)
+from voice_features import FEATURE_NAMES, extract_features, out_of_training_range
+
+parkinsons_model = require_model(load_parkinsons_model)
+
+# Show help button
+show_help_button()
+
+render_page_hero(
+    "Parkinson's Disease Prediction",
+    "Analyze voice biomarkers and nonlinear features for early Parkinson's risk screening.",
+    "Prediction Module"
+)
+
+# Add information about voice parameters
+with st.expander("Understanding Voice Parameters"):
+    st.markdown("""
+        ### Voice Parameter Ranges:
+        - **Jitter (%)**: 0.0-1.0% (Normal < 1.0%)
+        - **Shimmer (%)**: 0.0-3.0% (Normal < 3.0%)
+        - **HNR**: 15-25 dB (Higher values indicate better voice quality)
+        - **RPDE**: 0.0-1.0 (Lower values indicate more regular voice)
+        - **DFA**: 0.5-0.8 (Measure of signal complexity)
+        - **PPE**: 0.0-0.5 (Lower values indicate more regular voice)
+        """)
+
+
+@st.fragment
+def parkinsons_form():
+    count_form_run("parkinsons_form")
+
+    # Inputs are sent with the submit button: editing a field reruns nothing.
+    with st.form("parkinsons_inputs", border=False):
+        st.markdown('<div class="input-group-header"><span class="group-icon">🎤</span><span>Voice Recording</span></div>', unsafe_allow_html=True)
+        recording = st.file_uploader(
+            "Upload a sustained vowel recording (WAV) to measure the voice parameters automatically",
+            type=["wav"],
+            help="A steady 'aaah' of a few seconds, as PCM WAV. When a recording is given, "
+                 "the values measured from it are used instead of the fields below."
+        )
+
+        st.markdown('<div class="input-group-header"><span class="group-icon">🎙️</span><span>Fundamental Frequency</span></div>', unsafe_allow_html=True)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            fo = st.number_input('MDVP:Fo(Hz) - Average vocal frequency', 
+                                min_value=80.0, 
+                                max_value=260.0, 
+                                value=120.0, 
+                                step=1.0,
+                                help="Normal range: 80-260 Hz")
+        
+        with col2:
+            fhi = st.number_input('MDVP:Fhi(Hz) - Maximum vocal frequency', 
+                                 min_value=100.0, 
+                                 max_value=500.0, 
+                                 value=200.0, 
+                                 step=1.0,
+                                 help="Normal range: 100-500 Hz")
+        
+        with col3:
+            flo = st.number_input('MDVP:Flo(Hz) - Minimum vocal frequency', 
+                                 min_value=50.0, 
+                                 max_value=200.0, 
+                                 value=70.0, 
+                                 step=1.0,
+                                 help="Normal range: 50-200 Hz")
+        
+        st.markdown('<div class="input-group-header"><span class="group-icon">〰️</span><span>Jitter (Frequency Variation)</span></div>', unsafe_allow_html=True)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            Jitter_percent = st.number_input('MDVP:Jitter(%) - Frequency variation', 
+                                            min_value=0.0, 
+                                            max_value=2.0, 
+                                            value=0.3, 
+                                            step=0.001,
+                                            format="%.3f",
+                                            help="Normal < 1.0%")
+        
+        with col2:
+            Jitter_Abs = st.number_input('MDVP:Jitter(Abs) - Absolute jitter', 
+                                        min_value=0.0, 
+                                        max_value=0.1, 
+                                        value=0.02, 
+                                        step=0.001,
+                                        format="%.3f",
+                                        help="Absolute frequency perturbation")
+        
+        with col3:
+            RAP = st.number_input('MDVP:RAP - Relative amplitude perturbation', 
+                                 min_value=0.0, 
+                                 max_value=0.1, 
+                                 value=0.02, 
+                                 step=0.001,
+                                 format="%.3f",
+                                 help="Normal < 0.05")
+        
+        with col1:
+            PPQ = st.number_input('MDVP:PPQ - Pitch perturbation quotient', 
+                                 min_value=0.0, 
+                                 max_value=0.1, 
+                                 value=0.02, 
+                                 step=0.001,
+                                 format="%.3f",
+                                 help="Five-point period perturbation quotient")
+        
+        with col2:
+            DDP = st.number_input('Jitter:DDP - Average perturbation', 
+                                 min_value=0.0, 
+                                 max_value=0.1, 
+                                 value=0.02, 
+                                 step=0.001,
+                                 format="%.3f",
+                                 help="Average absolute difference between consecutive differences")
+        
+        st.markdown('<div class="input-group-header"><span class="group-icon">📶</span><span>Shimmer (Amplitude Variation)</span></div>', unsafe_allow_html=True)
+        col1, col2, col3 = st.columns(3)
+        with col3:
+            Shimmer = st.number_input('MDVP:Shimmer - Amplitude variation', 
+                                     min_value=0.0, 
+                                     max_value=10.0, 
+                                     value=2.0, 
+                                     step=0.1,
+                                     format="%.1f",
+                                     help="Normal < 3.0%")
+        
+        with col1:
+            Shimmer_dB = st.number_input('MDVP:Shimmer(dB) - Log amplitude variation', 
+                                        min_value=0.0, 
+                                        max_value=2.0, 
+                                        value=0.3, 
+                                        step=0.01,
+                                        format="%.2f",
+                                        help="Normal < 0.4 dB")
+        
+        with col2:
+            APQ3 = st.number_input('Shimmer:APQ3 - Three-point amplitude quotient', 
+                                  min_value=0.0, 
+                                  max_value=0.1, 
+                                  value=0.02, 
+                                  step=0.001,
+                                  format="%.3f",
+                                  help="Three-point amplitude perturbation quotient")
+        
+        with col3:
+            APQ5 = st.number_input('Shimmer:APQ5 - Five-point amplitude quotient', 
+                                  min_value=0.0, 
+                                  max_value=0.1, 
+                                  value=0.02, 
+                                  step=0.001,
+                                  format="%.3f",
+                                  help="Five-point amplitude perturbation quotient")
+        
+        with col1:
+            APQ = st.number_input('MDVP:APQ - Amplitude perturbation quotient', 
+                                 min_value=0.0, 
+                                 max_value=0.1, 
+                                 value=0.02, 
+                                 step=0.001,
+                                 format="%.3f",
+                                 help="Average absolute differences between consecutive differences")
+        
+        with col2:
+            DDA = st.number_input('Shimmer:DDA - Amplitude perturbation', 
+                                 min_value=0.0, 
+                                 max_value=0.1, 
+                                 value=0.02, 
+                                 step=0.001,
+                                 format="%.3f",
+                                 help="Average absolute differences between consecutive differences")
+        
+        st.markdown('<div class="input-group-header"><span class="group-icon">🔊</span><span>Noise Ratios & Nonlinear Measures</span></div>', unsafe_allow_html=True)
+        col1, col2, col3 = st.columns(3)
+        with col3:
+            NHR = st.number_input('NHR - Noise-to-Harmonics ratio', 
+                                 min_value=0.0, 
+                                 max_value=1.0, 
+                                 value=0.1, 
+                                 step=0.01,
+                                 format="%.2f",
+                                 help="Normal < 0.19")
+        
+        with col1:
+            HNR = st.number_input('HNR - Harmonics-to-Noise ratio', 
+                                 min_value=0.0, 
+                                 max_value=40.0, 
+                                 value=20.0, 
+                                 step=0.1,
+                                 format="%.1f",
+                                 help="Normal range: 15-25 dB")
+        
+        with col2:
+            RPDE = st.number_input('RPDE - Recurrence period density entropy', 
+                                  min_value=0.0, 
+                                  max_value=1.0, 
+                                  value=0.4, 
+                                  step=0.01,
+                                  format="%.2f",
+                                  help="Measure of periodicity. Lower values indicate more regular voice.")
+        
+        with col3:
+            DFA = st.number_input('DFA - Signal fractal scaling exponent', 
+                                 min_value=0.0, 
+                                 max_value=1.0, 
+                                 value=0.6, 
+                                 step=0.01,
+                                 format="%.2f",
+                                 help="Normal range: 0.5-0.8")
+        
+        with col1:
+            spread1 = st.number_input('spread1 - Nonlinear measure of fundamental frequency variation', 
+                                     min_value=-10.0, 
+                                     max_value=10.0, 
+                                     value=0.0, 
+                                     step=0.1,
+                                     format="%.1f",
+                                     help="First nonlinear measure")
+        
+        with col2:
+            spread2 = st.number_input('spread2 - Nonlinear measure of fundamental frequency variation', 
+                                     min_value=0.0, 
+                                     max_value=10.0, 
+                                     value=2.0, 
+                                     step=0.1,
+                                     format="%.1f",
+                                     help="Second nonlinear measure")
+        
+        with col3:
+            D2 = st.number_input('D2 - Correlation dimension', 
+                                min_value=0.0, 
+                                max_value=5.0, 
+                                value=2.0, 
+                                step=0.1,
+                                format="%.1f",
+                                help="Measure of signal complexity")
+        
+        with col1:
+            PPE = st.number_input('PPE - Pitch period entropy', 
+                                 min_value=0.0, 
+                                 max_value=1.0, 
+                                 value=0.2, 
+                                 step=0.01,
+                                 format="%.2f",
+                                 help="Measure of voice irregularity. Lower values indicate more regular voice.")
+
+        # Center the predict button
+        col1, col2, col3 = st.columns([1,2,1])
+        with col2:
+            predict_parkinsons = st.form_submit_button("Predict Parkinson's Risk", use_container_width=True)
+
+    # Information about the parameters
+    with st.expander("Learn about these parameters"):
+        st.markdown("""
+        - **MDVP:Fo(Hz)**: Average vocal fundamental frequency
+        - **MDVP:Fhi(Hz)**: Maximum vocal fundamental frequency
+        - **MDVP:Flo(Hz)**: Minimum vocal fundamental frequency
+        - **MDVP:Jitter(%)**: Percentage of perturbation in vocal fundamental frequency
+        - **MDVP:Jitter(Abs)**: Absolute vocal fundamental frequency perturbation
+        - **MDVP:RAP**: Average vocal perturbation amplitude
+        - **MDVP:PPQ**: Pitch perturbation quotient
+        - **Jitter:DDP**: Absolute pitch perturbation
+        - **MDVP:Shimmer**: Average absolute difference between consecutive periods
+        - **MDVP:Shimmer(dB)**: Average absolute difference between consecutive periods in decibels
+        - **Shimmer:APQ3**: Third harmonic to second harmonic amplitude ratio
+        - **Shimmer:APQ5**: Fifth harmonic to second harmonic amplitude ratio
+        - **MDVP:APQ**: Pitch perturbation quotient
+        - **Shimmer:DDA**: Absolute difference between consecutive periods
+        - **NHR**: Noise-to-Harmonics ratio
+        - **HNR**: Harmonic-to-Noise ratio
+        - **RPDE**: Recurrence period density
+        - **DFA**: Fundamental frequency variation
+        - **spread1**: Average absolute difference between consecutive periods
+        - **spread2**: Average absolute difference between consecutive periods
+        - **D2**: Second derivative of amplitude envelope
+        - **PPE**: Pitch period perturbation quotient
+        """)
+    
+    # creating a button for Prediction    
+    if predict_parkinsons:
+        
+        try:
+            with st.spinner("Analyzing voice parameters..."):
+                # Make prediction with all 22 features in the correct order
+                input_values = [fo, fhi, flo, Jitter_percent, Jitter_Abs, RAP, PPQ, DDP,
+                              Shimmer, Shimmer_dB, APQ3, APQ5, APQ, DDA, NHR, HNR,
+                              RPDE, DFA, spread1, spread2, D2, PPE]
+                outside = []
+                
+                if recording is not None:
+                    # Measured from the recording (voice_features.py), in the same order
+                    try:
+                        input_values = extract_features(recording)
+                    except ValueError as e:
+                        st.error(f"Could not analyze the recording: {e}")
+                        return
+                    Jitter_percent, Shimmer, HNR, DFA = (input_values[i] for i in (3, 8, 15, 17))
+                    # Checked before predicting: the model cannot be trusted outside its training data.
+                    outside = out_of_training_range(input_values)
+                    flagged = {name for name, *_ in outside}
+                    with st.expander("Voice parameters measured from the recording"):
+                        st.dataframe(
+                            pd.DataFrame({
+                                "Parameter": FEATURE_NAMES,
+                                "Value": input_values,
+                                "In training range": [name not in flagged for name in FEATURE_NAMES],
+                            }),
+                            hide_index=True
+                        )
+                
+                parkinsons_prediction, prediction_proba = predict_with_proba(parkinsons_model, input_values)
+                
+                # Calculate metrics
+                metrics_values = [Jitter_percent, Shimmer, HNR, DFA]
+                metrics_labels = ['Jitter', 'Shimmer', 'HNR', 'DFA']
+                metrics_ranges = [(0, 0.01), (0, 0.1), (15, 25), (0.5, 0.8)]
+                
+                # Show prediction result
+                if parkinsons_prediction[0] == 1:
+                    st.error("Indicators of Parkinson's disease detected")
+                    risk_level = "High Risk"
+                else:
+                    st.success("No significant indicators detected")
+                    risk_level = "Low Risk"
+                
+                if outside:
+                    st.warning(
+                        "Measured from audio, outside the training range: "
+                        + "; ".join(f"{name} = {value:.4g} (trained on {low:.4g} to {high:.4g})"
+                                    for name, value, low, high in outside)
+                        + ". The model has not seen values like these, so this result is not reliable."
+                    )
+                elif recording is not None:
+                    st.info("Measured from audio. The measures approximate the clinical software behind the "
+                            "training data, so treat this result as indicative only.")
+                
+                # Create three columns for metrics
+                col1, col2, col3 = st.columns([1,2,1])
+                
+                with col2:
+                    st.markdown(f"""
+<section class="section-card">
+<span class="mini-tag">Result</span>
+<h3 style="text-align: center;">Voice analysis results</h3>
+<p style="text-align: center; font-size: 1.2rem;">Risk level: {risk_level}</p>
+<p style="text-align: center;">Confidence: {calculate_confidence(prediction_proba):.1f}%</p>
+</section>
+                    """, unsafe_allow_html=True)
+                
+                # Create tabs for different visualizations
+                analysis_tab, metrics_tab = st.tabs(["Analysis", "Voice Metrics"])
+                
+                with analysis_tab:
+                    # Per-patient feature contributions (explanations.py)
+                    show_feature_attributions(parkinsons_model, "parkinsons", input_values)
+                    
+                    # Nearest reference patients (similar_patients.py)
+                    st.subheader("Similar Patients")
+                    show_similar_patients(parkinsons_model, "parkinsons", input_values)
+                    
+                    # Show prediction probability
+                    st.plotly_chart(plot_prediction_proba(prediction_proba))
+                
+                with metrics_tab:
+                    # Show voice metrics
+                    st.plotly_chart(create_metrics_chart(metrics_values, metrics_labels, metrics_ranges))
+                    
+                    # Add voice parameters comparison
+                    st.subheader("Voice Parameters Comparison")
+                    voice_values = [Jitter_percent, Shimmer, HNR]
+                    voice_means = get_population_stats().means("parkinsons", ["MDVP:Jitter(%)", "MDVP:Shimmer", "HNR"])
+                    voice_labels = ['Jitter', 'Shimmer', 'HNR']
+                    st.plotly_chart(create_comparison_chart(voice_values, voice_means, voice_labels))
+                    
+                    # Add explanatory text
+                    st.markdown("""
+<section class="section-card">
+<span class="mini-tag">Interpretation</span>
+<h4>Understanding voice metrics</h4>
+<ul>
+<li><strong>Jitter</strong>: Variation in fundamental frequency (normal range: 0-0.01)</li>
+<li><strong>Shimmer</strong>: Variation in amplitude (normal range: 0-0.1)</li>
+<li><strong>HNR</strong>: Harmonics-to-noise ratio (normal range: 15-25)</li>
+<li><strong>DFA</strong>: Detrended fluctuation analysis (normal range: 0.5-0.8)</li>
+</ul>
+</section>
+                    """)
+                
+                    # Add recommendations based on prediction
+                    st.markdown("### Personalized Recommendations")
+                    if parkinsons_prediction[0] == 1:
+                        st.warning("""
+                        Based on your voice analysis:
+                        1. Consult a neurologist for comprehensive evaluation
+                        2. Consider speech therapy assessment
+                        3. Monitor changes in voice and movement patterns
+                        4. Explore early intervention options
+                        """)
+                    else:
+                        st.info("""
+                        To maintain neurological health:
+                        1. Continue regular health check-ups
+                        2. Stay physically and mentally active
+                        3. Monitor any changes in movement or speech
+                        4. Maintain a healthy lifestyle
+                        """)
+                
+                if parkinsons_prediction is not None:
+                    result = "The person has Parkinson's disease" if parkinsons_prediction[0] == 1 else "The person does not have Parkinson's disease"
+                    save_prediction(
+                        st.session_state['user']['id'],
+                        "Parkinson's Disease",
+                        input_values,
+                        result,
+                        calculate_confidence(prediction_proba),
+                        is_positive=parkinsons_prediction[0] == 1,
+                        probability=positive_probability(parkinsons_model, prediction_proba)
+                    )
+                    finish_prediction_reruns("parkinsons_form")
+        
+        except Exception as e:
+            st.error(f"An error occurred: {e}")
+            st.info("Please ensure all fields contain valid numeric values.")
+
+parkinsons_form()
@@ -0,0 +1,123 @@
+"""Project requirements page."""
+import os
+
+import streamlit as st
+
+from ui_components import render_doc_grid, render_feature_grid, render_page_hero
+
+render_page_hero(
+    "Project Requirements",
+    "Dependencies, setup steps, and environment prerequisites for running the application locally.",
+    "Setup"
+)
+
+# requirements.txt sits at the repository root, one level above app_pages/.
+requirements_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "requirements.txt")
+try:
+    with open(requirements_path, "r", encoding="utf-8") as req_file:
+        requirements_content = req_file.read().strip()
+except OSError:
+    requirements_content = ""
+
+requirement_lines = [
+    line.strip() for line in requirements_content.splitlines()
+    if line.strip() and not line.strip().startswith("#")
+]
+
+render_feature_grid([
+    {
+        "tag": "Python",
+        "title": "Runtime target",
+        "body": "Python 3.8 or higher is required. A current Python 3.11 environment is the recommended baseline for local development."
+    },
+    {
+        "tag": "Launch",
+        "title": "Root app entry point",
+        "body": "The active Streamlit app starts from multiplediseaseprediction.py and should be launched from the project root virtual environment."
+    },
+    {
+        "tag": "Browser",
+        "title": "Desktop-first testing",
+        "body": "Current layout is optimized for modern Chrome, Edge, and Firefox with responsive stacking for narrower widths."
+    }
+])
+
+dependency_cards = []
+for line in requirement_lines:
+    package_name = line.split("==")[0].split(">=")[0].strip()
+    dependency_cards.append({
+        "title": line,
+        "body": f"{package_name} is part of the current root environment definition for the Streamlit application."
+    })
+
+if dependency_cards:
+    if len(dependency_cards) <= 6:
+        render_doc_grid(dependency_cards)
+    else:
+        first_six = []
+        for i in range(6):
+            first_six.append(dependency_cards[i])
+        render_doc_grid(first_six)
+        rest = []
+        for i in range(6, len(dependency_cards)):
+            rest.append(dependency_cards[i])
+        render_doc_grid(rest)
+
+setup_col, support_col = st.columns([1.2, 1], gap="large")
+with setup_col:
+    st.markdown("""
+<section class="section-card dark">
+<span class="mini-tag">Setup flow</span>
+<h3>Recommended local run sequence</h3>
+<div class="code-card"><code>python -m venv .venv</code></div>
+<div class="code-card" style="margin-top: 0.7rem;"><code>.venv\\Scripts\\python.exe -m pip install -r requirements.txt</code></div>
+<div class="code-card" style="margin-top: 0.7rem;"><code>.venv\\Scripts\\python.exe -m streamlit run multiplediseaseprediction.py</code></div>
+</section>
+        """, unsafe_allow_html=True)
+
+with support_col:
+    st.markdown("""
+<section class="section-card">
+<span class="mini-tag">System baseline</span>
+<h3>Minimum operating assumptions</h3>
+<p>Supported environments include Windows 10 or later, recent macOS versions, and modern Linux distributions.</p>
+<p>A practical baseline is 4 GB RAM, roughly 1 GB of free disk space, and a modern browser with JavaScript enabled.</p>
+</section>
+        """, unsafe_allow_html=True)
+
+render_doc_grid([
+    {
+        "title": "Tools",
+        "body": "Git for source control, pip for dependency resolution, and the standard library venv module for isolated environments."
+    },
+    {
+        "title": "Model compatibility",
+        "body": "The bundled models were trained against scikit-learn 1.6.1, so that version should stay aligned with the runtime environment."
+    },
+    {
+        "title": "Port management",
+        "body": "If port 8501 is already occupied, run the Streamlit command with --server.port 8502 or another free port."
+    }
+])
+
+with st.expander("Troubleshooting common issues"):
+    st.markdown("""
+        1. `ModuleNotFoundError` after install usually means the app is running outside the intended virtual environment.
+        2. Scikit-learn version warnings indicate the local environment does not match the version used when the models were serialized.
+        3. If Streamlit reports a busy port, rerun with `--server.port 8502`.
+        4. If a page looks stale after edits, refresh the browser or restart the Streamlit process.
+        5. If dependencies drift, recreate `.venv` and reinstall from `requirements.txt`.
+        """)
+
+st.markdown("""
+<div class="feedback-note">
+<strong>Download:</strong> Use the button below to export the current root <code>requirements.txt</code> file directly from this workspace.
+</div>
+    """, unsafe_allow_html=True)
+
+st.download_button(
+    label="Download current requirements.txt",
+    data=requirements_content or "requirements.txt is not available.",
+    file_name="requirements.txt",
+    mime="text/plain"
+)
@@ -0,0 +1,149 @@
+"""Welcome page: workspace overview and recent activity."""
+import pandas as pd
+import streamlit as st
+
+from auth import get_prediction_summary, get_user_predictions_page
+from ui_components import render_page_hero, show_help_button, styled_header
+
+show_help_button()
+
+render_page_hero(
+    "Welcome to Health AI Studio",
+    "A unified workspace for disease-risk screening, confidence tracking, and medical insight exploration.",
+    "Overview"
+)
+
+summary = get_prediction_summary(st.session_state['user']['id'])
+total_predictions = summary['total']
+diseases_covered = len(summary['by_type'])
+average_confidence = summary['avg_confidence'] or 0.0
+if not total_predictions:
+    latest_activity = "No predictions yet"
+else:
+    latest_timestamp = pd.to_datetime(summary['latest_at'], errors="coerce")
+    latest_activity = latest_timestamp.strftime("%d %b %Y") if pd.notna(latest_timestamp) else "Unavailable"
+
+lead_col, stats_col = st.columns([2.15, 1], gap="large")
+with lead_col:
+    st.markdown("""
+<section class="home-panel">
+<h3>What You Can Do Here</h3>
+<p>
+                Run guided predictions for diabetes, heart disease, and Parkinson's disease.
+                Every result includes confidence scoring and visual interpretation to support early awareness.
+</p>
+<ul class="home-list">
+<li>Use validated input ranges for each clinical parameter.</li>
+<li>Review confidence and analytics before interpreting results.</li>
+<li>Track all runs in History and compare trends over time.</li>
+</ul>
+</section>
+        """, unsafe_allow_html=True)
+
+with stats_col:
+    st.markdown(f"""
+<section class="home-panel home-panel-soft">
+<h3>Workspace Snapshot</h3>
+<div class="home-kpi">
+<span class="label">Total Predictions</span>
+<span class="value">{total_predictions}</span>
+</div>
+<div class="home-kpi">
+<span class="label">Modules Used</span>
+<span class="value">{diseases_covered}</span>
+</div>
+<div class="home-kpi">
+<span class="label">Average Confidence</span>
+<span class="value">{average_confidence:.1f}%</span>
+</div>
+<div class="home-kpi">
+<span class="label">Latest Activity</span>
+<span class="value" style="font-size:1rem;">{latest_activity}</span>
+</div>
+</section>
+        """, unsafe_allow_html=True)
+
+styled_header("Choose Your Screening Path", level=2)
+mod_col1, mod_col2, mod_col3 = st.columns(3, gap="large")
+
+with mod_col1:
+    st.markdown("""
+<article class="path-card">
+<span class="tag">Module 01</span>
+<h4>🩸 Diabetes Risk</h4>
+<p>Eight metabolic indicators including glucose, BMI, insulin, and family-risk score.</p>
+</article>
+        """, unsafe_allow_html=True)
+
+with mod_col2:
+    st.markdown("""
+<article class="path-card">
+<span class="tag">Module 02</span>
+<h4>❤️ Heart Disease Risk</h4>
+<p>Thirteen cardiovascular markers including ECG profile, cholesterol, and exertion response.</p>
+</article>
+        """, unsafe_allow_html=True)
+
+with mod_col3:
+    st.markdown("""
+<article class="path-card">
+<span class="tag">Module 03</span>
+<h4>🧠 Parkinson's Risk</h4>
+<p>Twenty-two voice biomarkers analyzing shimmer, jitter, entropy, and nonlinear signal traits.</p>
+</article>
+        """, unsafe_allow_html=True)
+
+st.markdown("""
+<section class="home-panel">
+<h3>Quick Start Workflow</h3>
+<div class="workflow-row">
+<div class="workflow-step">
+<span class="num">1. Select Module</span>
+<p>Open a prediction module from the sidebar.</p>
+</div>
+<div class="workflow-step">
+<span class="num">2. Enter Inputs</span>
+<p>Fill all required values using guided fields.</p>
+</div>
+<div class="workflow-step">
+<span class="num">3. Run Prediction</span>
+<p>Generate model output with confidence.</p>
+</div>
+<div class="workflow-step">
+<span class="num">4. Review History</span>
+<p>Track outcomes and export as CSV when needed.</p>
+</div>
+</div>
+</section>
+    """, unsafe_allow_html=True)
+
+styled_header("Recent Activity", level=2)
+if not total_predictions:
+    st.info("No predictions yet. Start with any module from the sidebar.")
+else:
+    recent_df = get_user_predictions_page(st.session_state['user']['id'], 6)
+    recent_df["created_at"] = pd.to_datetime(recent_df["created_at"], errors="coerce")
+    recent_df["confidence"] = pd.to_numeric(recent_df["confidence"], errors="coerce")
+    recent_df["created_at"] = recent_df["created_at"].dt.strftime("%Y-%m-%d %H:%M")
+    recent_df["confidence"] = recent_df["confidence"].apply(
+        lambda value: f"{value:.1f}%" if pd.notna(value) else "N/A"
+    )
+    recent_df = recent_df.rename(
+        columns={
+            "created_at": "Date",
+            "prediction_type": "Disease",
+            "result": "Prediction Result",
+            "confidence": "Confidence"
+        }
+    )
+    st.dataframe(
+        recent_df[["Date", "Disease", "Prediction Result", "Confidence"]],
+        use_container_width=True,
+        hide_index=True
+    )
+
+st.markdown("""
+<div class="disclaimer-note">
+<strong>Medical disclaimer:</strong> Predictions are informational and should not replace professional diagnosis or treatment decisions.
+</div>
+    """, unsafe_allow_html=True)
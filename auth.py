@@ -1,664 +1,379 @@
 ﻿import streamlit as st
 import sqlite3
-import hashlib
-import pandas as pd
-import time
+import os
+import threading
+from collections import OrderedDict
 
-# Initialize database tables on import
-def init_database():
-    """Initialize database tables"""
-    create_user_table()
-    create_prediction_table()
-    create_admin_user()
-
-# Database functions
-def create_user_table():
-    """Create users table if it doesn't exist"""
-    conn = sqlite3.connect('users.db')
-    c = conn.cursor()
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS users(
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT UNIQUE NOT NULL,
-            password TEXT NOT NULL,
-            email TEXT DEFAULT '',
-            role TEXT DEFAULT 'user',
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    c.execute("PRAGMA table_info(users)")
-    existing_columns = {row[1] for row in c.fetchall()}
-    if 'email' not in existing_columns:
-        c.execute("ALTER TABLE users ADD COLUMN email TEXT DEFAULT ''")
-    if 'role' not in existing_columns:
-        c.execute("ALTER TABLE users ADD COLUMN role TEXT DEFAULT 'user'")
-    if 'created_at' not in existing_columns:
-        c.execute("ALTER TABLE users ADD COLUMN created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP")
-    conn.commit()
-    conn.close()
-
-def create_prediction_table():
-    """Create predictions table if it doesn't exist"""
-    conn = sqlite3.connect('users.db')
-    c = conn.cursor()
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS predictions(
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER,
-            prediction_type TEXT NOT NULL,
-            input_data TEXT NOT NULL,
-            result TEXT NOT NULL,
-            confidence REAL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (user_id) REFERENCES users (id)
-        )
-    ''')
-    conn.commit()
-    conn.close()
-
-def _get_prediction_schema(conn):
-    """Return available predictions table columns and compatible field mapping."""
-    c = conn.cursor()
-    c.execute("PRAGMA table_info(predictions)")
-    columns = {row[1] for row in c.fetchall()}
-
-    type_col = 'prediction_type' if 'prediction_type' in columns else (
-        'disease_type' if 'disease_type' in columns else None
-    )
-    result_col = 'result' if 'result' in columns else (
-        'prediction_result' if 'prediction_result' in columns else None
-    )
-    input_col = 'input_data' if 'input_data' in columns else None
-    confidence_col = 'confidence' if 'confidence' in columns else None
-    created_at_col = 'created_at' if 'created_at' in columns else None
-
-    return {
-        'columns': columns,
-        'type_col': type_col,
-        'result_col': result_col,
-        'input_col': input_col,
-        'confidence_col': confidence_col,
-        'created_at_col': created_at_col,
-    }
+from db_migrations import classify_result, ensure_schema
+from password_hashing import burn_verification, hash_password_pooled, submit, verify_password
+from session_store import SESSION_COOKIE, get_session_store
+from theme_assets import apply_stylesheet
 
-def _get_user_schema(conn):
-    """Return available users table columns."""
-    c = conn.cursor()
-    c.execute("PRAGMA table_info(users)")
-    columns = {row[1] for row in c.fetchall()}
-    return {'columns': columns}
+def init_database():
+    """Bring users.db to the current schema (once per process, see db_migrations)"""
+    ensure_schema()
 
 def hash_password(password):
-    """Hash password using SHA-256"""
-    return hashlib.sha256(password.encode()).hexdigest()
-
-def create_admin_user():
-    """Create default admin user if not exists"""
-    create_user_table()
-    conn = sqlite3.connect('users.db')
-    c = conn.cursor()
-    
-    # Check if admin exists
-    c.execute("SELECT * FROM users WHERE username = 'admin'")
-    if not c.fetchone():
-        # Create admin user
-        user_schema = _get_user_schema(conn)
-        admin_password = hash_password('admin123')
-        insert_columns = ['username', 'password']
-        insert_values = ['admin', admin_password]
-
-        if 'email' in user_schema['columns']:
-            insert_columns.append('email')
-            insert_values.append('admin@local')
-
-        if 'role' in user_schema['columns']:
-            insert_columns.append('role')
-            insert_values.append('admin')
-
-        placeholders = ", ".join(["?"] * len(insert_values))
-        columns_sql = ", ".join(insert_columns)
-        c.execute(f"INSERT INTO users ({columns_sql}) VALUES ({placeholders})", insert_values)
-        conn.commit()
-    
-    conn.close()
+    """Hash password with a salted KDF (see password_hashing)"""
+    return hash_password_pooled(password)
 
 def authenticate_user(username, password):
-    """Authenticate user login"""
-    create_user_table()
-    create_admin_user()
-    
+    """Authenticate user login
+
+    Legacy SHA-256 hashes, and hashes made with older cost factors, are
+    replaced with a fresh hash once the password has been verified.
+    """
     conn = sqlite3.connect('users.db')
     conn.row_factory = sqlite3.Row
     c = conn.cursor()
     
-    hashed_password = hash_password(password)
-    c.execute("SELECT * FROM users WHERE username = ? AND password = ?", 
-             (username, hashed_password))
+    c.execute("SELECT id, username, password, role FROM users WHERE username = ?", (username,))
     user = c.fetchone()
+    if not user:
+        conn.close()
+        burn_verification(password)
+        return None
+
+    ok, rehash = verify_password(password, user['password'])
+    if not ok:
+        conn.close()
+        return None
+
+    if rehash:
+        c.execute("UPDATE users SET password = ? WHERE id = ? AND password = ?",
+                  (hash_password(password), user['id'], user['password']))
+        conn.commit()
     conn.close()
-    
-    if user:
-        return {
-            'id': user['id'],
-            'username': user['username'],
-            'role': user['role'] if 'role' in user.keys() else 'user'
-        }
-    return None
+
+    return {
+        'id': user['id'],
+        'username': user['username'],
+        'role': user['role'] or 'user'
+    }
 
 def register_user(username, password, role='user', email=None):
     """Register a new user"""
-    create_user_table()
-    
+    if email is None and isinstance(role, str) and "@" in role:
+        email = role
+        role = 'user'
+
+    normalized_email = (email or "").strip() or f"{username}@local"
+    hashed_password = hash_password(password)
+
     conn = sqlite3.connect('users.db')
-    c = conn.cursor()
-    
     try:
-        if email is None and isinstance(role, str) and "@" in role:
-            email = role
-            role = 'user'
-
-        hashed_password = hash_password(password)
-        user_schema = _get_user_schema(conn)
-
-        insert_columns = ['username', 'password']
-        insert_values = [username, hashed_password]
-
-        if 'email' in user_schema['columns']:
-            normalized_email = (email or "").strip()
-            if not normalized_email:
-                normalized_email = f"{username}@local"
-            insert_columns.append('email')
-            insert_values.append(normalized_email)
-
-        if 'role' in user_schema['columns']:
-            insert_columns.append('role')
-            insert_values.append(role)
-
-        placeholders = ", ".join(["?"] * len(insert_values))
-        columns_sql = ", ".join(insert_columns)
-        c.execute(f"INSERT INTO users ({columns_sql}) VALUES ({placeholders})", insert_values)
+        conn.execute(
+            "INSERT INTO users (username, password, email, role) VALUES (?, ?, ?, ?)",
+            (username, hashed_password, normalized_email, role)
+        )
         conn.commit()
-        conn.close()
         return True
     except sqlite3.IntegrityError:
-        conn.close()
         return False
-
-def save_prediction(user_id, prediction_type, input_data, result, confidence):
-    """Save prediction to database"""
-    create_prediction_table()
-    
-    conn = sqlite3.connect('users.db')
-    c = conn.cursor()
-
-    schema = _get_prediction_schema(conn)
-    type_col = schema['type_col']
-    result_col = schema['result_col']
-
-    if not type_col or not result_col:
+    finally:
         conn.close()
-        return
 
-    insert_columns = ['user_id', type_col]
-    insert_values = [user_id, prediction_type]
+def save_prediction(user_id, prediction_type, input_data, result, confidence, is_positive=None, probability=None):
+    """Save prediction to database
 
-    if schema['input_col']:
-        insert_columns.append(schema['input_col'])
-        insert_values.append(str(input_data))
-
-    insert_columns.append(result_col)
-    insert_values.append(result)
-
-    if schema['confidence_col']:
-        insert_columns.append(schema['confidence_col'])
-        insert_values.append(confidence)
+    is_positive is the model's positive-class decision and probability its
+    positive-class probability (0-1); when omitted they are derived from the
+    result text and confidence.
+    """
+    if is_positive is None:
+        is_positive = classify_result(result)
+    if probability is None and confidence is not None:
+        probability = confidence / 100.0 if is_positive else 1 - confidence / 100.0
 
-    placeholders = ", ".join(["?"] * len(insert_values))
-    columns_sql = ", ".join(insert_columns)
-    c.execute(f"INSERT INTO predictions ({columns_sql}) VALUES ({placeholders})", insert_values)
+    conn = sqlite3.connect('users.db')
+    conn.execute(
+        """
+        INSERT INTO predictions (user_id, prediction_type, input_data, result, confidence, is_positive, probability)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            user_id,
+            prediction_type,
+            str(input_data),
+            result,
+            confidence,
+            int(bool(is_positive)),
+            None if probability is None else float(probability),
+        )
+    )
     conn.commit()
     conn.close()
 
+HISTORY_COLUMNS = ['prediction_type', 'result', 'confidence', 'is_positive', 'probability', 'created_at']
+_HISTORY_SELECT = ", ".join(HISTORY_COLUMNS)
+
 def get_user_predictions(user_id):
     """Get user's prediction history"""
-    create_prediction_table()
-    
-    conn = sqlite3.connect('users.db')
-    schema = _get_prediction_schema(conn)
-
-    if not schema['type_col'] or not schema['result_col']:
-        conn.close()
-        return pd.DataFrame(columns=['prediction_type', 'result', 'confidence', 'created_at'])
-
-    confidence_select = f"{schema['confidence_col']} AS confidence" if schema['confidence_col'] else "NULL AS confidence"
-    created_at_select = f"{schema['created_at_col']} AS created_at" if schema['created_at_col'] else "NULL AS created_at"
-    order_clause = "ORDER BY created_at DESC" if schema['created_at_col'] else ""
+    import pandas as pd  # deferred: the login page never needs it
 
+    conn = sqlite3.connect('users.db')
     query = f"""
-        SELECT
-            {schema['type_col']} AS prediction_type,
-            {schema['result_col']} AS result,
-            {confidence_select},
-            {created_at_select}
+        SELECT {_HISTORY_SELECT}
         FROM predictions
         WHERE user_id = ?
-        {order_clause}
+        ORDER BY created_at DESC, id DESC
     """
     df = pd.read_sql_query(query, conn, params=(user_id,))
     conn.close()
     return df
 
-def logout():
-    """Logout user"""
-    for key in ['logged_in', 'user', 'show_registration']:
-        if key in st.session_state:
-            del st.session_state[key]
-    st.rerun()
+def _prediction_filter_clause(user_id, prediction_types=None, date_start=None, date_end=None):
+    """WHERE clause and parameters for a filtered history query.
 
-# Modern login and registration UI
-def login_page():
-    """Render authentication page with sign-in and self-registration."""
-    init_database()
-
-    if 'logged_in' not in st.session_state:
-        st.session_state['logged_in'] = False
-    if 'user' not in st.session_state:
-        st.session_state['user'] = None
-    if 'auth_view' not in st.session_state:
-        st.session_state['auth_view'] = "Sign in"
-
-    st.markdown("""
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=Plus+Jakarta+Sans:wght@600;700;800&display=swap');
-        @import url('https://fonts.googleapis.com/css2?family=Source+Sans+3:wght@400;500;600;700&display=swap');
-
-        :root {
-            --auth-ink: #0f172a;
-            --auth-muted: #5f6c7b;
-            --auth-line: rgba(148, 163, 184, 0.22);
-            --auth-soft: rgba(255, 255, 255, 0.84);
-            --auth-accent: #0f766e;
-            --auth-accent-2: #2563eb;
-            --auth-deep: #0d2438;
-            --auth-deep-2: #16344d;
-        }
-
-        html, body, [class*="css"] {
-            font-family: 'Source Sans 3', 'Segoe UI', sans-serif;
-        }
-
-        [data-testid="stSidebar"], [data-testid="collapsedControl"] {
-            display: none !important;
-        }
-
-        [data-testid="stHeader"] {
-            background: transparent !important;
-        }
-
-        .stApp {
-            background:
-                radial-gradient(circle at 8% 12%, rgba(15, 118, 110, 0.14), transparent 24%),
-                radial-gradient(circle at 92% 10%, rgba(37, 99, 235, 0.14), transparent 22%),
-                linear-gradient(145deg, #eff7f5 0%, #f8fbff 52%, #eef3fb 100%);
-        }
-
-        .main .block-container {
-            max-width: 1180px;
-            padding: 1.45rem 1.15rem 1.4rem;
-        }
-
-        .auth-kicker {
-            display: inline-flex;
-            align-items: center;
-            gap: 0.45rem;
-            padding: 0.45rem 0.82rem;
-            border-radius: 999px;
-            background: var(--auth-soft);
-            border: 1px solid var(--auth-line);
-            color: var(--auth-accent);
-            font-size: 0.78rem;
-            font-weight: 700;
-            letter-spacing: 0.08em;
-            text-transform: uppercase;
-        }
-
-        .auth-kicker::before {
-            content: "";
-            width: 0.48rem;
-            height: 0.48rem;
-            border-radius: 999px;
-            background: linear-gradient(135deg, var(--auth-accent), #14b8a6);
-            box-shadow: 0 0 0 5px rgba(20, 184, 166, 0.12);
-        }
-
-        .auth-stage {
-            margin-bottom: 1rem;
-        }
-
-        .auth-title {
-            margin: 0.9rem 0 0.3rem;
-            color: var(--auth-ink);
-            font-family: 'Plus Jakarta Sans', 'Segoe UI', sans-serif;
-            font-size: clamp(1.15rem, 2vw, 1.5rem);
-            font-weight: 700;
-            letter-spacing: -0.03em;
-        }
-
-        .auth-subtitle {
-            max-width: 640px;
-            margin: 0;
-            color: var(--auth-muted);
-            font-size: 1rem;
-            line-height: 1.65;
-        }
-
-        .auth-hero {
-            position: relative;
-            overflow: hidden;
-            min-height: 100%;
-            padding: 2rem;
-            border-radius: 32px;
-            background:
-                radial-gradient(circle at top left, rgba(94, 234, 212, 0.18), transparent 24%),
-                linear-gradient(160deg, var(--auth-deep) 0%, var(--auth-deep-2) 55%, #091a2b 100%);
-            color: #f8fbff;
-            box-shadow: 0 30px 70px rgba(15, 23, 42, 0.18);
-        }
-
-        .auth-hero::after {
-            content: "";
-            position: absolute;
-            right: -70px;
-            bottom: -90px;
-            width: 220px;
-            height: 220px;
-            border-radius: 999px;
-            background: radial-gradient(circle, rgba(59, 130, 246, 0.28), transparent 68%);
-        }
-
-        .auth-hero-badge {
-            display: inline-flex;
-            align-items: center;
-            padding: 0.4rem 0.8rem;
-            border-radius: 999px;
-            background: rgba(255, 255, 255, 0.12);
-            border: 1px solid rgba(255, 255, 255, 0.14);
-            color: #d7f6ee;
-            font-size: 0.78rem;
-            font-weight: 700;
-            letter-spacing: 0.08em;
-            text-transform: uppercase;
-        }
-
-        .auth-hero h2,
-        .auth-card h3 {
-            margin: 0;
-            font-family: 'Plus Jakarta Sans', 'Segoe UI', sans-serif;
-            letter-spacing: -0.04em;
-        }
-
-        .auth-hero h2 {
-            margin-top: 1rem;
-            color: #ffffff !important;
-            font-size: clamp(2rem, 3.3vw, 3.2rem);
-            line-height: 1.02;
-            max-width: 630px;
-        }
-
-        .auth-hero-copy {
-            margin: 1rem 0 0;
-            max-width: 620px;
-            color: rgba(239, 246, 255, 0.82) !important;
-            font-size: 1.02rem;
-            line-height: 1.72;
-        }
-
-        .auth-module-grid {
-            display: grid;
-            grid-template-columns: repeat(3, minmax(0, 1fr));
-            gap: 0.9rem;
-            margin: 1.6rem 0 1.2rem;
-        }
-
-        .auth-module-card {
-            padding: 1rem;
-            border-radius: 20px;
-            background: rgba(255, 255, 255, 0.08);
-            border: 1px solid rgba(255, 255, 255, 0.12);
-            backdrop-filter: blur(12px);
-        }
-
-        .auth-module-card strong {
-            display: block;
-            color: #b8e5ff !important;
-            font-size: 0.76rem;
-            font-weight: 700;
-            letter-spacing: 0.08em;
-            text-transform: uppercase;
-        }
-
-        .auth-module-card span {
-            display: block;
-            margin-top: 0.5rem;
-            color: #ffffff !important;
-            font-family: 'Plus Jakarta Sans', 'Segoe UI', sans-serif;
-            font-size: 1.15rem;
-            font-weight: 700;
-        }
-
-        .auth-module-card p {
-            margin: 0.45rem 0 0 !important;
-            color: rgba(239, 246, 255, 0.74) !important;
-            font-size: 0.92rem !important;
-            line-height: 1.5 !important;
-        }
-
-        .auth-trust {
-            display: grid;
-            gap: 0.75rem;
-        }
+    prediction_types=None means every type; dates are inclusive calendar days.
+    """
+    from datetime import timedelta
+
+    clauses = ["user_id = ?"]
+    params = [user_id]
+    if prediction_types is not None:
+        placeholders = ", ".join(["?"] * len(prediction_types))
+        clauses.append(f"prediction_type IN ({placeholders})" if prediction_types else "0")
+        params.extend(prediction_types)
+    # created_at is stored as 'YYYY-MM-DD HH:MM:SS', so ISO strings compare in order.
+    if date_start:
+        clauses.append("created_at >= ?")
+        params.append(date_start.isoformat())
+    if date_end:
+        clauses.append("created_at < ?")
+        params.append((date_end + timedelta(days=1)).isoformat())
+    return " AND ".join(clauses), params
+
+def count_user_predictions(user_id, prediction_types=None, date_start=None, date_end=None):
+    """Number of saved predictions matching the history filters"""
+    where_sql, params = _prediction_filter_clause(user_id, prediction_types, date_start, date_end)
+    conn = sqlite3.connect('users.db')
+    count = conn.execute(f"SELECT COUNT(*) FROM predictions WHERE {where_sql}", params).fetchone()[0]
+    conn.close()
+    return count
 
-        .auth-trust-item {
-            padding: 0.95rem 1rem;
-            border-radius: 18px;
-            background: rgba(9, 26, 43, 0.26);
-            border: 1px solid rgba(255, 255, 255, 0.08);
-            color: rgba(239, 246, 255, 0.86) !important;
-            font-size: 0.98rem;
-            line-height: 1.55;
-        }
+def get_user_predictions_page(user_id, limit, offset=0, prediction_types=None, date_start=None, date_end=None):
+    """One newest-first page of the user's filtered prediction history"""
+    import pandas as pd  # deferred: the login page never needs it
 
-        .auth-note {
-            margin-top: 1.25rem;
-            padding: 1rem 1.05rem;
-            border-radius: 18px;
-            background: rgba(245, 158, 11, 0.10);
-            border: 1px solid rgba(245, 158, 11, 0.22);
-            color: #ffe5b3 !important;
-            font-size: 0.95rem;
-            line-height: 1.58;
-        }
+    where_sql, params = _prediction_filter_clause(user_id, prediction_types, date_start, date_end)
+    query = f"""
+        SELECT {_HISTORY_SELECT}
+        FROM predictions
+        WHERE {where_sql}
+        ORDER BY created_at DESC, id DESC
+        LIMIT ? OFFSET ?
+    """
+    conn = sqlite3.connect('users.db')
+    df = pd.read_sql_query(query, conn, params=[*params, int(limit), int(offset)])
+    conn.close()
+    return df
 
-        .auth-card {
-            margin-bottom: 1rem;
-            padding: 1.25rem 1.2rem;
-            border-radius: 28px;
-            background: rgba(255, 255, 255, 0.92);
-            border: 1px solid var(--auth-line);
-            box-shadow: 0 24px 64px rgba(15, 23, 42, 0.10);
-        }
+# Dashboard aggregates per (database, user), reused until the user saves a
+# new prediction and their latest row id moves.
+SUMMARY_CACHE_SIZE = 256
+_summary_cache = OrderedDict()
+_summary_cache_lock = threading.Lock()
 
-        .auth-card-badge {
-            display: inline-flex;
-            align-items: center;
-            padding: 0.36rem 0.72rem;
-            border-radius: 999px;
-            background: #f3fbf8;
-            border: 1px solid rgba(15, 118, 110, 0.16);
-            color: var(--auth-accent);
-            font-size: 0.76rem;
-            font-weight: 700;
-            letter-spacing: 0.08em;
-            text-transform: uppercase;
-        }
+def _latest_prediction_id(conn, user_id):
+    row = conn.execute(
+        "SELECT id FROM predictions WHERE user_id = ? ORDER BY id DESC LIMIT 1", (user_id,)
+    ).fetchone()
+    return row[0] if row else 0
 
-        .auth-card h3 {
-            margin-top: 0.95rem;
-            color: var(--auth-ink) !important;
-            font-size: 2rem;
-            line-height: 1.05;
-        }
+def _compute_prediction_summary(conn, user_id):
+    rows = conn.execute("""
+        SELECT
+            prediction_type,
+            COUNT(*),
+            COALESCE(SUM(is_positive), 0),
+            COUNT(confidence),
+            SUM(confidence),
+            MIN(created_at),
+            MAX(created_at)
+        FROM predictions
+        WHERE user_id = ?
+        GROUP BY prediction_type
+        ORDER BY COUNT(*) DESC
+    """, (user_id,)).fetchall()
+
+    by_type = [
+        {
+            'prediction_type': prediction_type,
+            'total': total,
+            'positive': positive_count,
+            'avg_confidence': confidence_sum / confidence_count if confidence_count else None,
+        }
+        for prediction_type, total, positive_count, confidence_count, confidence_sum, _, _ in rows
+    ]
+    confidence_count = sum(row[3] for row in rows)
+    first_times = [row[5] for row in rows if row[5] is not None]
+    latest_times = [row[6] for row in rows if row[6] is not None]
+    return {
+        'total': sum(row[1] for row in rows),
+        'positive': sum(row[2] for row in rows),
+        'avg_confidence': sum(row[4] or 0 for row in rows) / confidence_count if confidence_count else None,
+        'first_at': min(first_times) if first_times else None,
+        'latest_at': max(latest_times) if latest_times else None,
+        'by_type': by_type,
+    }
 
-        .auth-card p {
-            margin: 0.6rem 0 0 !important;
-            color: var(--auth-muted) !important;
-            font-size: 1rem !important;
-            line-height: 1.6 !important;
-        }
+def get_prediction_summary(user_id):
+    """Dashboard aggregates for a user's prediction history
 
-        div[data-baseweb="radio"] > div {
-            margin-bottom: 1rem;
-            padding: 0.34rem;
-            border-radius: 999px;
-            border: 1px solid var(--auth-line);
-            background: rgba(255, 255, 255, 0.86);
-            box-shadow: 0 12px 28px rgba(15, 23, 42, 0.05);
-        }
+    Returns total, positive, avg_confidence, first_at and latest_at over all
+    predictions plus a by_type list of per-module total/positive/avg_confidence
+    rows, largest first. Results are cached until the user's latest
+    prediction id changes.
+    """
+    empty = {'total': 0, 'positive': 0, 'avg_confidence': None, 'first_at': None, 'latest_at': None, 'by_type': []}
+    conn = sqlite3.connect('users.db')
+    try:
+        key = (os.path.abspath('users.db'), user_id)
+        latest_id = _latest_prediction_id(conn, user_id)
+        with _summary_cache_lock:
+            cached = _summary_cache.get(key)
+            if cached is not None and cached[0] == latest_id:
+                _summary_cache.move_to_end(key)
+                return cached[1]
+
+        summary = _compute_prediction_summary(conn, user_id) if latest_id else empty
+    finally:
+        conn.close()
 
-        .stRadio label {
-            border-radius: 999px !important;
-            color: #244052 !important;
-            font-weight: 700 !important;
-        }
+    with _summary_cache_lock:
+        _summary_cache[key] = (latest_id, summary)
+        _summary_cache.move_to_end(key)
+        while len(_summary_cache) > SUMMARY_CACHE_SIZE:
+            _summary_cache.popitem(last=False)
+    return summary
 
-        [data-testid="stForm"] {
-            padding: 1.45rem 1.25rem 1.2rem;
-            border-radius: 28px;
-            border: 1px solid rgba(148, 163, 184, 0.20);
-            background: rgba(255, 255, 255, 0.95);
-            box-shadow: 0 28px 72px rgba(15, 23, 42, 0.12);
-        }
+# Session tokens never go in the URL: they live in an HttpOnly cookie that
+# proxy.py sets, since Streamlit can read cookies but not set them. Links
+# from older versions carried the token in this query parameter; such tokens
+# are treated as leaked, revoked and stripped.
+LEGACY_SESSION_QUERY_PARAM = "session"
 
-        .stTextInput label p,
-        .stCheckbox label p {
-            color: #415162 !important;
-            font-size: 0.78rem !important;
-            font-weight: 700 !important;
-            letter-spacing: 0.09em;
-            text-transform: uppercase;
-        }
+def _session_cookie_request(path, body=""):
+    """POST `body` to a proxy.py session endpoint from the browser
 
-        .stTextInput > div > div > input {
-            min-height: 3.15rem;
-            border: 1px solid #d6e1ea !important;
-            border-radius: 18px !important;
-            padding: 0.82rem 1rem !important;
-            background: #fbfcfe !important;
-            color: #102033 !important;
-            font-size: 1rem !important;
-        }
+    Runs in a same-origin component iframe, so the response's Set-Cookie
+    applies to the app's origin; the code or token is never in a URL.
+    """
+    import json
+    import streamlit.components.v1 as components
 
-        .stTextInput > div > div > input::placeholder {
-            color: #91a0b0 !important;
-        }
+    components.html(
+        f"<script>fetch(window.parent.location.origin + {json.dumps(path)}, "
+        f"{{method: 'POST', body: {json.dumps(body)}, credentials: 'same-origin'}});</script>",
+        height=0,
+    )
 
-        .stTextInput > div > div > input:focus {
-            border-color: rgba(15, 118, 110, 0.75) !important;
-            box-shadow: 0 0 0 4px rgba(15, 118, 110, 0.10) !important;
-            background: #ffffff !important;
-        }
+def start_session(user, remember=False):
+    """Issue a server-side session token for a freshly authenticated user
 
-        .auth-inline {
-            margin-top: 0.25rem;
-            padding: 0.9rem 1rem;
-            border-radius: 18px;
-            background: linear-gradient(135deg, #f3faf8 0%, #eef4ff 100%);
-            border: 1px solid rgba(15, 118, 110, 0.12);
-            color: #21504b;
-            font-size: 0.94rem;
-            line-height: 1.55;
-        }
+    The token stays server-side in st.session_state; the browser gets it as
+    an HttpOnly cookie through a single-use handoff code (restore_session
+    sends it on the next run).
+    """
+    store = get_session_store()
+    token = store.create(user, remember=remember)
+    st.session_state['session_token'] = token
+    st.session_state['session_handoff'] = store.create_handoff(token, persistent=remember)
+
+def _strip_legacy_token():
+    token = st.query_params.get(LEGACY_SESSION_QUERY_PARAM)
+    if token:
+        get_session_store().revoke(token)
+    if LEGACY_SESSION_QUERY_PARAM in st.query_params:
+        del st.query_params[LEGACY_SESSION_QUERY_PARAM]
+
+def restore_session():
+    """Sign the browser back in from its session cookie, if it has a valid one
+
+    Called on every script run. A logged-in run only sends a pending cookie
+    handoff; a logged-out run validates the cookie's token (a TTL-cache hit
+    after the first check on this instance) instead of asking for the
+    password again.
+    """
+    _strip_legacy_token()
+    if st.session_state.get('logged_in'):
+        code = st.session_state.pop('session_handoff', None)
+        if code:
+            _session_cookie_request("/_auth/session", code)
+        return True
 
-        .auth-demo {
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-            gap: 0.8rem;
-            margin: 0.9rem 0 0.15rem;
-            padding: 0.9rem 1rem;
-            border-radius: 18px;
-            background: rgba(15, 118, 110, 0.05);
-            border: 1px solid rgba(15, 118, 110, 0.12);
-        }
+    if st.session_state.pop('clear_session_cookie', False):
+        _session_cookie_request("/_auth/logout")
+        return False
+    # Cookies are read once per browser connection, so a rejected token is
+    # seen again on every run until the page reloads.
+    token = st.context.cookies.get(SESSION_COOKIE)
+    if not token or token == st.session_state.get('rejected_session_cookie'):
+        return False
+    user = get_session_store().validate(token)
+    if user is None:
+        st.session_state['rejected_session_cookie'] = token
+        _session_cookie_request("/_auth/logout")
+        return False
+    st.session_state['user'] = user
+    st.session_state['logged_in'] = True
+    st.session_state['session_token'] = token
+    return True
 
-        .auth-demo strong {
-            color: var(--auth-ink) !important;
-            font-size: 0.92rem;
-            font-weight: 700;
-        }
+def logout():
+    """Logout user"""
+    token = st.session_state.get('session_token')
+    if token:
+        get_session_store().revoke(token)
+    for key in ['logged_in', 'user', 'show_registration', 'session_token', 'session_handoff']:
+        if key in st.session_state:
+            del st.session_state[key]
+    # The next run clears the cookie (st.rerun() ends this one first).
+    st.session_state['clear_session_cookie'] = True
+    st.session_state['rejected_session_cookie'] = token
+    st.rerun()
 
-        .auth-demo-code {
-            display: inline-flex;
-            align-items: center;
-            padding: 0.34rem 0.65rem;
-            border-radius: 999px;
-            background: #ffffff;
-            border: 1px solid rgba(15, 23, 42, 0.08);
-            color: var(--auth-accent) !important;
-            font-family: 'Plus Jakarta Sans', 'Segoe UI', sans-serif;
-            font-size: 0.86rem;
-            font-weight: 700;
-        }
+# Sign-in and registration run on the password KDF pool; the page polls
+# them at this interval instead of blocking the script thread on the KDF.
+AUTH_POLL_SECONDS = 0.25
 
-        .stFormSubmitButton > button,
-        .stButton > button {
-            min-height: 3.15rem !important;
-            border: none !important;
-            border-radius: 18px !important;
-            background: linear-gradient(135deg, #0f766e 0%, #2563eb 100%) !important;
-            color: #ffffff !important;
-            font-size: 1rem !important;
-            font-weight: 700 !important;
-            box-shadow: 0 18px 36px rgba(37, 99, 235, 0.18) !important;
-        }
+@st.fragment(run_every=AUTH_POLL_SECONDS)
+def _auth_job_progress(key, message):
+    """Show `message` until the job in st.session_state[key] is done, then rerun with its result
 
-        [data-testid="stAlert"] {
-            border-radius: 18px;
-            border: 1px solid rgba(148, 163, 184, 0.18);
-            background: rgba(255, 255, 255, 0.96);
-        }
+    The result is left in st.session_state[key + '_result'].
+    """
+    job = st.session_state.get(key)
+    if job is None:
+        return
+    if not job.done():
+        st.caption(message)
+        return
+    st.session_state[key + '_result'] = job.result()
+    del st.session_state[key]
+    st.rerun()
 
-        [data-testid="stCaptionContainer"] p {
-            color: #677483 !important;
-            font-size: 0.93rem !important;
-            line-height: 1.55 !important;
-        }
+# Modern login and registration UI
+def login_page():
+    """Render authentication page with sign-in and self-registration."""
+    if 'logged_in' not in st.session_state:
+        st.session_state['logged_in'] = False
+    if 'user' not in st.session_state:
+        st.session_state['user'] = None
+    if 'auth_view' not in st.session_state:
+        st.session_state['auth_view'] = "Sign in"
 
-        @media (max-width: 980px) {
-            .auth-module-grid {
-                grid-template-columns: 1fr;
-            }
-        }
+    # A finished registration resets the form before its widgets are created.
+    registered = st.session_state.pop('register_job_result', None)
+    if registered:
+        st.session_state["auth_view"] = "Sign in"
+        st.session_state["register_username_input"] = ""
+        st.session_state["register_email_input"] = ""
+        st.session_state["register_password_input"] = ""
+        st.session_state["register_confirm_password_input"] = ""
 
-        @media (max-width: 640px) {
-            .main .block-container {
-                padding-left: 0.8rem;
-                padding-right: 0.8rem;
-            }
-
-            .auth-hero,
-            .auth-card,
-            [data-testid="stForm"] {
-                border-radius: 24px;
-            }
-
-            .auth-demo {
-                flex-direction: column;
-                align-items: flex-start;
-            }
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    apply_stylesheet("login")
 
     st.markdown("""
     <section class="auth-stage">
@@ -766,16 +481,22 @@ Move from guided screening inputs to saved results without losing session contin
                 if not cleaned_username or not password:
                     st.warning("Please enter both username and password.")
                 else:
-                    user = authenticate_user(cleaned_username, password)
-                    if user:
-                        st.session_state['user'] = user
-                        st.session_state['logged_in'] = True
-                        st.session_state['remember_me'] = bool(remember_me)
-                        st.success("Login successful. Redirecting...")
-                        time.sleep(0.6)
-                        st.rerun()
-                    else:
-                        st.error("Invalid username or password.")
+                    st.session_state['remember_me'] = bool(remember_me)
+                    st.session_state['login_job'] = submit(authenticate_user, cleaned_username, password)
+
+            if 'login_job' in st.session_state:
+                _auth_job_progress('login_job', "Signing in...")
+            elif 'login_job_result' in st.session_state:
+                user = st.session_state.pop('login_job_result')
+                if user:
+                    st.session_state['user'] = user
+                    st.session_state['logged_in'] = True
+                    start_session(user, remember=st.session_state.get('remember_me', False))
+                    st.rerun()
+                else:
+                    st.error("Invalid username or password.")
+            elif registered:
+                st.success("Account created successfully. Sign in to continue.")
         else:
             st.markdown("""
             <div class="auth-card">
@@ -834,17 +555,14 @@ Move from guided screening inputs to saved results without losing session contin
                         st.warning("Please enter a valid email address.")
                         return
 
-                    registered = register_user(cleaned_username, new_password, email=cleaned_email)
-                    if registered:
-                        st.success("Account created successfully. Switch to Sign in and continue.")
-                        st.session_state["auth_view"] = "Sign in"
-                        st.session_state["register_username_input"] = ""
-                        st.session_state["register_email_input"] = ""
-                        st.session_state["register_password_input"] = ""
-                        st.session_state["register_confirm_password_input"] = ""
-                        st.rerun()
-                    else:
-                        st.error("This username already exists. Please choose another one.")
+                    st.session_state['register_job'] = submit(
+                        register_user, cleaned_username, new_password, 'user', cleaned_email
+                    )
+
+            if 'register_job' in st.session_state:
+                _auth_job_progress('register_job', "Creating account...")
+            elif registered is False:
+                st.error("This username already exists. Please choose another one.")
 
 # Registration page (placeholder)
 def registration_page():
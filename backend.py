@@ -1,21 +1,42 @@
-from fastapi import FastAPI
-import pickle
+from fastapi import Body, FastAPI
+from fastapi.responses import JSONResponse
 import os
 import numpy as np
+from drift_monitor import start_drift_monitor
+from inference import PREDICTION_CACHE
+from screening import screen
+from warmup import api_loaders, start_warmup
 
 app = FastAPI()
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
-# Load models on startup
-diabetes_model = pickle.load(open(os.path.join(BASE_DIR, 'diabetes_model.sav'), 'rb'))
-heart_disease_model = pickle.load(open(os.path.join(BASE_DIR, 'heart_disease_model.sav'), 'rb'))
-parkinsons_model = pickle.load(open(os.path.join(BASE_DIR, 'parkinsons_model.sav'), 'rb'))
+# Load and warm the models (shared, versioned bundles from inference.py) on a
+# background thread at startup; /ready turns 200 once they are warm.
+WARMUP = start_warmup(api_loaders(BASE_DIR))
+WARMUP_WAIT_SECONDS = float(os.getenv("WARMUP_WAIT_SECONDS", "30"))
+
+# Inputs of every prediction feed the streaming drift statistics in users.db.
+DRIFT = start_drift_monitor()
 
 @app.get("/")
 def home():
     return {"status": "ok", "message": "Multiple Disease Prediction Backend"}
 
+@app.get("/ready")
+def ready():
+    return JSONResponse(WARMUP.snapshot(), status_code=200 if WARMUP.ready else 503)
+
+@app.get("/metrics/inference-cache")
+def inference_cache_metrics():
+    return PREDICTION_CACHE.stats()
+
+@app.get("/metrics/drift")
+def drift_metrics():
+    if DRIFT is None:
+        return JSONResponse({"error": "Drift monitoring is not running"}, status_code=503)
+    return DRIFT.snapshots()
+
 @app.get("/predict/diabetes")
 def predict_diabetes():
     return {"status": "ok", "model": "diabetes"}
@@ -27,3 +48,12 @@ def predict_heart():
 @app.get("/predict/parkinsons")
 def predict_parkinsons():
     return {"status": "ok", "model": "parkinsons"}
+
+@app.post("/predict/screening")
+def predict_screening(fields: dict = Body(...)):
+    # Diabetes, heart and Parkinson's from one payload, scored concurrently.
+    WARMUP.wait(WARMUP_WAIT_SECONDS)
+    try:
+        return screen(WARMUP.bundles, fields)
+    except (TypeError, ValueError) as exc:
+        return JSONResponse({"error": str(exc)}, status_code=400)
@@ -0,0 +1,91 @@
+"""
+Micro-benchmark for memoized Plotly figures (charts.py).
+
+For the figure set rendered by one diabetes prediction, times a cold build
+against a repeated identical build served from the memo cache, and the
+per-render serialization st.plotly_chart does (to_dict() plus
+plotly.io.to_json) for freshly built figures against memoized
+SerializedFigures. The last line is the server render time saved per
+prediction.
+
+Usage: python bench_figures.py [iterations]
+"""
+import statistics
+import sys
+import time
+
+import numpy as np
+import plotly.io as pio
+import plotly.tools
+
+import charts
+from population_stats import get_population_stats
+
+FEATURES = ['Pregnancies', 'Glucose', 'Blood Pressure', 'Skin Thickness', 'Insulin', 'BMI', 'Diabetes Pedigree Function', 'Age']
+IMPORTANCE = [0.05, 0.28, 0.10, 0.07, 0.15, 0.20, 0.08, 0.07]
+GLUCOSE, BLOOD_PRESSURE, BMI = 120.0, 80.0, 26.5
+
+
+def _figure_set(build):
+    population = get_population_stats()
+    edges, counts = population.histogram("diabetes", "Glucose", "0")
+    _, diabetic_counts = population.histogram("diabetes", "Glucose", "1")
+    return [
+        build(charts.plot_feature_importance, FEATURES, IMPORTANCE),
+        build(charts.plot_prediction_proba, np.array([0.35, 0.65])),
+        build(charts.create_metrics_chart, [GLUCOSE, BLOOD_PRESSURE, BMI],
+              ['Glucose Level', 'Blood Pressure', 'BMI'], [(70, 140), (60, 90), (18.5, 24.9)]),
+        build(charts.create_distribution_plot, edges, [("No diabetes", counts), ("Diabetes", diabetic_counts)],
+              "Glucose Level Distribution", normal_range=(70, 140), marker=GLUCOSE),
+        build(charts.create_comparison_chart, [GLUCOSE, BLOOD_PRESSURE, BMI], [100, 80, 25],
+              ['Glucose', 'Blood Pressure', 'BMI']),
+    ]
+
+
+def _uncached(builder, *args, **kwargs):
+    return builder.uncached(*args, **kwargs)
+
+
+def _memoized(builder, *args, **kwargs):
+    return builder(*args, **kwargs)
+
+
+def _render(figures):
+    """What st.plotly_chart does with each figure on every render."""
+    return [
+        pio.to_json(plotly.tools.return_figure_from_figure_or_data(fig, validate_figure=True), validate=False)
+        for fig in figures
+    ]
+
+
+def _median_ms(call, iterations):
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - start) * 1e3)
+    return statistics.median(samples)
+
+
+def main(iterations=50):
+    _render(_figure_set(_uncached))  # import plotly's lazily loaded validators
+    cold = _median_ms(lambda: _figure_set(_uncached), iterations)
+    _render(_figure_set(_memoized))
+    cached = _median_ms(lambda: _figure_set(_memoized), iterations)
+    fresh_figures, memoized_figures = _figure_set(_uncached), _figure_set(_memoized)
+    fresh_render = _median_ms(lambda: _render(fresh_figures), iterations)
+    memoized_render = _median_ms(lambda: _render(memoized_figures), iterations)
+
+    print(f"{'figure set':<26}{'median ms':>12}")
+    print(f"{'cold build':<26}{cold:>12.2f}")
+    print(f"{'memoized build':<26}{cached:>12.3f}")
+    print(f"{'serialize, fresh figures':<26}{fresh_render:>12.2f}")
+    print(f"{'serialize, memoized':<26}{memoized_render:>12.3f}")
+    print(f"build speedup: {cold / cached:.0f}x")
+    print(f"{'':<26}{charts.create_distribution_plot.cache_info()}")
+    print(f"saved per prediction: {cold + fresh_render - cached - memoized_render:.1f} ms "
+          f"({cold + fresh_render:.1f} -> {cached + memoized_render:.2f})")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
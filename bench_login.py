@@ -0,0 +1,97 @@
+"""
+Login throughput benchmark.
+
+Measures, at the configured cost factors (PASSWORD_SCRYPT_N/R/P or
+PASSWORD_PBKDF2_ITERATIONS), the time of one password verification, then
+end-to-end auth.authenticate_user throughput against a throwaway users.db
+with 1, 2, ... HASH_WORKERS concurrent clients, reported per core in use.
+The last rows show a repeat login served by the verification cache and the
+one-off upgrade of a legacy SHA-256 hash.
+
+Usage: python bench_login.py [logins_per_client]
+"""
+import hashlib
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BASE_DIR)
+
+
+def timed(call):
+    start = time.perf_counter()
+    call()
+    return time.perf_counter() - start
+
+
+def throughput(clients, logins_per_client):
+    import auth
+    import password_hashing
+
+    def client(index):
+        for _ in range(logins_per_client):
+            password_hashing.VERIFY_CACHE.clear()
+            assert auth.authenticate_user(f"bench{index}", "correct horse battery")
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return clients * logins_per_client / (time.perf_counter() - start)
+
+
+def main(logins_per_client=8):
+    os.chdir(tempfile.mkdtemp())  # keep users.db out of the repository
+    import auth
+    import password_hashing as ph
+
+    if ph.SCRYPT_AVAILABLE:
+        print(f"KDF: scrypt n={ph.SCRYPT_N} r={ph.SCRYPT_R} p={ph.SCRYPT_P} "
+              f"({128 * ph.SCRYPT_N * ph.SCRYPT_R / 2 ** 20:.0f} MiB per call)")
+    else:
+        print(f"KDF: pbkdf2_sha256 iterations={ph.PBKDF2_ITERATIONS}")
+    print(f"pool workers: {ph.HASH_WORKERS}, cpus: {os.cpu_count()}")
+
+    stored = ph.hash_password("correct horse battery")
+    verify_ms = statistics.median(timed(lambda: ph._verify("correct horse battery", stored)) for _ in range(7)) * 1000
+    print(f"single verification: {verify_ms:.1f} ms")
+    print()
+
+    auth.init_database()
+    for index in range(ph.HASH_WORKERS):
+        auth.register_user(f"bench{index}", "correct horse battery")
+
+    print(f"{'clients':>8}{'logins/s':>10}{'per core':>10}")
+    clients = 1
+    while clients <= ph.HASH_WORKERS:
+        rate = throughput(clients, logins_per_client)
+        print(f"{clients:>8}{rate:>10.1f}{rate / min(clients, os.cpu_count() or 1):>10.1f}")
+        clients *= 2
+
+    ph.VERIFY_CACHE.clear()
+    auth.authenticate_user("bench0", "correct horse battery")
+    cached_ms = statistics.median(
+        timed(lambda: auth.authenticate_user("bench0", "correct horse battery")) for _ in range(7)
+    ) * 1000
+    print()
+    print(f"repeat login (verification cache hit): {cached_ms:.2f} ms")
+
+    conn = sqlite3.connect("users.db")
+    conn.execute("UPDATE users SET password = ? WHERE username = 'bench0'",
+                 (hashlib.sha256(b"correct horse battery").hexdigest(),))
+    conn.commit()
+    upgrade_ms = timed(lambda: auth.authenticate_user("bench0", "correct horse battery")) * 1000
+    upgraded = conn.execute("SELECT password FROM users WHERE username = 'bench0'").fetchone()[0]
+    conn.close()
+    print(f"legacy login + upgrade: {upgrade_ms:.1f} ms -> {upgraded.split('$', 1)[0]} hash stored")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 8)
@@ -0,0 +1,118 @@
+"""
+Rerun-latency benchmark for the multipage Streamlit app.
+
+Drives multiplediseaseprediction.py with Streamlit's AppTest, signed in, and
+reports per page the median time of
+
+- a full rerun (entry script + active page), which is what navigation and
+  widgets outside a fragment trigger, and
+- for the prediction pages, a fragment rerun with an edited number input,
+  which is what submitting the form triggers in a live session (the inputs
+  sit in an st.form, so editing them triggers no rerun at all; the run
+  count per completed prediction is kept in
+  st.session_state['prediction_reruns']), and
+- a prediction: a fragment rerun with the form's predict button clicked,
+  which covers model inference, charts and saving the result.
+
+AppTest always reruns the whole script, so fragment reruns are requested the
+way the browser does: by queueing the form fragment's id on the rerun.
+
+Usage: python bench_reruns.py [iterations]
+"""
+import functools
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+import warnings
+
+from streamlit.runtime.scriptrunner_utils.script_requests import RerunData
+from streamlit.testing.v1 import AppTest, local_script_runner
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPT = os.path.join(BASE_DIR, "multiplediseaseprediction.py")
+
+PAGES = [
+    "app_pages/welcome.py",
+    "app_pages/diabetes.py",
+    "app_pages/heart_disease.py",
+    "app_pages/parkinsons.py",
+    "app_pages/history.py",
+    "app_pages/requirements.py",
+    "app_pages/about.py",
+]
+FRAGMENT_PAGES = {"app_pages/diabetes.py", "app_pages/heart_disease.py", "app_pages/parkinsons.py"}
+
+
+def _median_ms(call, iterations):
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(samples)
+
+
+def _form_fragment_id(at):
+    # The page's form fragment registers before the entry script's feedback
+    # fragment, so it is the first one in registration order.
+    storage = at._fragment_storage
+    return min(storage._fragments, key=lambda fragment_id: storage._registration_sequence_by_id[fragment_id])
+
+
+def _fragment_run(at, fragment_id):
+    original = local_script_runner.RerunData
+    local_script_runner.RerunData = functools.partial(RerunData, fragment_id_queue=[fragment_id])
+    try:
+        at.run()
+    finally:
+        local_script_runner.RerunData = original
+
+
+def _edit_input(at, step):
+    widget = at.number_input[0]
+    widget.set_value(widget.value + step)
+
+
+def _predict(at, fragment_id):
+    next(button for button in at.button if button.label.startswith("Predict")).click()
+    _fragment_run(at, fragment_id)
+
+
+def bench_page(page, iterations):
+    at = AppTest.from_file(SCRIPT, default_timeout=300)
+    at.session_state["logged_in"] = True
+    at.session_state["user"] = {"id": 1, "username": "bench", "role": "user"}
+    at.switch_page(page)
+    at.run()  # first visit: imports and model loading
+    at.run()
+
+    full = _median_ms(at.run, iterations)
+    fragment = predict = None
+    if page in FRAGMENT_PAGES:
+        fragment_id = _form_fragment_id(at)
+        steps = iter([1, -1] * iterations)
+        fragment = _median_ms(lambda: (_edit_input(at, next(steps)), _fragment_run(at, fragment_id)), iterations)
+        predict = _median_ms(lambda: _predict(at, fragment_id), iterations)
+    return full, fragment, predict, [e.message for e in at.exception]
+
+
+def main(iterations=20):
+    warnings.filterwarnings("ignore")
+    logging.disable(logging.WARNING)
+    os.chdir(tempfile.mkdtemp())  # keep users.db out of the repository
+
+    print(f"{'page':<28}{'full rerun ms':>15}{'fragment rerun ms':>19}{'predict ms':>12}")
+    for page in PAGES:
+        full, fragment, predict, exceptions = bench_page(page, iterations)
+        fragment_text = f"{fragment:.1f}" if fragment is not None else "-"
+        predict_text = f"{predict:.1f}" if predict is not None else "-"
+        print(f"{page:<28}{full:>15.1f}{fragment_text:>19}{predict_text:>12}")
+        if exceptions:
+            print(f"{'':<28}exceptions: {exceptions}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
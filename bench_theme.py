@@ -0,0 +1,64 @@
+"""
+WebSocket payload benchmark for the theme stylesheet pipeline.
+
+Serializes the Streamlit ForwardMsg deltas a rerun sends for the theme, once
+with the CSS inlined as <style> markdown (the previous approach), once with
+the minified inline fallback theme_assets uses on Streamlit servers that
+cannot serve .css, and once with the theme_assets <link> tag, and prints the
+bytes per rerun. Streamlit
+replaces repeated deltas of global.minCachedMessageSize (10 kB) or more with
+a short hash reference, so both the first run and a steady-state rerun are
+reported.
+
+Usage: python bench_theme.py
+"""
+import streamlit
+from streamlit import config
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.runtime.forward_msg_cache import create_reference_msg, populate_hash_if_needed
+
+import theme_assets
+
+
+def _markdown_msg(body, index):
+    msg = ForwardMsg()
+    msg.metadata.delta_path[:] = [0, index]
+    msg.delta.new_element.markdown.body = body
+    msg.delta.new_element.markdown.allow_html = True
+    populate_hash_if_needed(msg)
+    return msg
+
+
+def _rerun_bytes(bodies):
+    """(first run bytes, steady-state rerun bytes) for a list of markdown bodies."""
+    first = steady = 0
+    for index, body in enumerate(bodies):
+        msg = _markdown_msg(body, index)
+        size = len(msg.SerializeToString())
+        first += size
+        steady += len(create_reference_msg(msg).SerializeToString()) if msg.metadata.cacheable else size
+    return first, steady
+
+
+def main():
+    min_cached = int(config.get_option("global.minCachedMessageSize"))
+    print(f"Streamlit {streamlit.__version__}, link tag served: {theme_assets._static_css_supported()}")
+    print(f"ForwardMsg cache threshold: {min_cached} bytes")
+    print(f"{'bundle':<8}{'mode':<9}{'first run B':>13}{'rerun B':>10}{'static file B':>15}")
+    for name, sources in theme_assets.BUNDLES.items():
+        inline = [f"<style>\n{theme_assets._read_sources([source])}\n</style>" for source in sources]
+        filename, css = theme_assets.build_bundle(name)
+        minified = [f"<style>{css}</style>"]
+        link = [f'<link rel="stylesheet" href="{theme_assets.STATIC_URL}/{filename}">']
+
+        before = _rerun_bytes(inline)
+        fallback = _rerun_bytes(minified)
+        after = _rerun_bytes(link)
+        print(f"{name:<8}{'inline':<9}{before[0]:>13}{before[1]:>10}{'-':>15}")
+        print(f"{name:<8}{'minified':<9}{fallback[0]:>13}{fallback[1]:>10}{'-':>15}")
+        print(f"{name:<8}{'link':<9}{after[0]:>13}{after[1]:>10}{len(css.encode()):>15}")
+        print(f"{'':<8}saved per rerun: {before[0] - after[0]} B first run, {before[1] - after[1]} B steady state")
+
+
+if __name__ == "__main__":
+    main()
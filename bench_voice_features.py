@@ -0,0 +1,111 @@
+"""
+Voice feature extraction benchmark.
+
+Writes a synthetic sustained vowel (a 130 Hz pulse train with 0.5% period
+jitter and 4% amplitude shimmer through two formant resonances, plus noise)
+of the given length to a temporary WAV, then reports extraction throughput
+in seconds of audio per CPU second, the peak memory traced while extracting
+a 5 s clip and the full recording (it should not grow with the length), and
+the measured jitter / shimmer next to the synthesized ones.
+
+Usage: python bench_voice_features.py [seconds]
+"""
+import math
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import wave
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BASE_DIR)
+
+RATE = 44100
+F0 = 130.0
+JITTER = 0.005
+SHIMMER = 0.04
+CLIP_SECONDS = 10
+
+
+def synthesize_clip(seconds, seed=0):
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    n = int(seconds * RATE)
+    periods = (1.0 + JITTER * rng.standard_normal(int(seconds * F0 * 1.1))) / F0
+    onsets = np.cumsum(periods)
+    onsets = onsets[onsets < seconds]
+    amplitudes = 1.0 + SHIMMER * rng.standard_normal(len(onsets))
+    # Split each pulse over its two neighbouring samples, so onsets are not rounded to the sample grid.
+    position = onsets * RATE
+    index = position.astype(np.intp)
+    fraction = position - index
+    pulses = np.zeros(n + 1)
+    np.add.at(pulses, index, amplitudes * (1.0 - fraction))
+    np.add.at(pulses, index + 1, amplitudes * fraction)
+    pulses = pulses[:n]
+    t = np.arange(int(0.012 * RATE)) / RATE
+    formants = np.exp(-400 * t) * np.sin(2 * np.pi * 700 * t) + 0.6 * np.exp(-300 * t) * np.sin(2 * np.pi * 250 * t)
+    size = n + len(formants)
+    voice = np.fft.irfft(np.fft.rfft(pulses, size) * np.fft.rfft(formants, size), size)[:n]
+    voice = 0.6 * voice / np.abs(voice).max() + 0.01 * rng.standard_normal(n)
+    return (np.clip(voice, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+
+
+def write_wav(path, seconds):
+    """Write `seconds` of synthetic voice, repeating a CLIP_SECONDS clip."""
+    clip = synthesize_clip(min(seconds, CLIP_SECONDS))
+    with wave.open(path, "wb") as out:
+        out.setnchannels(1)
+        out.setsampwidth(2)
+        out.setframerate(RATE)
+        remaining = int(seconds * RATE) * 2
+        while remaining > 0:
+            out.writeframes(clip[:remaining])
+            remaining -= len(clip)
+
+
+def traced_peak(path):
+    from voice_features import extract_features
+
+    tracemalloc.start()
+    extract_features(path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2 ** 20
+
+
+def main(seconds=120.0):
+    from inference import load_bundle, predict_with_proba
+    from voice_features import FEATURE_NAMES, extract_features
+
+    tmp_dir = tempfile.mkdtemp()
+    short_path, long_path = os.path.join(tmp_dir, "short.wav"), os.path.join(tmp_dir, "long.wav")
+    write_wav(short_path, 5)
+    write_wav(long_path, seconds)
+    extract_features(short_path)  # first-call imports and allocations outside the timing
+
+    start = time.process_time()
+    features = extract_features(long_path)
+    cpu = time.process_time() - start
+    print(f"audio seconds       {seconds:>10.1f}")
+    print(f"CPU seconds         {cpu:>10.3f}")
+    print(f"audio s / CPU s     {seconds / cpu:>10.1f}")
+    print(f"peak MiB, 5 s       {traced_peak(short_path):>10.2f}")
+    print(f"peak MiB, full      {traced_peak(long_path):>10.2f}")
+
+    values = dict(zip(FEATURE_NAMES, features))
+    # E|x - y| = 2 sigma / sqrt(pi) for independent normal perturbations.
+    spread = 2.0 / math.sqrt(math.pi)
+    print(f"jitter (%)          {values['MDVP:Jitter(%)'] * 100:>10.3f}  synthesized ~{JITTER * 100 * spread:.3f}")
+    print(f"shimmer             {values['MDVP:Shimmer']:>10.4f}  synthesized ~{SHIMMER * spread:.4f}")
+
+    bundle = load_bundle("parkinsons")
+    start = time.perf_counter()
+    prediction, proba = predict_with_proba(bundle, features, monitor=False)
+    print(f"model ms            {(time.perf_counter() - start) * 1000.0:>10.2f}  (prediction {int(prediction[0])})")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 120.0)
@@ -0,0 +1,421 @@
+"""
+Plotly figure builders shared by the Streamlit pages.
+
+Builders are memoized on their arguments with a bounded per-process LRU, so
+figures whose inputs are constant (e.g. the population histograms) are
+built once per process and identical submissions reuse the same figure.
+They are also serialized once: st.plotly_chart calls to_dict() and
+JSON-encodes the result on every render, and a SerializedFigure computes
+its dict / JSON form on first use and returns the same one afterwards.
+Cached figures are shared between sessions: treat them, and the dicts they
+return, as read-only.
+"""
+import functools
+import json
+import os
+
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.subplots import make_subplots
+
+FIGURE_CACHE_SIZE = int(os.getenv("FIGURE_CACHE_SIZE", "256"))
+
+def _freeze(value):
+    """Turn list/ndarray arguments into hashable nested tuples."""
+    if isinstance(value, np.ndarray):
+        value = value.tolist()
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+class SerializedFigure(go.Figure):
+    """A figure that keeps its serialized form; must not be modified once rendered."""
+
+    _spec = None
+
+    @classmethod
+    def adopt(cls, fig):
+        """Turn a freshly built go.Figure into a SerializedFigure in place (copying one costs a rebuild)."""
+        fig.__class__ = cls
+        return fig
+
+    def _serialized(self):
+        if self._spec is None:
+            spec = pio.to_json(super().to_dict(), validate=False)
+            # Plain lists and floats, so st.plotly_chart's own encoding pass is cheap too.
+            self._spec = (spec, json.loads(spec))
+        return self._spec
+
+    def to_dict(self):
+        return self._serialized()[1]
+
+    def to_json(self, *args, **kwargs):
+        if args or kwargs:
+            return super().to_json(*args, **kwargs)
+        return self._serialized()[0]
+
+def memoized_figure(builder):
+    """Memoize a figure builder on its frozen positional and keyword arguments."""
+    @functools.lru_cache(maxsize=FIGURE_CACHE_SIZE)
+    def cached(args, kwargs):
+        return SerializedFigure.adopt(builder(*args, **dict(kwargs)))
+
+    @functools.wraps(builder)
+    def wrapper(*args, **kwargs):
+        return cached(_freeze(args), tuple(sorted((k, _freeze(v)) for k, v in kwargs.items())))
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    wrapper.uncached = builder
+    return wrapper
+
+@memoized_figure
+def plot_feature_importance(features, importance_scores, x_label='Importance'):
+    """Create a bar chart of feature importance
+
+    Signed scores (per-patient contributions from explanations.py) are drawn
+    on a diverging scale centred on zero, ordered by magnitude.
+    """
+    signed = min(importance_scores, default=0) < 0
+    # Sort features by importance
+    sorted_idx = np.argsort(np.abs(importance_scores) if signed else importance_scores)
+    sorted_features = [features[i] for i in sorted_idx]
+    sorted_scores = [importance_scores[i] for i in sorted_idx]
+    
+    # Create the plot
+    fig = px.bar(
+        x=sorted_scores,
+        y=sorted_features,
+        orientation='h',
+        labels={'x': x_label, 'y': 'Feature'},
+        title='Feature Importance',
+        color=sorted_scores,
+        color_continuous_scale='RdBu_r' if signed else 'Blues',
+        color_continuous_midpoint=0 if signed else None
+    )
+    
+    # Customize layout
+    fig.update_layout(
+        height=400,
+        margin={"l": 20, "r": 20, "t": 40, "b": 20},
+        title_font={"size": 20, "color": '#1e3a8a'},
+        font={"family": 'Segoe UI, Arial, sans-serif', "color": '#333333'},
+        xaxis_title_font=dict(size=14),
+        yaxis_title_font=dict(size=14)
+    )
+    
+    return fig
+
+@memoized_figure
+def plot_prediction_proba(prediction_proba):
+    """Create a gauge chart for prediction probability
+
+    Accepts predict_proba output for one row, [[p0, p1]], or the row itself,
+    [p0, p1], as a list, tuple (memoized arguments arrive frozen) or array.
+    """
+    # Probability of the positive class
+    positive_proba = float(np.asarray(prediction_proba, dtype=float).reshape(-1, 2)[0, 1])
+    
+    # Create the gauge chart
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=positive_proba * 100,
+        title={"text": "Prediction Probability", "font": {"size": 24, "color": '#1e3a8a'}},
+        gauge={
+            'axis': {'range': [0, 100], 'tickwidth': 1, 'tickcolor': "#333333"},
+            'bar': {'color': "#1e40af"},
+            'bgcolor': "white",
+            'borderwidth': 2,
+            'bordercolor': "#333333",
+            'steps': [
+                {'range': [0, 30], 'color': '#dcfce7'},
+                {'range': [30, 70], 'color': '#fef9c3'},
+                {'range': [70, 100], 'color': '#fee2e2'}
+            ],
+        }
+    ))
+    
+    # Customize layout
+    fig.update_layout(
+        height=300,
+        margin=dict(l=20, r=20, t=50, b=20),
+        font=dict(family='Segoe UI, Arial, sans-serif', color='#333333')
+    )
+    
+    return fig
+
+@memoized_figure
+def create_metrics_chart(metrics_values, metrics_labels, metrics_ranges):
+    """Create a chart with multiple metrics and their normal ranges"""
+    fig = go.Figure()
+    
+    # Add a trace for each metric
+    for i, (value, label, (min_range, max_range)) in enumerate(zip(metrics_values, metrics_labels, metrics_ranges)):
+        # Determine color based on whether value is in normal range
+        if min_range <= value <= max_range:
+            color = '#4CAF50'  # Green for normal
+        else:
+            color = '#F44336'  # Red for abnormal
+        
+        # Add bar for the metric
+        fig.add_trace(go.Bar(
+            x=[label],
+            y=[value],
+            name=label,
+            marker_color=color,
+            text=[f"{value:.1f}"],
+            textposition='auto'
+        ))
+        
+        # Add range indicators
+        fig.add_shape(
+            type="rect",
+            x0=i - 0.4,
+            x1=i + 0.4,
+            y0=min_range,
+            y1=max_range,
+            line=dict(color="rgba(0,0,0,0)"),
+            fillcolor="rgba(0,100,0,0.2)",
+            xref="x",
+            yref="y"
+        )
+    
+    # Customize layout
+    fig.update_layout(
+        title="Health Metrics",
+        title_font={"size": 20, "color": '#1e3a8a'},
+        xaxis={"title": {"text": "Metrics", "font": {"size": 14}}, "tickfont": {"size": 12}},
+        yaxis={"title": {"text": "Value", "font": {"size": 14}}, "tickfont": {"size": 12}}
+    )
+    
+    return fig
+
+@memoized_figure
+def create_distribution_plot(bin_edges, series, title, normal_range=None, marker=None):
+    """Create a distribution plot for a health metric from precomputed bins
+
+    `series` is a sequence of (name, counts) on the shared `bin_edges` (see
+    population_stats.py); `marker` draws a line at the patient's value.
+    """
+    bin_edges = np.asarray(bin_edges, dtype=float)
+    centers = (bin_edges[:-1] + bin_edges[1:]) / 2
+    widths = np.diff(bin_edges)
+    colors = ['#3b82f6', '#ef4444', '#9ca3af']
+    
+    fig = go.Figure()
+    for i, (name, counts) in enumerate(series):
+        fig.add_trace(go.Bar(
+            x=centers,
+            y=counts,
+            width=widths,
+            name=name,
+            opacity=0.6,
+            marker_color=colors[i % len(colors)]
+        ))
+    fig.update_layout(
+        title=title,
+        barmode='overlay',
+        xaxis={"title": {"text": "Value"}},
+        yaxis={"title": {"text": "Frequency"}}
+    )
+    
+    # Mark the patient's value
+    if marker is not None:
+        fig.add_vline(x=marker, line={"color": '#1e40af', "width": 2})
+    
+    # Add normal range if provided
+    if normal_range:
+        fig.add_shape(
+            type="rect",
+            x0=normal_range[0],
+            x1=normal_range[1],
+            y0=0,
+            y1=1,
+            yref="paper",
+            fillcolor="rgba(0,100,0,0.2)",
+            line=dict(color="rgba(0,0,0,0)"),
+            name="Normal Range"
+        )
+        
+        # Add annotations for normal range
+        fig.add_annotation(
+            x=normal_range[0],
+            y=0.95,
+            yref="paper",
+            text=f"Min: {normal_range[0]}",
+            showarrow=False,
+            font=dict(color="#1e3a8a")
+        )
+        fig.add_annotation(
+            x=normal_range[1],
+            y=0.95,
+            yref="paper",
+            text=f"Max: {normal_range[1]}",
+            showarrow=False,
+            font=dict(color="#1e3a8a")
+        )
+    
+    # Customize layout
+    fig.update_layout(
+        height=300,
+        margin={"l": 20, "r": 20, "t": 50, "b": 20},
+        title_font={"size": 18, "color": '#1e3a8a'},
+        font={"family": 'Segoe UI, Arial, sans-serif', "color": '#333333'},
+        showlegend=True
+    )
+    
+    return fig
+
+@memoized_figure
+def create_comparison_chart(user_values, population_means, labels):
+    """Create a comparison chart between user values and population means"""
+    fig = go.Figure()
+    
+    # Add user values
+    fig.add_trace(go.Bar(
+        x=labels,
+        y=user_values,
+        name='Your Values',
+        marker_color='#3b82f6',
+        text=[f"{val:.1f}" for val in user_values],
+        textposition='auto'
+    ))
+    
+    # Add population means
+    fig.add_trace(go.Bar(
+        x=labels,
+        y=population_means,
+        name='Population Average',
+        marker_color='#9ca3af',
+        text=[f"{val:.1f}" for val in population_means],
+        textposition='auto'
+    ))
+    
+    # Customize layout
+    fig.update_layout(
+        title="Your Values vs Population Average",
+        title_font={"size": 18, "color": '#1e3a8a'},
+        xaxis={"title": {"text": "Metrics", "font": {"size": 14}}, "tickfont": {"size": 12}},
+        yaxis={"title": {"text": "Value", "font": {"size": 14}}, "tickfont": {"size": 12}},
+        height=350,
+        margin={"l": 20, "r": 20, "t": 50, "b": 20},
+        font={"family": 'Segoe UI, Arial, sans-serif', "color": '#333333'},
+        barmode='group'
+    )
+    
+    return fig
+
+def create_trend_line(x_values, y_values, x_label, y_label):
+    """Create a trend line chart"""
+    fig = go.Figure()
+    
+    # Add the trend line
+    fig.add_trace(go.Scatter(
+        x=x_values,
+        y=y_values,
+        mode='lines',
+        name='Trend',
+        line={"color": '#3b82f6', "width": 2}
+    ))
+    
+    # Customize layout
+    fig.update_layout(
+        title=f"{y_label} vs {x_label}",
+        title_font={"size": 18, "color": '#1e3a8a'},
+        xaxis={"title": {"text": x_label, "font": {"size": 14}}, "tickfont": {"size": 12}},
+        yaxis={"title": {"text": y_label, "font": {"size": 14}}, "tickfont": {"size": 12}},
+        height=300,
+        margin=dict(l=20, r=20, t=50, b=20),
+        font=dict(family='Segoe UI, Arial, sans-serif', color='#333333')
+    )
+    
+    return fig
+
+@memoized_figure
+def plot_prediction_distribution(names, counts):
+    """Create a pie chart of saved predictions per disease type"""
+    fig = px.pie(
+        values=counts,
+        names=names,
+        title="Distribution of Predictions by Disease Type",
+        color_discrete_sequence=["#19c6b3", "#3f7cff", "#ffb74d", "#ef4444", "#8b5cf6"]
+    )
+    fig.update_traces(textinfo='percent+label')
+    return fig
+
+@memoized_figure
+def plot_what_if_curves(labels, grids, probabilities, current_values):
+    """Create one risk response curve per feature, sharing the risk axis"""
+    fig = make_subplots(rows=1, cols=len(labels), shared_yaxes=True, subplot_titles=labels)
+    
+    for col, (values, proba, current) in enumerate(zip(grids, probabilities, current_values), start=1):
+        risk = np.asarray(proba) * 100
+        fig.add_trace(go.Scatter(
+            x=values,
+            y=risk,
+            mode='lines',
+            line={"color": '#1e40af', "width": 2},
+            showlegend=False,
+            hovertemplate='%{x:.1f}: %{y:.1f}%<extra></extra>'
+        ), row=1, col=col)
+        # Mark the patient's own value
+        fig.add_trace(go.Scatter(
+            x=[current],
+            y=[np.interp(current, values, risk)],
+            mode='markers',
+            marker={"color": '#ef4444', "size": 10},
+            showlegend=False,
+            hovertemplate='You: %{x:.1f}<extra></extra>'
+        ), row=1, col=col)
+    
+    # Customize layout
+    fig.update_yaxes(title_text='Predicted risk (%)', range=[0, 100], row=1, col=1)
+    fig.update_layout(
+        title="What-if: Risk as One Value Changes",
+        title_font={"size": 18, "color": '#1e3a8a'},
+        height=350,
+        margin={"l": 20, "r": 20, "t": 80, "b": 20},
+        font={"family": 'Segoe UI, Arial, sans-serif', "color": '#333333'}
+    )
+    
+    return fig
+
+@memoized_figure
+def plot_what_if_surface(x_label, x_values, y_label, y_values, probabilities, current=None):
+    """Create a heatmap of predicted risk over two features (rows follow x_values)"""
+    fig = go.Figure(go.Heatmap(
+        x=x_values,
+        y=y_values,
+        z=(np.asarray(probabilities) * 100).T,
+        zmin=0,
+        zmax=100,
+        colorscale='RdYlGn_r',
+        colorbar={"title": {"text": "Risk (%)"}},
+        hovertemplate=f'{x_label}: %{{x:.1f}}<br>{y_label}: %{{y:.1f}}<br>Risk: %{{z:.1f}}%<extra></extra>'
+    ))
+    
+    if current is not None:
+        fig.add_trace(go.Scatter(
+            x=[current[0]],
+            y=[current[1]],
+            mode='markers',
+            marker={"color": '#1e40af', "size": 12, "symbol": 'x'},
+            name='You'
+        ))
+    
+    # Customize layout
+    fig.update_layout(
+        title=f"What-if: {x_label} and {y_label}",
+        title_font={"size": 18, "color": '#1e3a8a'},
+        xaxis={"title": {"text": x_label}},
+        yaxis={"title": {"text": y_label}},
+        height=400,
+        margin={"l": 20, "r": 20, "t": 50, "b": 20},
+        font={"family": 'Segoe UI, Arial, sans-serif', "color": '#333333'}
+    )
+    
+    return fig
@@ -0,0 +1,293 @@
+"""
+Versioned schema migrations for users.db.
+
+Each migration runs once per database, in order, inside its own
+BEGIN IMMEDIATE transaction that also bumps PRAGMA user_version, so a
+crashed or concurrent start never applies one twice or leaves it half done.
+ensure_schema() runs the pending ones the first time a process touches a
+database path; every later call is a set lookup. Request paths in auth.py
+can therefore assume the canonical layout below and never issue DDL or
+PRAGMA table_info themselves.
+
+Canonical layout:
+
+    users(id, username UNIQUE, password, email, role, created_at)
+    predictions(id, user_id, prediction_type, input_data, result,
+                confidence, is_positive, probability, created_at)
+    sessions(id, user_id, username, role, created_at, expires_at)
+    session_handoffs(code, session_id, persistent, expires_at)
+    app_secrets(name, value)
+    drift_stats(disease, baseline, observations, count, mean, m2, hist, updated_at)
+
+Databases from earlier releases (predictions.disease_type /
+prediction_result, users without email/role/created_at, ...) are rebuilt
+into that layout by migration 1.
+
+Usage: python db_migrations.py [path/to/users.db]
+"""
+import os
+import re
+import sqlite3
+import sys
+import threading
+
+DB_PATH = 'users.db'
+
+USERS_TABLE_SQL = '''
+    CREATE TABLE {name}(
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT UNIQUE NOT NULL,
+        password TEXT NOT NULL,
+        email TEXT DEFAULT '',
+        role TEXT DEFAULT 'user',
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+'''
+
+PREDICTIONS_TABLE_SQL = '''
+    CREATE TABLE {name}(
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER,
+        prediction_type TEXT NOT NULL,
+        input_data TEXT NOT NULL,
+        result TEXT NOT NULL,
+        confidence REAL,
+        is_positive INTEGER,
+        probability REAL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    )
+'''
+
+# Canonical column -> (legacy column names to copy from, in order of
+# preference; SQL expression used when none of them exists).
+USERS_COLUMNS = {
+    'id': (('id',), 'rowid'),
+    'username': (('username',), "'user' || rowid"),
+    'password': (('password',), "''"),
+    'email': (('email',), "''"),
+    'role': (('role',), "'user'"),
+    'created_at': (('created_at',), 'CURRENT_TIMESTAMP'),
+}
+
+PREDICTIONS_COLUMNS = {
+    'id': (('id',), 'rowid'),
+    'user_id': (('user_id',), 'NULL'),
+    'prediction_type': (('prediction_type', 'disease_type'), "'Unknown'"),
+    'input_data': (('input_data',), "''"),
+    'result': (('result', 'prediction_result'), "''"),
+    'confidence': (('confidence',), 'NULL'),
+    'is_positive': (('is_positive',), 'NULL'),
+    'probability': (('probability',), 'NULL'),
+    'created_at': (('created_at',), 'CURRENT_TIMESTAMP'),
+}
+
+_NEGATIVE_RESULT_RE = re.compile(r"\b(?:not|no|negative|without)\b", re.IGNORECASE)
+_POSITIVE_RESULT_RE = re.compile(r"\b(?:is diabetic|has|have|positive)\b", re.IGNORECASE)
+
+
+def classify_result(result):
+    """Positive-signal flag (1/0) for a free-text result.
+
+    Only used for rows saved before is_positive was stored, and as a fallback
+    when a caller does not pass the flag. Negations win, so "The person is
+    not diabetic" and "No significant indicators detected" are negative.
+    """
+    if not result or _NEGATIVE_RESULT_RE.search(result):
+        return 0
+    return 1 if _POSITIVE_RESULT_RE.search(result) else 0
+
+
+def _table_columns(conn, name):
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({name})")]
+
+
+def _normalize_table(conn, name, create_sql, column_map):
+    """Create `name` in its canonical layout, rebuilding a legacy table if needed."""
+    existing = _table_columns(conn, name)
+    if not existing:
+        conn.execute(create_sql.format(name=name))
+        return
+    if existing == list(column_map):
+        return
+
+    select = []
+    for column, (sources, fallback) in column_map.items():
+        source = next((legacy for legacy in sources if legacy in existing), None)
+        select.append(source or fallback)
+    staging = f"{name}_migrating"
+    conn.execute(f"DROP TABLE IF EXISTS {staging}")
+    conn.execute(create_sql.format(name=staging))
+    conn.execute(
+        f"INSERT INTO {staging} ({', '.join(column_map)}) SELECT {', '.join(select)} FROM {name}"
+    )
+    conn.execute(f"DROP TABLE {name}")
+    conn.execute(f"ALTER TABLE {staging} RENAME TO {name}")
+
+
+def _canonical_tables(conn):
+    _normalize_table(conn, 'users', USERS_TABLE_SQL, USERS_COLUMNS)
+    _normalize_table(conn, 'predictions', PREDICTIONS_TABLE_SQL, PREDICTIONS_COLUMNS)
+
+
+def _backfill_signals(conn):
+    # confidence is the winning class's probability in percent, so for these
+    # binary models the positive-class probability follows from the flag.
+    conn.create_function("classify_result", 1, classify_result, deterministic=True)
+    conn.execute("UPDATE predictions SET is_positive = classify_result(result) WHERE is_positive IS NULL")
+    conn.execute("""
+        UPDATE predictions
+        SET probability = CASE WHEN is_positive = 1 THEN confidence / 100.0 ELSE 1 - confidence / 100.0 END
+        WHERE probability IS NULL AND confidence IS NOT NULL
+    """)
+
+
+def _indexes(conn):
+    # idx_predictions_user_created serves the history page's filtered,
+    # newest-first page queries; idx_predictions_user finds a user's latest
+    # row id in one probe; idx_predictions_user_summary covers the dashboard
+    # GROUP BY, so it never touches the table rows.
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_predictions_user_created ON predictions (user_id, created_at)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_predictions_user ON predictions (user_id)")
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_predictions_user_summary
+        ON predictions (user_id, prediction_type, is_positive, confidence, created_at)
+    """)
+    conn.execute("DROP INDEX IF EXISTS idx_predictions_user_positive")
+
+
+def _seed_admin(conn):
+    from password_hashing import hash_password
+
+    if conn.execute("SELECT 1 FROM users WHERE username = 'admin'").fetchone() is None:
+        conn.execute(
+            "INSERT INTO users (username, password, email, role) VALUES ('admin', ?, 'admin@local', 'admin')",
+            (hash_password('admin123'),),
+        )
+
+
+def _sessions(conn):
+    # Server-side login sessions (see session_store.py) and the signing key
+    # shared by every instance that uses this database.
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS sessions(
+            id TEXT PRIMARY KEY,
+            user_id INTEGER NOT NULL,
+            username TEXT NOT NULL,
+            role TEXT DEFAULT 'user',
+            created_at REAL NOT NULL,
+            expires_at REAL NOT NULL,
+            FOREIGN KEY (user_id) REFERENCES users (id)
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_expires ON sessions (expires_at)")
+    conn.execute("CREATE TABLE IF NOT EXISTS app_secrets(name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+
+def _drift_stats(conn):
+    # Streaming input statistics per disease (see drift_monitor.py); the
+    # arrays are raw float64 / int64 bytes.
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS drift_stats(
+            disease TEXT PRIMARY KEY,
+            baseline TEXT NOT NULL,
+            observations INTEGER NOT NULL,
+            count BLOB NOT NULL,
+            mean BLOB NOT NULL,
+            m2 BLOB NOT NULL,
+            hist BLOB NOT NULL,
+            updated_at REAL NOT NULL
+        )
+    """)
+
+
+def _session_handoffs(conn):
+    # Single-use codes that proxy.py exchanges for a session token when it
+    # sets the HttpOnly session cookie (see session_store.py).
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS session_handoffs(
+            code TEXT PRIMARY KEY,
+            session_id TEXT NOT NULL,
+            persistent INTEGER NOT NULL,
+            expires_at REAL NOT NULL
+        )
+    """)
+
+
+# (version, description, function). Append only; never renumber.
+MIGRATIONS = [
+    (1, "canonical users and predictions tables", _canonical_tables),
+    (2, "backfill predictions.is_positive and probability", _backfill_signals),
+    (3, "history and dashboard indexes", _indexes),
+    (4, "seed the default admin account", _seed_admin),
+    (5, "login sessions and shared secrets", _sessions),
+    (6, "feature drift statistics", _drift_stats),
+    (7, "session cookie handoff codes", _session_handoffs),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def schema_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn):
+    """Apply pending migrations. Returns the versions applied.
+
+    `conn` must be in autocommit mode (isolation_level=None) so each
+    migration's transaction is controlled here.
+    """
+    applied = []
+    for version, _, apply in MIGRATIONS:
+        if schema_version(conn) >= version:
+            continue
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Another process may have applied it while we waited for the lock.
+            if schema_version(conn) < version:
+                apply(conn)
+                conn.execute(f"PRAGMA user_version = {int(version)}")
+                applied.append(version)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+    return applied
+
+
+_migrated_paths = set()
+_migrate_lock = threading.Lock()
+
+
+def ensure_schema(db_path=DB_PATH):
+    """Bring a database up to LATEST_VERSION once per process."""
+    key = os.path.abspath(db_path)
+    if key in _migrated_paths:
+        return
+    with _migrate_lock:
+        if key in _migrated_paths:
+            return
+        conn = sqlite3.connect(db_path, isolation_level=None)
+        try:
+            migrate(conn)
+        finally:
+            conn.close()
+        _migrated_paths.add(key)
+
+
+def main(db_path=DB_PATH):
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        before = schema_version(conn)
+        applied = migrate(conn)
+        print(f"{db_path}: schema version {before} -> {schema_version(conn)}")
+        for version, description, _ in MIGRATIONS:
+            if version in applied:
+                print(f"  applied {version}: {description}")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else DB_PATH)
@@ -0,0 +1,340 @@
+"""
+Streaming feature-drift monitoring for the disease models.
+
+Every single-row prediction (inference.predict_with_proba) is fed to the
+process's DriftMonitor once start_drift_monitor() has run. Per disease it
+keeps, in O(features) memory:
+
+- the number of rows seen and, per feature, the count of measured values
+  and their Welford running mean / sum of squared deviations;
+- per-feature histograms on the training baseline's bins (the 30 shared
+  bins of population_stats.py), plus an underflow and an overflow bin for
+  values outside the training range.
+
+Missing values (NaN, and the zeros that mean "not measured" in
+population_stats.MISSING_AS_ZERO columns) are counted as missing rather
+than binned, matching how the baseline was built. observe() is a handful
+of NumPy operations on the row (~20 us).
+
+A daemon thread flushes the counts gathered since the last flush every
+FLUSH_SECONDS (and at exit) into the `drift_stats` table of users.db,
+merging them into the stored totals with the parallel Welford update inside
+one transaction. Every process sharing the database therefore adds to the
+same totals. snapshot() combines the stored totals with this process's
+unflushed counts and compares them to the baseline:
+
+- the mean shift in baseline standard deviations;
+- the population stability index, sum((q - p) * ln(q / p)) over the bins,
+  with PSI_WARN / PSI_ALERT as the usual 0.1 / 0.25 thresholds.
+
+Stored totals are reset when the baseline bins change (the bundled CSVs
+were edited), since the old counts no longer line up with them.
+
+Monitoring never takes the service down with it: start_drift_monitor()
+loads the baselines up front and logs and returns None when the database
+or baselines are unavailable (e.g. a read-only filesystem), and
+inference.predict_with_proba logs and ignores errors from observe().
+"""
+import atexit
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+FLUSH_SECONDS = float(os.getenv("DRIFT_FLUSH_SECONDS", "60"))
+PSI_WARN = 0.1
+PSI_ALERT = 0.25
+# Added to every bin share before taking the PSI logarithm.
+PSI_EPSILON = 1e-4
+# Below this many measured values a feature's PSI is reported but not judged.
+MIN_OBSERVATIONS = int(os.getenv("DRIFT_MIN_OBSERVATIONS", "100"))
+
+logger = logging.getLogger(__name__)
+
+
+class FeatureStream:
+    """Row count and per-feature counts, Welford moments and baseline-binned histograms."""
+
+    def __init__(self, low, high, bins):
+        self.low = np.asarray(low, dtype=float)
+        self.high = np.asarray(high, dtype=float)
+        self.bins = bins
+        width = (self.high - self.low) / bins
+        self.inv_width = np.divide(1.0, width, out=np.zeros_like(width), where=width > 0)
+        self.features = np.arange(self.low.size)
+        self.rows = 0
+        self.count = np.zeros(self.low.size, dtype=np.int64)
+        self.mean = np.zeros(self.low.size)
+        self.m2 = np.zeros(self.low.size)
+        # Column 0 is underflow, 1..bins the baseline bins, bins + 1 overflow.
+        self.hist = np.zeros((self.low.size, self.bins + 2), dtype=np.int64)
+
+    def update(self, x):
+        """Add one row; NaN entries only count towards `rows`."""
+        valid = ~np.isnan(x)
+        self.rows += 1
+        self.count += valid
+        # Missing entries are replaced by the mean, so they move nothing below.
+        x = np.where(valid, x, self.mean)
+        delta = x - self.mean
+        self.mean += delta / np.maximum(self.count, 1)
+        self.m2 += delta * (x - self.mean)
+        # Baseline bins are closed on the right at the top edge, like np.histogram.
+        slot = np.clip(np.floor((x - self.low) * self.inv_width), -1, self.bins - 1) + 1
+        slot[x > self.high] = self.bins + 1
+        self.hist[self.features, slot.astype(np.intp)] += valid
+
+    def merge(self, rows, count, mean, m2, hist):
+        """Fold in another stream's totals (Chan et al.'s parallel update, per feature)."""
+        total = self.count + count
+        share = np.divide(count, total, out=np.zeros(total.shape), where=total > 0)
+        delta = mean - self.mean
+        self.mean = self.mean + delta * share
+        self.m2 = self.m2 + m2 + delta ** 2 * self.count * share
+        self.hist = self.hist + hist
+        self.count = total
+        self.rows += rows
+
+    def totals(self):
+        return self.rows, self.count, self.mean, self.m2, self.hist
+
+
+def _baseline(disease):
+    """Training bins, bin shares, means and standard deviations for `disease`."""
+    from population_stats import MISSING_AS_ZERO, get_population_stats
+
+    stats = get_population_stats()
+    arrays = stats.arrays
+    edges = arrays[f"{disease}.edges"]
+    counts = arrays[f"{disease}.all.hist"].T.astype(float)  # (features, bins)
+    shares = np.zeros((counts.shape[0], counts.shape[1] + 2))
+    shares[:, 1:-1] = counts / np.maximum(counts.sum(axis=1, keepdims=True), 1.0)
+    return {
+        "low": edges[0],
+        "high": edges[-1],
+        "bins": edges.shape[0] - 1,
+        "shares": shares,
+        "mean": arrays[f"{disease}.all.mean"],
+        "std": arrays[f"{disease}.all.std"],
+        "columns": arrays[f"{disease}.columns"].tolist(),
+        "zero_missing": np.array([stats.columns[disease][column] for column in MISSING_AS_ZERO.get(disease, ())],
+                                 dtype=np.intp),
+        "digest": str(arrays["source_digest"]),
+    }
+
+
+def psi(expected, actual):
+    """Population stability index per row of two (features, bins) share arrays."""
+    expected = expected + PSI_EPSILON
+    actual = actual + PSI_EPSILON
+    return ((actual - expected) * np.log(actual / expected)).sum(axis=1)
+
+
+def _status(score, count):
+    if count < MIN_OBSERVATIONS:
+        return "too few"
+    return "drift" if score >= PSI_ALERT else "watch" if score >= PSI_WARN else "stable"
+
+
+class DriftMonitor:
+    """Per-disease FeatureStreams, persisted to a shared SQLite database."""
+
+    def __init__(self, db_path='users.db'):
+        from db_migrations import ensure_schema
+
+        self.db_path = db_path
+        ensure_schema(db_path)
+        self._baselines = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+    def _baseline(self, disease):
+        baseline = self._baselines.get(disease)
+        if baseline is None:
+            baseline = self._baselines[disease] = _baseline(disease)
+        return baseline
+
+    def load_baselines(self, diseases):
+        """Load the diseases' baselines now, so observe() does no I/O."""
+        for disease in diseases:
+            self._baseline(disease)
+
+    def _stream(self, disease):
+        baseline = self._baseline(disease)
+        return FeatureStream(baseline["low"], baseline["high"], baseline["bins"])
+
+    def observe(self, disease, features):
+        """Add one raw input row to the disease's streaming statistics."""
+        x = np.array(features, dtype=float)
+        zero_missing = self._baseline(disease)["zero_missing"]
+        if zero_missing.size:
+            values = x[zero_missing]
+            x[zero_missing] = np.where(values == 0, np.nan, values)
+        with self._lock:
+            stream = self._pending.get(disease)
+            if stream is None:
+                stream = self._pending[disease] = self._stream(disease)
+            stream.update(x)
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+
+    @staticmethod
+    def _load_row(conn, disease, baseline, stream):
+        """Merge the stored totals into `stream`, unless they were kept on other baseline bins."""
+        row = conn.execute(
+            "SELECT baseline, observations, count, mean, m2, hist FROM drift_stats WHERE disease = ?", (disease,)
+        ).fetchone()
+        if row is None or row[0] != baseline["digest"]:
+            return
+        stream.merge(
+            row[1],
+            np.frombuffer(row[2], dtype=np.int64),
+            np.frombuffer(row[3], dtype=np.float64),
+            np.frombuffer(row[4], dtype=np.float64),
+            np.frombuffer(row[5], dtype=np.int64).reshape(stream.low.size, -1),
+        )
+
+    def flush(self):
+        """Merge the counts gathered since the last flush into the stored totals."""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            pending = {disease: stream for disease, stream in pending.items() if stream.rows}
+            if not pending:
+                return
+            try:
+                self._write(pending)
+            except BaseException:
+                # Put the counts back so the next flush retries them.
+                with self._lock:
+                    for disease, stream in pending.items():
+                        newer = self._pending.get(disease)
+                        if newer is not None:
+                            stream.merge(*newer.totals())
+                        self._pending[disease] = stream
+                raise
+
+    def _write(self, pending):
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for disease, stream in pending.items():
+                    baseline = self._baseline(disease)
+                    total = self._stream(disease)
+                    self._load_row(conn, disease, baseline, total)
+                    total.merge(*stream.totals())
+                    conn.execute(
+                        "INSERT OR REPLACE INTO drift_stats "
+                        "(disease, baseline, observations, count, mean, m2, hist, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (disease, baseline["digest"], total.rows, total.count.tobytes(), total.mean.tobytes(),
+                         total.m2.tobytes(), total.hist.tobytes(), time.time()),
+                    )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.close()
+
+    def snapshot(self, disease):
+        """Per-feature drift report: stored totals plus this process's unflushed counts."""
+        total = self._stream(disease)
+        baseline = self._baseline(disease)
+        conn = self._connect()
+        try:
+            self._load_row(conn, disease, baseline, total)
+        finally:
+            conn.close()
+        with self._lock:
+            pending = self._pending.get(disease)
+            if pending is not None:
+                rows, *arrays = pending.totals()
+                total.merge(rows, *(array.copy() for array in arrays))
+
+        report = {"disease": disease, "count": int(total.rows), "features": []}
+        if total.rows == 0:
+            return report
+        measured = np.maximum(total.count, 1)
+        std = np.sqrt(total.m2 / measured)
+        shares = total.hist / measured[:, None]
+        scores = psi(baseline["shares"], shares)
+        shift = np.divide(total.mean - baseline["mean"], baseline["std"],
+                          out=np.zeros_like(total.mean), where=baseline["std"] > 0)
+        for j, column in enumerate(baseline["columns"]):
+            if not total.count[j]:
+                continue
+            report["features"].append({
+                "feature": column,
+                "mean": float(total.mean[j]),
+                "std": float(std[j]),
+                "baseline_mean": float(baseline["mean"][j]),
+                "baseline_std": float(baseline["std"][j]),
+                "mean_shift_sd": float(shift[j]),
+                "psi": float(scores[j]),
+                "missing": float(1.0 - total.count[j] / total.rows),
+                "out_of_range": float(shares[j, 0] + shares[j, -1]),
+                "status": _status(scores[j], total.count[j]),
+            })
+        return report
+
+    def snapshots(self):
+        from inference import MODEL_ARTIFACTS
+
+        return {disease: self.snapshot(disease) for disease in MODEL_ARTIFACTS}
+
+
+_monitor = None
+_monitor_lock = threading.Lock()
+
+
+def _flush_periodically(monitor, interval):
+    while True:
+        time.sleep(interval)
+        try:
+            monitor.flush()
+        except Exception:
+            # flush() kept the counts; retry on the next tick.
+            logger.warning("Drift statistics flush to %s failed", monitor.db_path, exc_info=True)
+
+
+def _flush_at_exit(monitor):
+    try:
+        monitor.flush()
+    except Exception:
+        logger.warning("Final drift statistics flush to %s failed", monitor.db_path, exc_info=True)
+
+
+def start_drift_monitor(db_path='users.db', flush_seconds=FLUSH_SECONDS):
+    """Create this process's DriftMonitor once and hook it into inference.predict_with_proba.
+
+    Returns None, after logging why, when the monitor cannot start; the
+    service then runs unmonitored.
+    """
+    global _monitor
+    with _monitor_lock:
+        if _monitor is None:
+            import inference
+
+            try:
+                monitor = DriftMonitor(db_path)
+                monitor.load_baselines(inference.MODEL_ARTIFACTS)
+            except Exception:
+                logger.exception("Drift monitoring is off: could not start it on %s", db_path)
+                return None
+            threading.Thread(
+                target=_flush_periodically, args=(monitor, flush_seconds), name="drift-flush", daemon=True
+            ).start()
+            atexit.register(_flush_at_exit, monitor)
+            inference.INPUT_MONITOR = _monitor = monitor
+        return _monitor
+
+
+def get_drift_monitor():
+    """The monitor started in this process, or None (not started, or failed to)."""
+    return _monitor
@@ -0,0 +1,251 @@
+"""
+Per-prediction feature attributions for the disease models.
+
+Attributions are in units of the positive-class probability and satisfy
+base_value + sum(values) == predict_proba(x)[positive class]:
+
+- TreeExplainer: exact path-dependent TreeSHAP for tree ensembles (the heart
+  RandomForestClassifier), vectorized over every leaf of every tree. For a
+  leaf with value v whose path splits on the unique features U (zero
+  fraction z_j = product of cover ratios of the splits on j, one fraction
+  o_j = 1 if x follows all of them), feature i receives
+
+      v * (o_i - z_i) * integral_0^1 prod_{j in U, j != i} (z_j (1 - t) + o_j t) dt
+
+  which is the Shapley sum over subsets written with Beta-function weights.
+  The integrand is a polynomial of degree < n_features, so a
+  ceil(n_features / 2)-point Gauss-Legendre rule evaluates it exactly.
+  Paths are flattened once per model into per-path-length tables.
+- SVCExplainer: integrated gradients of the RBF SVC's Platt-scaled
+  probability, from the training mean (the zero vector after scaling) to
+  x, using the closed-form kernel gradient and Gauss-Legendre nodes along
+  the path. The result is rescaled so it sums exactly to the model's
+  predict_proba difference.
+
+explain() serves single rows through an LRU/TTL cache keyed on (model
+version, canonicalized features); explain_batch() handles many rows at once.
+"""
+import math
+import os
+import threading
+
+import numpy as np
+
+from inference import InferenceCache, canonical_features
+
+# Display names of each model's input features, in input order.
+FEATURE_LABELS = {
+    "diabetes": [
+        'Pregnancies', 'Glucose', 'Blood Pressure', 'Skin Thickness', 'Insulin', 'BMI',
+        'Diabetes Pedigree Function', 'Age',
+    ],
+    "heart": [
+        'Age', 'Sex', 'Chest Pain', 'Resting Blood Pressure', 'Cholesterol', 'Fasting Blood Sugar',
+        'Resting ECG', 'Max Heart Rate', 'Exercise Angina', 'ST Depression', 'ST Slope',
+        'Num. Vessels', 'Thalassemia',
+    ],
+    "parkinsons": [
+        'MDVP:Fo(Hz)', 'MDVP:Fhi(Hz)', 'MDVP:Flo(Hz)', 'Jitter(%)', 'Jitter(Abs)', 'MDVP:RAP',
+        'MDVP:PPQ', 'Jitter:DDP', 'Shimmer', 'Shimmer(dB)', 'Shimmer:APQ3', 'Shimmer:APQ5',
+        'MDVP:APQ', 'Shimmer:DDA', 'NHR', 'HNR', 'RPDE', 'DFA', 'Spread1', 'Spread2', 'D2', 'PPE',
+    ],
+}
+
+# Upper bound on the temporary (rows x leaves x slots x nodes) array, in
+# float64 elements, before explain_batch() splits the rows into chunks.
+BATCH_ELEMENTS = int(os.getenv("EXPLAIN_BATCH_ELEMENTS", str(8_000_000)))
+IG_STEPS = int(os.getenv("EXPLAIN_IG_STEPS", "32"))
+
+EXPLANATION_CACHE = InferenceCache(
+    max_entries=int(os.getenv("EXPLANATION_CACHE_SIZE", "2048")),
+    ttl_seconds=float(os.getenv("EXPLANATION_CACHE_TTL", "900")),
+)
+
+
+def _unit_gauss_legendre(points):
+    """Gauss-Legendre nodes and weights on [0, 1]."""
+    nodes, weights = np.polynomial.legendre.leggauss(points)
+    return (nodes + 1.0) / 2.0, weights / 2.0
+
+
+def _positive_index(model):
+    return int(np.flatnonzero(np.asarray(model.classes_) == 1)[0])
+
+
+class TreeExplainer:
+    """Exact TreeSHAP for a fitted forest of sklearn decision trees."""
+
+    def __init__(self, model):
+        positive = _positive_index(model)
+        self.n_features = int(model.n_features_in_)
+        trees = [estimator.tree_ for estimator in model.estimators_]
+        paths = [path for tree in trees for path in self._leaf_paths(tree, positive)]
+
+        # Leaves are grouped by their number n of unique path features: each
+        # group is a dense (leaves, n) table without padding, integrated with
+        # ceil(n / 2) nodes. The splits a path makes on one feature bound it to
+        # an interval, so x follows the path on that feature iff lower < x <= upper.
+        self.groups = []
+        entry_feature, lower, upper = [], [], []
+        self.base_value = 0.0
+        for n in sorted({len(features) for _, features in paths}):
+            members = [path for path in paths if len(path[1]) == n]
+            start = len(entry_feature)
+            values = np.array([value for value, _ in members]) / len(trees)
+            zero = np.empty((len(members), n))
+            for leaf, (_, features) in enumerate(members):
+                for slot, (feature, (zero_fraction, bounds)) in enumerate(features.items()):
+                    zero[leaf, slot] = zero_fraction
+                    entry_feature.append(feature)
+                    lower.append(bounds[0])
+                    upper.append(bounds[1])
+            nodes, weights = _unit_gauss_legendre(max(1, math.ceil(n / 2)))
+            self.groups.append((start, len(entry_feature), n, values, zero, nodes, weights))
+            self.base_value += float((values * zero.prod(axis=1)).sum())
+
+        self.entry_feature = np.asarray(entry_feature)
+        self.lower = np.asarray(lower)
+        self.upper = np.asarray(upper)
+        self.n_entries = len(entry_feature)
+        self.entry_to_feature = np.zeros((self.n_entries, self.n_features))
+        self.entry_to_feature[np.arange(self.n_entries), self.entry_feature] = 1.0
+        self.max_nodes = max(group[5].size for group in self.groups)
+
+    @staticmethod
+    def _leaf_paths(tree, positive):
+        """(positive-class leaf value, {feature: (zero fraction, (lower, upper))}) per leaf."""
+        left, right = tree.children_left, tree.children_right
+        cover = tree.weighted_n_node_samples
+        values = tree.value[:, 0, :]
+        stack = [(0, {})]
+        while stack:
+            node, features = stack.pop()
+            if left[node] == -1:
+                yield float(values[node, positive] / values[node].sum()), features
+                continue
+            feature, threshold = int(tree.feature[node]), float(tree.threshold[node])
+            zero_fraction, (low, high) = features.get(feature, (1.0, (-np.inf, np.inf)))
+            for child, bounds in ((left[node], (low, min(high, threshold))),
+                                  (right[node], (max(low, threshold), high))):
+                branch = dict(features)
+                branch[feature] = (zero_fraction * cover[child] / cover[node], bounds)
+                stack.append((child, branch))
+
+    def shap_values(self, rows):
+        """(m, n_features) SHAP values for already-scaled rows."""
+        rows = np.atleast_2d(np.asarray(rows, dtype=float))
+        chunk = max(1, BATCH_ELEMENTS // (self.n_entries * self.max_nodes))
+        return np.vstack([self._shap_chunk(rows[start:start + chunk]) for start in range(0, len(rows), chunk)])
+
+    def _shap_chunk(self, rows):
+        m = len(rows)
+        x = rows.astype(np.float32)[:, self.entry_feature]  # sklearn splits on float32 inputs
+        one = ((x > self.lower) & (x <= self.upper)).astype(float)  # (m, entries)
+        contributions = np.empty_like(one)
+        for start, stop, n, values, zero, nodes, weights in self.groups:
+            diff = one[:, start:stop].reshape(m, -1, n) - zero          # o - z, (m, leaves, n)
+            integrals = np.zeros_like(diff)
+            for t, w in zip(nodes, weights):
+                # z (1 - t) + o t, never zero for 0 < t < 1.
+                factors = zero + diff * t
+                integrals += (w * factors.prod(axis=2, keepdims=True)) / factors
+            contributions[:, start:stop] = (values[:, None] * diff * integrals).reshape(m, -1)
+        if m == 1:  # cheaper than the dense product for the single-row path
+            return np.bincount(self.entry_feature, weights=contributions[0], minlength=self.n_features)[None]
+        return contributions @ self.entry_to_feature
+
+
+class SVCExplainer:
+    """Integrated gradients for a binary RBF-kernel SVC with Platt probabilities."""
+
+    def __init__(self, model, steps=IG_STEPS):
+        self.model = model
+        self.support = np.asarray(model.support_vectors_, dtype=float)
+        self.coef = np.asarray(model.dual_coef_[0], dtype=float)
+        self.intercept = float(model.intercept_[0])
+        self.gamma = float(model._gamma)
+        self.platt_a, self.platt_b = float(model.probA_[0]), float(model.probB_[0])
+        self.positive = _positive_index(model)
+        self.n_features = self.support.shape[1]
+        self.nodes, self.node_weights = _unit_gauss_legendre(steps)
+        self.baseline = np.zeros(self.n_features)
+        self.base_value = float(model.predict_proba(self.baseline[None])[0, self.positive])
+
+    def shap_values(self, rows):
+        """(m, n_features) attributions for already-scaled rows."""
+        rows = np.atleast_2d(np.asarray(rows, dtype=float))
+        per_row = self.nodes.size * (self.support.shape[0] + self.n_features)
+        chunk = max(1, BATCH_ELEMENTS // per_row)
+        return np.vstack([self._ig_chunk(rows[start:start + chunk]) for start in range(0, len(rows), chunk)])
+
+    def _ig_chunk(self, rows):
+        delta = rows - self.baseline                                        # (m, d)
+        points = self.baseline + self.nodes[None, :, None] * delta[:, None, :]  # (m, q, d)
+        sq_dist = ((points[:, :, None, :] - self.support) ** 2).sum(axis=-1)   # (m, q, s)
+        weighted = np.exp(-self.gamma * sq_dist) * self.coef
+        decision = weighted.sum(axis=-1) + self.intercept                   # (m, q)
+        grad_decision = -2.0 * self.gamma * (weighted.sum(axis=-1)[..., None] * points - weighted @ self.support)
+        # Positive-class Platt probability: 1 / (1 + exp(A f - B)).
+        proba = 1.0 / (1.0 + np.exp(self.platt_a * decision - self.platt_b))
+        grad_proba = (-self.platt_a * proba * (1.0 - proba))[..., None] * grad_decision
+        attributions = delta * np.einsum("q,mqd->md", self.node_weights, grad_proba)
+
+        # Make the attributions add up to the model's own probability change.
+        target = self.model.predict_proba(rows)[:, self.positive] - self.base_value
+        total = attributions.sum(axis=1)
+        scale = np.divide(target, total, out=np.ones_like(total), where=np.abs(total) > 1e-12)
+        return attributions * scale[:, None]
+
+
+def _build_explainer(model):
+    if hasattr(model, "estimators_") and all(hasattr(tree, "tree_") for tree in model.estimators_):
+        return TreeExplainer(model)
+    if getattr(model, "kernel", None) == "rbf" and hasattr(model, "probA_") and len(model.classes_) == 2:
+        return SVCExplainer(model)
+    return None
+
+
+_explainers = {}
+_explainers_lock = threading.Lock()
+
+
+def get_explainer(bundle):
+    """The explainer for a versioned bundle (built once per model), or None if unsupported."""
+    if bundle.version is None:
+        return None
+    with _explainers_lock:
+        if bundle.version not in _explainers:
+            _explainers[bundle.version] = _build_explainer(bundle.model)
+        return _explainers[bundle.version]
+
+
+def explain_batch(bundle, rows):
+    """(base_value, (m, n_features) attributions) for raw feature rows, or None."""
+    explainer = get_explainer(bundle)
+    if explainer is None:
+        return None
+    return explainer.base_value, explainer.shap_values(bundle.transform(rows))
+
+
+def explain(bundle, features, cache=EXPLANATION_CACHE):
+    """(base_value, attributions tuple) for one raw feature vector, or None if unsupported."""
+    key = None
+    if bundle.version is not None and cache is not None:
+        key = (bundle.version, canonical_features(features))
+        found, value = cache.get(key)
+        if found:
+            return value
+    result = explain_batch(bundle, [features])
+    if result is None:
+        return None
+    base_value, values = result
+    value = (base_value, tuple(values[0].tolist()))
+    if key is not None:
+        cache.put(key, value)
+    return value
+
+
+def top_attributions(labels, values, limit=10):
+    """The `limit` largest attributions by magnitude as (labels, values in percentage points)."""
+    order = np.argsort(np.abs(values))[::-1][:limit]
+    return [labels[i] for i in order], [round(float(values[i]) * 100.0, 2) for i in order]
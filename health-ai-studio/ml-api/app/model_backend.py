@@ -0,0 +1,143 @@
+﻿from __future__ import annotations
+
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# The trained artifacts live at the repository root next to train_models.py.
+MODEL_DIR = Path(os.getenv("ML_MODEL_DIR", Path(__file__).resolve().parents[3]))
+
+ARTIFACTS: Dict[str, Tuple[str, str]] = {
+    "diabetes": ("diabetes_model.sav", "diabetes_scaler.pkl"),
+    "heart": ("heart_disease_model.sav", "heart_disease_scaler.pkl"),
+    "parkinsons": ("parkinsons_model.sav", "parkinsons_scaler.pkl"),
+}
+
+# camelCase `inputData` keys -> training column names (see train_models.py).
+# Several keys have aliases so the Express backend and direct callers can use
+# either the frontend names or the dataset abbreviations.
+INPUT_COLUMNS: Dict[str, Dict[str, str]] = {
+    "diabetes": {
+        "pregnancies": "Pregnancies",
+        "glucose": "Glucose",
+        "bloodPressure": "BloodPressure",
+        "skinThickness": "SkinThickness",
+        "insulin": "Insulin",
+        "bmi": "BMI",
+        "diabetesPedigree": "DiabetesPedigreeFunction",
+        "diabetesPedigreeFunction": "DiabetesPedigreeFunction",
+        "age": "Age",
+    },
+    "heart": {
+        "age": "age",
+        "sex": "sex",
+        "chestPain": "cp",
+        "cp": "cp",
+        "restingBP": "trestbps",
+        "cholesterol": "chol",
+        "fastingBloodSugar": "fbs",
+        "restingECG": "restecg",
+        "maxHeartRate": "thalach",
+        "exerciseAngina": "exang",
+        "stDepression": "oldpeak",
+        "oldpeak": "oldpeak",
+        "slope": "slope",
+        "majorVessels": "ca",
+        "thal": "thal",
+    },
+    "parkinsons": {
+        "fo": "MDVP:Fo(Hz)",
+        "fhi": "MDVP:Fhi(Hz)",
+        "flo": "MDVP:Flo(Hz)",
+        "jitter": "MDVP:Jitter(%)",
+        "jitterAbs": "MDVP:Jitter(Abs)",
+        "rap": "MDVP:RAP",
+        "ppq": "MDVP:PPQ",
+        "ddp": "Jitter:DDP",
+        "shimmer": "MDVP:Shimmer",
+        "shimmerDb": "MDVP:Shimmer(dB)",
+        "apq3": "Shimmer:APQ3",
+        "apq5": "Shimmer:APQ5",
+        "apq": "MDVP:APQ",
+        "dda": "Shimmer:DDA",
+        "nhr": "NHR",
+        "hnr": "HNR",
+        "rpde": "RPDE",
+        "dfa": "DFA",
+        "spread1": "spread1",
+        "spread2": "spread2",
+        "d2": "D2",
+        "ppe": "PPE",
+    },
+}
+
+
+class ModelPredictor:
+    """Scaler + classifier inference over a fixed training column order.
+
+    The key -> column index map and the scaler statistics are resolved once,
+    so a request only fills a preallocated row and runs `predict_proba`.
+    Features the client does not send are imputed with the training mean,
+    which standardizes to zero and keeps them neutral.
+    """
+
+    def __init__(self, model, scaler, input_columns: Dict[str, str]) -> None:
+        columns = [str(name) for name in scaler.feature_names_in_]
+        self._model = model
+        self._mean = np.asarray(scaler.mean_, dtype=float)
+        self._scale = np.asarray(scaler.scale_, dtype=float)
+        self._index = {key: columns.index(column) for key, column in input_columns.items()}
+
+        # Report attributions under the first camelCase key of each column.
+        self._names = list(columns)
+        for key, column in reversed(list(input_columns.items())):
+            self._names[columns.index(column)] = key
+
+        self._positive = int(np.flatnonzero(model.classes_ == 1)[0])
+        importances = getattr(model, "feature_importances_", None)
+        self._weights = np.asarray(importances, dtype=float) if importances is not None else np.ones(len(columns))
+
+    def score(self, input_data: Dict[str, float]) -> Tuple[float, float, List[Tuple[str, float]]]:
+        row = self._mean.copy()
+        for key, value in input_data.items():
+            idx = self._index.get(key)
+            if idx is not None:
+                row[idx] = value
+
+        z = (row - self._mean) / self._scale
+        proba = self._model.predict_proba(z.reshape(1, -1))[0]
+        score = float(proba[self._positive]) * 100.0
+        confidence = float(proba.max()) * 100.0
+        return score, confidence, self._top_features(z)
+
+    def _top_features(self, z: np.ndarray) -> List[Tuple[str, float]]:
+        contributions = np.abs(z) * self._weights
+        order = np.argsort(contributions)[::-1][:6]
+        total = float(contributions[order].sum())
+        if total <= 0.0:
+            return [("baseline", 1.0)]
+
+        return [
+            (self._names[i], round(float(contributions[i]) / total, 3))
+            for i in order
+            if contributions[i] > 0.0
+        ]
+
+
+def load_model_predictor(disease: str) -> Optional[ModelPredictor]:
+    model_file, scaler_file = ARTIFACTS[disease]
+    try:
+        with open(MODEL_DIR / model_file, "rb") as fh:
+            model = pickle.load(fh)
+        with open(MODEL_DIR / scaler_file, "rb") as fh:
+            scaler = pickle.load(fh)
+        return ModelPredictor(model, scaler, INPUT_COLUMNS[disease])
+    except Exception as exc:  # noqa: BLE001 - any artifact problem falls back to the heuristic
+        logger.warning("Model backend unavailable for %s (%s); using heuristic scores.", disease, exc)
+        return None
@@ -1,8 +1,15 @@
 ﻿from __future__ import annotations
 
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
 from typing import Dict, List, Tuple
 import numpy as np
-from app.schemas import PredictionRequest, PredictionResponse, FeatureImportanceItem
+import orjson
+from app.model_backend import ModelPredictor, load_model_predictor
+from app.schemas import (
+    FeatureImportanceItem, PredictionRequest, PredictionResponse, ScreeningRequest, ScreeningResponse,
+)
+from app.text_catalogue import EXPLANATIONS, RECOMMENDATIONS, response_fragment
 
 
 def _risk_bucket(score: float) -> str:
@@ -17,7 +24,7 @@ def _normalize_inputs(input_data: Dict[str, float]) -> Dict[str, float]:
     return {k: float(v) for k, v in input_data.items() if v is not None}
 
 
-def _top_features(input_data: Dict[str, float], weights: Dict[str, float]) -> List[FeatureImportanceItem]:
+def _top_features(input_data: Dict[str, float], weights: Dict[str, float]) -> List[Tuple[str, float]]:
     items: List[Tuple[str, float]] = []
     for feature, value in input_data.items():
         weight = abs(weights.get(feature, 0.08))
@@ -31,10 +38,7 @@ def _top_features(input_data: Dict[str, float], weights: Dict[str, float]) -> Li
     top = items[:6]
     total = sum(val for _, val in top) or 1.0
 
-    return [
-        FeatureImportanceItem(feature=name, importance=round(val / total, 3))
-        for name, val in top
-    ]
+    return [(name, round(val / total, 3)) for name, val in top]
 
 
 def _score_from_inputs(input_data: Dict[str, float], weights: Dict[str, float], bias: float) -> float:
@@ -58,7 +62,7 @@ def _confidence_from_score(score: float) -> float:
 def _build_response(
     score: float,
     confidence: float,
-    feature_importance: List[FeatureImportanceItem],
+    feature_importance: List[Tuple[str, float]],
     explanation: str,
     recommendations: List[str],
 ) -> PredictionResponse:
@@ -66,86 +70,149 @@ def _build_response(
         riskPercentage=round(score, 2),
         confidenceScore=round(confidence, 2),
         riskCategory=_risk_bucket(score),
-        featureImportance=feature_importance,
+        featureImportance=[FeatureImportanceItem(feature=name, importance=value) for name, value in feature_importance],
         explanation=explanation,
         recommendations=recommendations,
     )
 
 
-def predict_diabetes(payload: PredictionRequest) -> PredictionResponse:
+_HEURISTIC_WEIGHTS: Dict[str, Tuple[Dict[str, float], float]] = {
+    "diabetes": (
+        {
+            "glucose": 0.42,
+            "bmi": 0.25,
+            "age": 0.12,
+            "bloodPressure": 0.1,
+            "pregnancies": 0.06,
+            "insulin": 0.05,
+        },
+        28.0,
+    ),
+    "heart": (
+        {
+            "cholesterol": 0.34,
+            "restingBP": 0.24,
+            "age": 0.2,
+            "maxHeartRate": -0.13,
+            "exerciseAngina": 0.16,
+        },
+        26.0,
+    ),
+    "parkinsons": (
+        {
+            "jitter": 0.33,
+            "shimmer": 0.26,
+            "hnr": -0.21,
+            "rpde": 0.11,
+            "ppe": 0.19,
+        },
+        22.0,
+    ),
+}
+
+
+def _backend_for(disease: str) -> str:
+    # PREDICTOR_BACKEND sets the default, PREDICTOR_BACKEND_<DISEASE> overrides it.
+    default = os.getenv("PREDICTOR_BACKEND", "heuristic")
+    return os.getenv(f"PREDICTOR_BACKEND_{disease.upper()}", default).strip().lower()
+
+
+def _load_model_predictors() -> Dict[str, ModelPredictor]:
+    predictors: Dict[str, ModelPredictor] = {}
+    for disease in _HEURISTIC_WEIGHTS:
+        if _backend_for(disease) != "model":
+            continue
+        predictor = load_model_predictor(disease)
+        if predictor is not None:
+            predictors[disease] = predictor
+    return predictors
+
+
+_MODEL_PREDICTORS = _load_model_predictors()
+
+
+def predictor_backends() -> Dict[str, str]:
+    return {disease: ("model" if disease in _MODEL_PREDICTORS else "heuristic") for disease in _HEURISTIC_WEIGHTS}
+
+
+def _heuristic_score(disease: str, inputs: Dict[str, float]) -> Tuple[float, float, List[Tuple[str, float]]]:
+    weights, bias = _HEURISTIC_WEIGHTS[disease]
+    score = _score_from_inputs(inputs, weights, bias=bias)
+    return score, _confidence_from_score(score), _top_features(inputs, weights)
+
+
+def _score(disease: str, payload: PredictionRequest) -> Tuple[float, float, List[Tuple[str, float]]]:
     inputs = _normalize_inputs(payload.inputData)
-    weights = {
-        "glucose": 0.42,
-        "bmi": 0.25,
-        "age": 0.12,
-        "bloodPressure": 0.1,
-        "pregnancies": 0.06,
-        "insulin": 0.05,
-    }
-    score = _score_from_inputs(inputs, weights, bias=28.0)
-    confidence = _confidence_from_score(score)
-    features = _top_features(inputs, weights)
+    predictor = _MODEL_PREDICTORS.get(disease)
+    if predictor is not None:
+        return predictor.score(inputs)
+    return _heuristic_score(disease, inputs)
 
+
+def _predict(disease: str, payload: PredictionRequest) -> PredictionResponse:
+    score, confidence, features = _score(disease, payload)
     return _build_response(
         score,
         confidence,
         features,
-        explanation="Glucose and BMI strongly influenced the estimated diabetes risk in this inference.",
-        recommendations=[
-            "Track fasting glucose and HbA1c regularly with your clinician.",
-            "Prioritize consistent exercise and balanced carbohydrate intake.",
-            "Review blood pressure, weight, and sleep quality over time.",
-        ],
+        explanation=EXPLANATIONS[disease],
+        recommendations=RECOMMENDATIONS[disease],
     )
 
 
-def predict_heart(payload: PredictionRequest) -> PredictionResponse:
-    inputs = _normalize_inputs(payload.inputData)
-    weights = {
-        "cholesterol": 0.34,
-        "restingBP": 0.24,
-        "age": 0.2,
-        "maxHeartRate": -0.13,
-        "exerciseAngina": 0.16,
-    }
-    score = _score_from_inputs(inputs, weights, bias=26.0)
-    confidence = _confidence_from_score(score)
-    features = _top_features(inputs, weights)
+def encode_prediction(disease: str, payload: PredictionRequest, compact: bool = False) -> bytes:
+    # Only the numeric head is encoded per request; the text tail is a
+    # pre-encoded fragment per (disease, risk bucket, compact).
+    score, confidence, features = _score(disease, payload)
+    head = orjson.dumps({
+        "riskPercentage": round(score, 2),
+        "confidenceScore": round(confidence, 2),
+        "featureImportance": [{"feature": name, "importance": value} for name, value in features],
+    })
+    return head[:-1] + response_fragment(disease, _risk_bucket(score), compact)
 
-    return _build_response(
-        score,
-        confidence,
-        features,
-        explanation="Cholesterol, resting blood pressure, and age had the highest weight in this cardiovascular risk estimate.",
-        recommendations=[
-            "Plan a physician-reviewed lipid and blood pressure management program.",
-            "Reduce sodium intake and maintain regular aerobic activity.",
-            "Monitor chest discomfort or exertion symptoms and seek urgent care when required.",
-        ],
-    )
+
+def predict_diabetes(payload: PredictionRequest) -> PredictionResponse:
+    return _predict("diabetes", payload)
+
+
+def predict_heart(payload: PredictionRequest) -> PredictionResponse:
+    return _predict("heart", payload)
 
 
 def predict_parkinsons(payload: PredictionRequest) -> PredictionResponse:
-    inputs = _normalize_inputs(payload.inputData)
-    weights = {
-        "jitter": 0.33,
-        "shimmer": 0.26,
-        "hnr": -0.21,
-        "rpde": 0.11,
-        "ppe": 0.19,
+    return _predict("parkinsons", payload)
+
+
+# Combined screening fans the requested diseases out on this pool, so a call
+# takes as long as its slowest model rather than the sum of all of them.
+_SCREENING_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("ML_API_SCREENING_WORKERS", "3")), thread_name_prefix="screening"
+)
+
+
+def screening_payloads(payload: ScreeningRequest) -> Dict[str, PredictionRequest]:
+    return {
+        disease: PredictionRequest(diseaseType=disease, patientId=payload.patientId, inputData=payload.inputData)
+        for disease in dict.fromkeys(payload.diseases)
     }
-    score = _score_from_inputs(inputs, weights, bias=22.0)
-    confidence = _confidence_from_score(score)
-    features = _top_features(inputs, weights)
 
-    return _build_response(
-        score,
-        confidence,
-        features,
-        explanation="Voice instability markers (jitter/shimmer) and entropy features were dominant contributors in this neurological risk estimate.",
-        recommendations=[
-            "Discuss findings with a neurologist and consider follow-up speech analysis.",
-            "Track any changes in voice, gait, tremor, or fine motor control.",
-            "Maintain structured exercise, hydration, and sleep routines.",
-        ],
-    )
+
+def merge_screening(bodies: Dict[str, bytes]) -> bytes:
+    # Splice pre-encoded per-disease bodies into {"results": {...}}.
+    return b'{"results":{' + b",".join(orjson.dumps(disease) + b":" + body for disease, body in bodies.items()) + b"}}"
+
+
+def predict_screening(payload: ScreeningRequest, executor: Executor | None = None) -> ScreeningResponse:
+    executor = executor or _SCREENING_EXECUTOR
+    futures = {disease: executor.submit(_predict, disease, request) for disease, request in screening_payloads(payload).items()}
+    return ScreeningResponse(results={disease: future.result() for disease, future in futures.items()})
+
+
+def encode_screening(payload: ScreeningRequest, compact: bool = False, executor: Executor | None = None) -> bytes:
+    executor = executor or _SCREENING_EXECUTOR
+    futures = {
+        disease: executor.submit(encode_prediction, disease, request, compact)
+        for disease, request in screening_payloads(payload).items()
+    }
+    return merge_screening({disease: future.result() for disease, future in futures.items()})
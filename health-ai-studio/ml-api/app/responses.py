@@ -0,0 +1,17 @@
+﻿from typing import Any
+
+import orjson
+from starlette.responses import JSONResponse
+
+
+class OrjsonResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    Content that is already encoded (`bytes`) is sent as-is, so handlers can
+    serialize inside the inference executor and keep the event loop free.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
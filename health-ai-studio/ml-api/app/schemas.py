@@ -1,4 +1,4 @@
-﻿from typing import Dict, List
+﻿from typing import Dict, List, Literal
 from pydantic import BaseModel, Field
 
 
@@ -20,3 +20,31 @@ class PredictionResponse(BaseModel):
     featureImportance: List[FeatureImportanceItem]
     explanation: str
     recommendations: List[str]
+
+
+class CompactPredictionResponse(BaseModel):
+    # `?compact=true`: text replaced by IDs from GET /catalogue/text.
+    riskPercentage: float
+    confidenceScore: float
+    riskCategory: str
+    featureImportance: List[FeatureImportanceItem]
+    explanationId: str
+    recommendationIds: List[str]
+
+
+Disease = Literal["diabetes", "heart", "parkinsons"]
+
+
+class ScreeningRequest(BaseModel):
+    # One inputData for every disease: shared keys such as `age` are sent once.
+    patientId: str | None = None
+    inputData: Dict[str, float] = Field(default_factory=dict)
+    diseases: List[Disease] = Field(default_factory=lambda: ["diabetes", "heart", "parkinsons"])
+
+
+class ScreeningResponse(BaseModel):
+    results: Dict[str, PredictionResponse]
+
+
+class CompactScreeningResponse(BaseModel):
+    results: Dict[str, CompactPredictionResponse]
@@ -0,0 +1,83 @@
+﻿from __future__ import annotations
+
+import hashlib
+from typing import Dict, List, Tuple
+
+import orjson
+
+# Explanation and recommendation text is fixed per disease, so it is encoded
+# once here instead of on every response. Text IDs are stable: append new
+# entries rather than renumbering, since compact clients cache the catalogue.
+EXPLANATIONS: Dict[str, str] = {
+    "diabetes": "Glucose and BMI strongly influenced the estimated diabetes risk in this inference.",
+    "heart": "Cholesterol, resting blood pressure, and age had the highest weight in this cardiovascular risk estimate.",
+    "parkinsons": "Voice instability markers (jitter/shimmer) and entropy features were dominant contributors in this neurological risk estimate.",
+}
+
+RECOMMENDATIONS: Dict[str, List[str]] = {
+    "diabetes": [
+        "Track fasting glucose and HbA1c regularly with your clinician.",
+        "Prioritize consistent exercise and balanced carbohydrate intake.",
+        "Review blood pressure, weight, and sleep quality over time.",
+    ],
+    "heart": [
+        "Plan a physician-reviewed lipid and blood pressure management program.",
+        "Reduce sodium intake and maintain regular aerobic activity.",
+        "Monitor chest discomfort or exertion symptoms and seek urgent care when required.",
+    ],
+    "parkinsons": [
+        "Discuss findings with a neurologist and consider follow-up speech analysis.",
+        "Track any changes in voice, gait, tremor, or fine motor control.",
+        "Maintain structured exercise, hydration, and sleep routines.",
+    ],
+}
+
+RISK_BUCKETS: Tuple[str, ...] = ("Low", "Moderate", "High")
+
+
+def _explanation_id(disease: str) -> str:
+    return f"{disease}.explanation"
+
+
+def _recommendation_ids(disease: str) -> List[str]:
+    return [f"{disease}.recommendation.{n}" for n in range(1, len(RECOMMENDATIONS[disease]) + 1)]
+
+
+def _build_catalogue() -> Dict[str, str]:
+    catalogue: Dict[str, str] = {}
+    for disease, explanation in EXPLANATIONS.items():
+        catalogue[_explanation_id(disease)] = explanation
+        catalogue.update(zip(_recommendation_ids(disease), RECOMMENDATIONS[disease]))
+    return catalogue
+
+
+def _encode_tail(fields: Dict[str, object]) -> bytes:
+    # `{"a":1}` -> `,"a":1}` so it can be spliced onto an encoded object head.
+    return b"," + orjson.dumps(fields)[1:]
+
+
+def _build_fragments() -> Dict[Tuple[str, str, bool], bytes]:
+    fragments: Dict[Tuple[str, str, bool], bytes] = {}
+    for disease in EXPLANATIONS:
+        for bucket in RISK_BUCKETS:
+            fragments[(disease, bucket, False)] = _encode_tail({
+                "riskCategory": bucket,
+                "explanation": EXPLANATIONS[disease],
+                "recommendations": RECOMMENDATIONS[disease],
+            })
+            fragments[(disease, bucket, True)] = _encode_tail({
+                "riskCategory": bucket,
+                "explanationId": _explanation_id(disease),
+                "recommendationIds": _recommendation_ids(disease),
+            })
+    return fragments
+
+
+_FRAGMENTS = _build_fragments()
+
+CATALOGUE_BODY: bytes = orjson.dumps({"texts": _build_catalogue()}, option=orjson.OPT_SORT_KEYS)
+CATALOGUE_ETAG: str = '"' + hashlib.sha256(CATALOGUE_BODY).hexdigest()[:16] + '"'
+
+
+def response_fragment(disease: str, bucket: str, compact: bool = False) -> bytes:
+    return _FRAGMENTS[(disease, bucket, compact)]
@@ -0,0 +1,77 @@
+﻿"""
+Latency benchmark: heuristic vs model-backed predictors.
+
+Runs every disease through both backends in-process and prints per-call
+latency percentiles for the full `predict_*` path (input normalization,
+scoring and `PredictionResponse` construction), then compares response
+encoding: Pydantic JSON vs pre-encoded text fragments vs compact text IDs.
+
+Usage: python bench_predictors.py [iterations]
+"""
+import statistics
+import sys
+import time
+
+from app import predictors
+from app.model_backend import load_model_predictor
+from app.schemas import PredictionRequest
+
+SAMPLE_INPUTS = {
+    "diabetes": {"pregnancies": 1, "glucose": 120, "bloodPressure": 80, "bmi": 26.5, "age": 35},
+    "heart": {"age": 52, "cholesterol": 210, "restingBP": 130, "maxHeartRate": 150, "exerciseAngina": 0},
+    "parkinsons": {"jitter": 0.02, "shimmer": 0.04, "hnr": 22.5, "rpde": 0.41, "ppe": 0.21},
+}
+
+
+def _time_calls(disease, payload, iterations, call=None):
+    call = call or (lambda: predictors._predict(disease, payload))
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - start) * 1e6)
+    samples.sort()
+    return {
+        "mean": statistics.fmean(samples),
+        "p50": samples[len(samples) // 2],
+        "p99": samples[int(len(samples) * 0.99) - 1],
+    }
+
+
+def main(iterations=2000):
+    model_predictors = {disease: load_model_predictor(disease) for disease in SAMPLE_INPUTS}
+
+    print(f"{'disease':<12}{'backend':<11}{'mean us':>10}{'p50 us':>10}{'p99 us':>10}")
+    for disease, inputs in SAMPLE_INPUTS.items():
+        payload = PredictionRequest(diseaseType=disease, inputData=inputs)
+        for backend in ("heuristic", "model"):
+            if backend == "model":
+                if model_predictors[disease] is None:
+                    print(f"{disease:<12}{backend:<11}{'artifact missing':>30}")
+                    continue
+                predictors._MODEL_PREDICTORS = {disease: model_predictors[disease]}
+            else:
+                predictors._MODEL_PREDICTORS = {}
+
+            _time_calls(disease, payload, 50)  # warm caches and sklearn's first-call paths
+            stats = _time_calls(disease, payload, iterations)
+            print(f"{disease:<12}{backend:<11}{stats['mean']:>10.1f}{stats['p50']:>10.1f}{stats['p99']:>10.1f}")
+
+    predictors._MODEL_PREDICTORS = {}
+    encoders = {
+        "pydantic": lambda d, p: predictors._predict(d, p).model_dump_json().encode(),
+        "fragments": lambda d, p: predictors.encode_prediction(d, p),
+        "compact": lambda d, p: predictors.encode_prediction(d, p, compact=True),
+    }
+    print()
+    print(f"{'disease':<12}{'encoding':<11}{'mean us':>10}{'p50 us':>10}{'bytes':>10}")
+    for disease, inputs in SAMPLE_INPUTS.items():
+        payload = PredictionRequest(diseaseType=disease, inputData=inputs)
+        for name, encode in encoders.items():
+            stats = _time_calls(disease, payload, iterations, call=lambda: encode(disease, payload))
+            size = len(encode(disease, payload))
+            print(f"{disease:<12}{name:<11}{stats['mean']:>10.1f}{stats['p50']:>10.1f}{size:>10}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
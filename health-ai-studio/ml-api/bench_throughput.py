@@ -0,0 +1,111 @@
+﻿"""
+Requests-per-second benchmark: standard vs high-throughput ML API mode.
+
+Starts `uvicorn main:app --workers 1` once per mode and drives it with a
+keep-alive asyncio load generator (no third-party client, so the generator
+stays cheaper than the server it measures).
+
+Usage: python bench_throughput.py [seconds] [connections]
+"""
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+ENDPOINTS = {
+    "/predict/diabetes": {"diseaseType": "diabetes", "inputData": {"glucose": 120, "bmi": 26.5, "age": 35, "bloodPressure": 80, "pregnancies": 1}},
+    "/predict/heart": {"diseaseType": "heart", "inputData": {"age": 52, "cholesterol": 210, "restingBP": 130, "maxHeartRate": 150, "exerciseAngina": 0}},
+    "/predict/parkinsons": {"diseaseType": "parkinsons", "inputData": {"jitter": 0.02, "shimmer": 0.04, "hnr": 22.5, "rpde": 0.41, "ppe": 0.21}},
+}
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _request_bytes(path, payload):
+    body = json.dumps(payload).encode()
+    head = (
+        f"POST {path} HTTP/1.1\r\nHost: 127.0.0.1\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n"
+    ).encode()
+    return head + body
+
+
+async def _connection(port, request, deadline, counts):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        while time.perf_counter() < deadline:
+            writer.write(request)
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            await reader.readexactly(length)
+            counts["ok" if head.startswith(b"HTTP/1.1 200") else "error"] += 1
+    finally:
+        writer.close()
+
+
+async def _drive(port, path, payload, seconds, connections):
+    request = _request_bytes(path, payload)
+    counts = {"ok": 0, "error": 0}
+    start = time.perf_counter()
+    deadline = start + seconds
+    await asyncio.gather(*(_connection(port, request, deadline, counts) for _ in range(connections)))
+    return counts["ok"] / (time.perf_counter() - start), counts["error"]
+
+
+def _wait_ready(port, timeout=30.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("uvicorn did not start")
+
+
+def run_mode(high_throughput, seconds, connections):
+    port = _free_port()
+    env = dict(os.environ, ML_API_HIGH_THROUGHPUT="1" if high_throughput else "0")
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--workers", "1", "--port", str(port), "--log-level", "warning", "--no-access-log"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env,
+    )
+    try:
+        _wait_ready(port)
+        results = {}
+        for path, payload in ENDPOINTS.items():
+            asyncio.run(_drive(port, path, payload, 1.0, connections))  # warm-up
+            results[path] = asyncio.run(_drive(port, path, payload, seconds, connections))
+        return results
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main(seconds=5.0, connections=32):
+    backend = os.getenv("PREDICTOR_BACKEND", "heuristic")
+    print(f"backend={backend} workers=1 connections={connections} duration={seconds:.0f}s per endpoint")
+    standard = run_mode(False, seconds, connections)
+    fast = run_mode(True, seconds, connections)
+
+    print(f"{'endpoint':<22}{'standard rps':>14}{'high-throughput rps':>22}{'speedup':>10}")
+    for path in ENDPOINTS:
+        before, before_errors = standard[path]
+        after, after_errors = fast[path]
+        errors = f"  ({before_errors + after_errors} errors)" if before_errors or after_errors else ""
+        print(f"{path:<22}{before:>14.0f}{after:>22.0f}{after / before:>9.2f}x{errors}")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 5.0, int(sys.argv[2]) if len(sys.argv) > 2 else 32)
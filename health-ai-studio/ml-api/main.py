@@ -1,25 +1,126 @@
-﻿from fastapi import FastAPI
-from app.schemas import PredictionRequest, PredictionResponse
-from app.predictors import predict_diabetes, predict_heart, predict_parkinsons
+﻿import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 
-app = FastAPI(title="Health AI Studio ML API", version="1.0.0")
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
+from app.schemas import (
+    CompactPredictionResponse, CompactScreeningResponse, PredictionRequest, PredictionResponse, ScreeningRequest,
+    ScreeningResponse,
+)
+from app.predictors import (
+    encode_prediction, encode_screening, merge_screening, predict_diabetes, predict_heart, predict_parkinsons,
+    predict_screening, predictor_backends, screening_payloads,
+)
+from app.responses import OrjsonResponse
+from app.text_catalogue import CATALOGUE_BODY, CATALOGUE_ETAG
+
+# High-throughput mode: async handlers that run scoring + orjson encoding on a
+# sized executor and return pre-encoded bytes, which skips FastAPI's second
+# `response_model` validation/serialization pass.
+#
+# POST /predict/screening scores several diseases from one inputData, with the
+# diseases running concurrently (on the inference executor in high-throughput
+# mode, otherwise on the predictors' screening pool).
+#
+# In either mode `?compact=true` replaces explanation/recommendation text with
+# stable IDs; clients resolve them via the cacheable GET /catalogue/text.
+# The routes declare both body shapes so the OpenAPI schema covers that mode.
+HIGH_THROUGHPUT = os.getenv("ML_API_HIGH_THROUGHPUT", "0") == "1"
+INFERENCE_WORKERS = int(os.getenv("ML_API_INFERENCE_WORKERS", str(os.cpu_count() or 1)))
+
+_executor: ThreadPoolExecutor | None = None
+
+PredictionBody = PredictionResponse | CompactPredictionResponse
+ScreeningBody = ScreeningResponse | CompactScreeningResponse
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    global _executor
+    if HIGH_THROUGHPUT:
+        _executor = ThreadPoolExecutor(max_workers=INFERENCE_WORKERS, thread_name_prefix="inference")
+    try:
+        yield
+    finally:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+app = FastAPI(title="Health AI Studio ML API", version="1.0.0", lifespan=lifespan)
 
 
 @app.get("/health")
 def health_check() -> dict:
-    return {"status": "ok", "service": "health-ai-studio-ml-api"}
+    return {
+        "status": "ok",
+        "service": "health-ai-studio-ml-api",
+        "backends": predictor_backends(),
+        "mode": "high-throughput" if HIGH_THROUGHPUT else "standard",
+    }
+
+
+@app.get("/catalogue/text")
+def text_catalogue(request: Request) -> Response:
+    headers = {"ETag": CATALOGUE_ETAG, "Cache-Control": "public, max-age=86400"}
+    if request.headers.get("if-none-match") == CATALOGUE_ETAG:
+        return Response(status_code=304, headers=headers)
+    return OrjsonResponse(CATALOGUE_BODY, headers=headers)
+
+
+async def _offload(disease: str, payload: PredictionRequest, compact: bool) -> OrjsonResponse:
+    body = await asyncio.get_running_loop().run_in_executor(_executor, encode_prediction, disease, payload, compact)
+    return OrjsonResponse(body)
+
+
+if HIGH_THROUGHPUT:
+
+    @app.post("/predict/diabetes", response_model=PredictionBody, response_class=OrjsonResponse)
+    async def diabetes_prediction(payload: PredictionRequest, compact: bool = False) -> OrjsonResponse:
+        return await _offload("diabetes", payload, compact)
+
+    @app.post("/predict/heart", response_model=PredictionBody, response_class=OrjsonResponse)
+    async def heart_prediction(payload: PredictionRequest, compact: bool = False) -> OrjsonResponse:
+        return await _offload("heart", payload, compact)
+
+    @app.post("/predict/parkinsons", response_model=PredictionBody, response_class=OrjsonResponse)
+    async def parkinsons_prediction(payload: PredictionRequest, compact: bool = False) -> OrjsonResponse:
+        return await _offload("parkinsons", payload, compact)
 
+    @app.post("/predict/screening", response_model=ScreeningBody, response_class=OrjsonResponse)
+    async def screening_prediction(payload: ScreeningRequest, compact: bool = False) -> OrjsonResponse:
+        loop = asyncio.get_running_loop()
+        requests = screening_payloads(payload)
+        bodies = await asyncio.gather(*(
+            loop.run_in_executor(_executor, encode_prediction, disease, request, compact)
+            for disease, request in requests.items()
+        ))
+        return OrjsonResponse(merge_screening(dict(zip(requests, bodies))))
 
-@app.post("/predict/diabetes", response_model=PredictionResponse)
-def diabetes_prediction(payload: PredictionRequest) -> PredictionResponse:
-    return predict_diabetes(payload)
+else:
 
+    @app.post("/predict/diabetes", response_model=PredictionBody)
+    def diabetes_prediction(payload: PredictionRequest, compact: bool = False) -> PredictionResponse | OrjsonResponse:
+        if compact:
+            return OrjsonResponse(encode_prediction("diabetes", payload, compact=True))
+        return predict_diabetes(payload)
 
-@app.post("/predict/heart", response_model=PredictionResponse)
-def heart_prediction(payload: PredictionRequest) -> PredictionResponse:
-    return predict_heart(payload)
+    @app.post("/predict/heart", response_model=PredictionBody)
+    def heart_prediction(payload: PredictionRequest, compact: bool = False) -> PredictionResponse | OrjsonResponse:
+        if compact:
+            return OrjsonResponse(encode_prediction("heart", payload, compact=True))
+        return predict_heart(payload)
 
+    @app.post("/predict/parkinsons", response_model=PredictionBody)
+    def parkinsons_prediction(payload: PredictionRequest, compact: bool = False) -> PredictionResponse | OrjsonResponse:
+        if compact:
+            return OrjsonResponse(encode_prediction("parkinsons", payload, compact=True))
+        return predict_parkinsons(payload)
 
-@app.post("/predict/parkinsons", response_model=PredictionResponse)
-def parkinsons_prediction(payload: PredictionRequest) -> PredictionResponse:
-    return predict_parkinsons(payload)
+    @app.post("/predict/screening", response_model=ScreeningBody)
+    def screening_prediction(payload: ScreeningRequest, compact: bool = False) -> ScreeningResponse | OrjsonResponse:
+        if compact:
+            return OrjsonResponse(encode_screening(payload, compact=True))
+        return predict_screening(payload)
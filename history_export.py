@@ -0,0 +1,229 @@
+"""
+On-demand export of a user's prediction history.
+
+Rows are streamed from SQLite in fixed-size chunks and appended to a CSV,
+JSON Lines or Parquet file, so memory stays flat however long the history
+is. Disease and date filters are pushed into the SQL query. Finished files
+are kept in export_dir() under a name derived from (user, format, filters,
+highest matching row id): asking again before a new prediction is saved
+returns the existing file without touching the database rows.
+
+export_dir() is a private temporary directory created once per process, or
+HISTORY_EXPORT_DIR when set. Either way it, and every cached file served
+from it, must be owned by this account and closed to everyone else. The
+cache is capped at EXPORT_CACHE_BYTES; the least recently used files go
+first.
+"""
+import collections
+import hashlib
+import importlib.util
+import json
+import os
+import sqlite3
+import stat
+import tempfile
+import threading
+
+from auth import _prediction_filter_clause
+
+EXPORT_DIR = os.getenv("HISTORY_EXPORT_DIR")  # unset: a private temporary directory per process
+EXPORT_CACHE_BYTES = int(os.getenv("HISTORY_EXPORT_CACHE_BYTES", str(256 * 2 ** 20)))
+CHUNK_ROWS = 5000
+
+ExportFormat = collections.namedtuple("ExportFormat", "label extension mime")
+ExportFile = collections.namedtuple("ExportFile", "path file_name mime rows cached")
+
+EXPORT_FORMATS = {
+    "csv": ExportFormat("CSV", "csv", "text/csv"),
+    "jsonl": ExportFormat("JSON Lines", "jsonl", "application/x-ndjson"),
+    "parquet": ExportFormat("Parquet", "parquet", "application/vnd.apache.parquet"),
+}
+
+EXPORT_COLUMNS = ["Disease", "Prediction Result", "Confidence", "Positive Signal", "Probability", "Created At"]
+
+
+def available_formats():
+    """Export formats usable here; Parquet needs pyarrow."""
+    formats = dict(EXPORT_FORMATS)
+    if importlib.util.find_spec("pyarrow") is None:
+        del formats["parquet"]
+    return formats
+
+
+def _export_query(user_id, prediction_types, date_start, date_end):
+    where_sql, params = _prediction_filter_clause(user_id, prediction_types, date_start, date_end)
+    query = f"""
+        SELECT
+            prediction_type AS "Disease",
+            result AS "Prediction Result",
+            confidence AS "Confidence",
+            is_positive AS "Positive Signal",
+            probability AS "Probability",
+            created_at AS "Created At"
+        FROM predictions
+        WHERE {where_sql}
+        ORDER BY created_at DESC, id DESC
+    """
+    return query, where_sql, params
+
+
+def _write_csv(path, chunks):
+    first = True
+    with open(path, "w", encoding="utf-8", newline="") as fh:
+        for chunk in chunks:
+            chunk.to_csv(fh, header=first, index=False)
+            first = False
+        if first:
+            fh.write(",".join(EXPORT_COLUMNS) + "\n")
+
+
+def _write_jsonl(path, chunks):
+    with open(path, "w", encoding="utf-8") as fh:
+        for chunk in chunks:
+            if chunk.empty:
+                continue
+            lines = chunk.to_json(orient="records", lines=True, force_ascii=False)
+            fh.write(lines if lines.endswith("\n") else lines + "\n")
+
+
+def _write_parquet(path, chunks):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+        ("Disease", pa.string()),
+        ("Prediction Result", pa.string()),
+        ("Confidence", pa.float64()),
+        ("Positive Signal", pa.int64()),
+        ("Probability", pa.float64()),
+        ("Created At", pa.string()),
+    ])
+    with pq.ParquetWriter(path, schema) as writer:
+        for chunk in chunks:
+            chunk["Confidence"] = chunk["Confidence"].astype("float64")
+            chunk["Positive Signal"] = chunk["Positive Signal"].astype("Int64")
+            chunk["Probability"] = chunk["Probability"].astype("float64")
+            chunk["Created At"] = chunk["Created At"].astype("string")
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+_WRITERS = {"csv": _write_csv, "jsonl": _write_jsonl, "parquet": _write_parquet}
+
+
+_export_dir = None
+_export_dir_lock = threading.Lock()
+
+
+def _private(info):
+    """True if an lstat() result is owned by this account and closed to group and others."""
+    owned = not hasattr(os, "getuid") or info.st_uid == os.getuid()
+    return owned and not info.st_mode & 0o077
+
+
+def export_dir():
+    """The export cache directory, created on first use.
+
+    Raises PermissionError if it is not a private directory of this account.
+    """
+    global _export_dir
+    with _export_dir_lock:
+        if _export_dir is None:
+            if EXPORT_DIR:
+                os.makedirs(EXPORT_DIR, mode=0o700, exist_ok=True)
+                _export_dir = EXPORT_DIR
+            else:
+                _export_dir = tempfile.mkdtemp(prefix="mdp-history-exports-")
+        path = _export_dir
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or not _private(info):
+        raise PermissionError(f"{path} is not a directory private to this account; refusing to export there")
+    return path
+
+
+def _cached(path):
+    """True if `path` is an export this account wrote and nobody else can have replaced."""
+    try:
+        info = os.lstat(path)
+    except FileNotFoundError:
+        return False
+    return stat.S_ISREG(info.st_mode) and _private(info)
+
+
+def _export_name(user_id, export_format, prediction_types, date_start, date_end):
+    filters = json.dumps(
+        [sorted(prediction_types) if prediction_types is not None else None, str(date_start), str(date_end)]
+    )
+    # The database path is part of the key so app instances sharing the temp
+    # directory never hand out each other's files.
+    key = f"{os.path.abspath('users.db')}|{export_format}|{filters}"
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+    return f"history-{user_id}-{digest}"
+
+
+def _prune(directory, prefix, keep):
+    """Drop superseded exports for `prefix`, then the least recently used until under EXPORT_CACHE_BYTES."""
+    total = 0
+    others = []
+    for entry in os.scandir(directory):
+        # .tmp files are exports still being written.
+        if entry.name.endswith(".tmp") or not entry.is_file(follow_symlinks=False):
+            continue
+        info = entry.stat(follow_symlinks=False)
+        if entry.name == keep:
+            total += info.st_size
+        elif entry.name.startswith(prefix):
+            _remove(entry.path)
+        else:
+            total += info.st_size
+            others.append((info.st_mtime, info.st_size, entry.path))
+    for _, size, path in sorted(others):
+        if total <= EXPORT_CACHE_BYTES:
+            break
+        _remove(path)
+        total -= size
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def export_predictions(user_id, export_format="csv", prediction_types=None, date_start=None, date_end=None,
+                       chunk_rows=CHUNK_ROWS):
+    """Write the filtered history to a file, or reuse a cached one. Returns an ExportFile."""
+    import pandas as pd  # deferred: only needed once an export is requested
+
+    fmt = EXPORT_FORMATS[export_format]
+    conn = sqlite3.connect('users.db')
+    try:
+        query, where_sql, params = _export_query(user_id, prediction_types, date_start, date_end)
+        rows, max_id = conn.execute(
+            f"SELECT COUNT(*), COALESCE(MAX(id), 0) FROM predictions WHERE {where_sql}", params
+        ).fetchone()
+
+        directory = export_dir()
+        prefix = _export_name(user_id, export_format, prediction_types, date_start, date_end) + "-"
+        file_name = f"{prefix}{max_id}.{fmt.extension}"
+        path = os.path.join(directory, file_name)
+        download_name = f"prediction_history.{fmt.extension}"
+        if _cached(path):
+            os.utime(path)  # most recently used, for _prune
+            return ExportFile(path, download_name, fmt.mime, rows, True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            chunks = pd.read_sql_query(query, conn, params=params, chunksize=chunk_rows)
+            _WRITERS[export_format](tmp_path, chunks)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    finally:
+        conn.close()
+
+    _prune(directory, prefix, file_name)
+    return ExportFile(path, download_name, fmt.mime, rows, False)
@@ -0,0 +1,309 @@
+"""
+Shared inference layer for the Streamlit app, the Flask API (app.py) and the
+FastAPI backend (backend.py).
+
+Models are loaded together with the StandardScaler they were trained with
+(see train_models.py) into a versioned ModelBundle. Single-row predictions go
+through a process-wide LRU/TTL cache keyed on (model version, canonicalized
+feature vector), so resubmitting an identical form never reaches the
+forest or SVC.
+
+Once drift_monitor.start_drift_monitor() has run, each single-row
+prediction also feeds the disease's streaming input statistics
+(INPUT_MONITOR).
+
+what_if_curves() and what_if_surface() sweep one or two features of a
+patient over value grids: every perturbed row goes into one matrix scored
+by a single predict_proba call, capped at WHAT_IF_MAX_ROWS rows.
+"""
+import hashlib
+import logging
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+MODEL_ARTIFACTS = {
+    "diabetes": ("diabetes_model.sav", "diabetes_scaler.pkl"),
+    "heart": ("heart_disease_model.sav", "heart_disease_scaler.pkl"),
+    "parkinsons": ("parkinsons_model.sav", "parkinsons_scaler.pkl"),
+}
+
+# Inputs are rounded to this many decimals before keying the cache, so float
+# noise from widgets or JSON round-trips does not split identical forms.
+CACHE_DECIMALS = 6
+
+
+class InferenceCache:
+    """Thread-safe LRU cache with a per-entry TTL and hit/miss counters."""
+
+    def __init__(self, max_entries=4096, ttl_seconds=900.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key):
+        """Return (True, value) on a live hit, (False, None) otherwise."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+            return False, None
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+            }
+
+
+PREDICTION_CACHE = InferenceCache(
+    max_entries=int(os.getenv("INFERENCE_CACHE_SIZE", "4096")),
+    ttl_seconds=float(os.getenv("INFERENCE_CACHE_TTL", "900")),
+)
+
+# Set by drift_monitor.start_drift_monitor(); observe(disease, features) is
+# called for every monitored single-row prediction. Its errors are logged,
+# never raised into the prediction.
+INPUT_MONITOR = None
+
+logger = logging.getLogger(__name__)
+
+WHAT_IF_MAX_ROWS = int(os.getenv("WHAT_IF_MAX_ROWS", "10000"))
+WHAT_IF_CACHE = InferenceCache(
+    max_entries=int(os.getenv("WHAT_IF_CACHE_SIZE", "256")),
+    ttl_seconds=float(os.getenv("INFERENCE_CACHE_TTL", "900")),
+)
+
+
+class ModelBundle:
+    """A classifier, its optional training scaler and an artifact version.
+
+    `version` is None for stand-in models (e.g. the Streamlit DummyModel),
+    which disables caching for that bundle. `disease` names the model for
+    drift monitoring; bundles without one are not monitored.
+    """
+
+    def __init__(self, model, scaler=None, version=None, disease=None):
+        self.model = model
+        self.scaler = scaler
+        self.version = version
+        self.disease = disease
+        if scaler is not None:
+            # Apply the fitted statistics directly: same result as
+            # scaler.transform() without per-call validation overhead.
+            self._mean = np.asarray(scaler.mean_, dtype=float)
+            self._scale = np.asarray(scaler.scale_, dtype=float)
+        # Tree ensembles define predict() as the argmax of predict_proba(), so
+        # the label can be read off the probabilities instead of a second pass.
+        self._label_from_proba = hasattr(model, "estimators_") and hasattr(model, "classes_")
+
+    def transform(self, rows):
+        rows = np.asarray(rows, dtype=float)
+        if self.scaler is None:
+            return rows
+        return (rows - self._mean) / self._scale
+
+    def predict(self, rows):
+        return np.asarray(self.model.predict(self.transform(rows)))
+
+    def predict_proba(self, rows):
+        scaled = self.transform(rows)
+        if hasattr(self.model, "predict_proba"):
+            return np.asarray(self.model.predict_proba(scaled), dtype=float)
+        # Models without probabilities get a fixed 80/20 split on their label.
+        prediction = np.asarray(self.model.predict(scaled)).astype(int)
+        proba = np.full((len(prediction), 2), 0.2)
+        proba[np.arange(len(prediction)), prediction] = 0.8
+        return proba
+
+    def predict_with_proba(self, rows):
+        proba = self.predict_proba(rows)
+        if self._label_from_proba:
+            return np.asarray(self.model.classes_)[proba.argmax(axis=1)], proba
+        return self.predict(rows), proba
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_bundle(disease, base_dir=BASE_DIR):
+    """Load a disease model and its scaler. Raises if the model is missing."""
+    model_file, scaler_file = MODEL_ARTIFACTS[disease]
+    model_path = os.path.join(base_dir, model_file)
+    scaler_path = os.path.join(base_dir, scaler_file)
+
+    with open(model_path, "rb") as fh:
+        model = pickle.load(fh)
+
+    scaler = None
+    digests = [_file_digest(model_path)]
+    if os.path.exists(scaler_path):
+        with open(scaler_path, "rb") as fh:
+            scaler = pickle.load(fh)
+        digests.append(_file_digest(scaler_path))
+
+    version = f"{disease}:{hashlib.sha256(''.join(digests).encode()).hexdigest()[:16]}"
+    return ModelBundle(model, scaler, version, disease)
+
+
+def canonical_features(features):
+    """Hashable, rounded form of one feature vector (-0.0 folds into 0.0)."""
+    return tuple(round(float(value), CACHE_DECIMALS) + 0.0 for value in features)
+
+
+def predict_with_proba(bundle, features, cache=PREDICTION_CACHE, monitor=True):
+    """Predict one feature vector.
+
+    Returns (prediction, prediction_proba) shaped like sklearn's
+    `model.predict([x])` and `model.predict_proba([x])`. Results are served
+    from `cache` when the bundle is versioned. With `monitor`, the input is
+    also fed to INPUT_MONITOR (cache hits included).
+    """
+    if monitor and INPUT_MONITOR is not None and bundle.disease is not None:
+        try:
+            INPUT_MONITOR.observe(bundle.disease, features)
+        except Exception:
+            logger.exception("Drift monitor failed to record a %s prediction", bundle.disease)
+
+    key = None
+    if bundle.version is not None and cache is not None:
+        key = (bundle.version, canonical_features(features))
+        found, value = cache.get(key)
+        if found:
+            label, proba = value
+            return np.array([label]), np.array([proba])
+
+    prediction, proba = bundle.predict_with_proba(np.asarray([features], dtype=float))
+
+    if key is not None:
+        cache.put(key, (prediction[0].item(), tuple(proba[0].tolist())))
+    return prediction, proba
+
+
+def positive_column(bundle):
+    """Column of predict_proba holding the positive class (label 1)."""
+    classes = getattr(bundle.model, "classes_", None)
+    if classes is not None and 1 in list(classes):
+        return list(classes).index(1)
+    return 1
+
+
+def value_grid(low, high, points=50, include=None):
+    """`points` evenly spaced values over [low, high], widened to cover `include`."""
+    if include is not None:
+        low, high = min(low, include), max(high, include)
+    return np.linspace(low, high, points)
+
+
+def _check_rows(rows, max_rows):
+    if rows > max_rows:
+        raise ValueError(f"What-if grid needs {rows} rows; the limit is {max_rows}.")
+
+
+def _cached_sweep(bundle, features, grid_key, build, cache):
+    """Score the matrix from build() with one predict_proba call, through `cache`."""
+    key = None
+    if bundle.version is not None and cache is not None:
+        key = (bundle.version, canonical_features(features), grid_key)
+        found, value = cache.get(key)
+        if found:
+            return value
+    value = bundle.predict_proba(build())[:, positive_column(bundle)]
+    value.flags.writeable = False  # shared through the cache
+    if key is not None:
+        cache.put(key, value)
+    return value
+
+
+def what_if_curves(bundle, features, grids, max_rows=WHAT_IF_MAX_ROWS, cache=WHAT_IF_CACHE):
+    """Positive-class probability as each feature varies alone.
+
+    `grids` maps a feature index to the values to try; the other features
+    keep the patient's values. Returns {index: (values, probabilities)}.
+    """
+    base = np.asarray(features, dtype=float)
+    grids = {index: np.asarray(values, dtype=float) for index, values in grids.items()}
+    _check_rows(sum(values.size for values in grids.values()), max_rows)
+
+    def build():
+        # One block of rows per feature, all copies of the patient.
+        matrix = np.repeat(base[None], sum(values.size for values in grids.values()), axis=0)
+        start = 0
+        for index, values in grids.items():
+            matrix[start:start + values.size, index] = values
+            start += values.size
+        return matrix
+
+    grid_key = tuple((index, canonical_features(values)) for index, values in grids.items())
+    proba = _cached_sweep(bundle, features, ("curves", grid_key), build, cache)
+    curves, start = {}, 0
+    for index, values in grids.items():
+        curves[index] = (values, proba[start:start + values.size])
+        start += values.size
+    return curves
+
+
+def what_if_surface(bundle, features, first, second, max_rows=WHAT_IF_MAX_ROWS, cache=WHAT_IF_CACHE):
+    """Positive-class probability over a 2-D grid of two features.
+
+    `first` and `second` are (feature index, values). Returns a
+    (len(first values), len(second values)) probability array.
+    """
+    (i, values_i), (j, values_j) = first, second
+    values_i, values_j = np.asarray(values_i, dtype=float), np.asarray(values_j, dtype=float)
+    _check_rows(values_i.size * values_j.size, max_rows)
+
+    def build():
+        matrix = np.repeat(np.asarray(features, dtype=float)[None], values_i.size * values_j.size, axis=0)
+        grid_i, grid_j = np.meshgrid(values_i, values_j, indexing="ij")
+        matrix[:, i] = grid_i.ravel()
+        matrix[:, j] = grid_j.ravel()
+        return matrix
+
+    grid_key = ("surface", i, canonical_features(values_i), j, canonical_features(values_j))
+    proba = _cached_sweep(bundle, features, grid_key, build, cache)
+    return proba.reshape(values_i.size, values_j.size)
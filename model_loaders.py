@@ -0,0 +1,72 @@
+"""
+Cached model loading for the Streamlit pages.
+
+Each loader returns an inference.ModelBundle and runs on the first visit to
+its prediction page (or earlier, from warmup.py); st.cache_resource shares
+the bundle across sessions. A missing artifact is never trained here:
+model_provisioning builds it in the background and the page shows a
+"model warming" notice until it exists.
+"""
+import os
+
+import streamlit as st
+
+from drift_monitor import start_drift_monitor
+from inference import ModelBundle, load_bundle
+from model_provisioning import ModelWarming, ensure_artifacts
+
+# Create DummyModel class for error handling
+class DummyModel:
+    def __init__(self, name="Unknown"):
+        self.name = name
+        
+    def predict(self, input_data):
+        import random
+        return [random.randint(0, 1)]
+    
+    def predict_proba(self, input_data):
+        import random
+        prob = random.random()
+        return [[1 - prob, prob]]
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Every page that predicts imports this module, so the inputs of each
+# prediction in this process reach the drift monitor (drift_monitor.py).
+start_drift_monitor()
+
+def _load(disease, name):
+    """Load a bundle; raises ModelWarming (which st.cache_resource does not cache)
+    while a missing artifact is built in the background."""
+    if not ensure_artifacts(disease, BASE_DIR):
+        raise ModelWarming(name)
+    try:
+        return load_bundle(disease, BASE_DIR)
+    except Exception as e:
+        st.error(f"Error loading {name} model: {str(e)}")
+        return ModelBundle(DummyModel(name))
+
+# Predictions go through inference.predict_with_proba, whose cache is shared
+# by every session in this process.
+@st.cache_resource(show_spinner="Loading diabetes model...")
+def load_diabetes_model():
+    return _load('diabetes', "diabetes")
+
+@st.cache_resource(show_spinner="Loading heart disease model...")
+def load_heart_disease_model():
+    return _load('heart', "heart disease")
+
+@st.cache_resource(show_spinner="Loading Parkinson's model...")
+def load_parkinsons_model():
+    return _load('parkinsons', "Parkinson's")
+
+def require_model(loader):
+    """The loader's bundle, or a "model warming" notice and the end of this page run."""
+    try:
+        return loader()
+    except ModelWarming as warming:
+        st.info(
+            f"{warming} This usually takes under a minute; reload the page or come back "
+            "shortly. Other modules remain available."
+        )
+        st.stop()
@@ -0,0 +1,140 @@
+"""
+Off-request-path provisioning of missing model artifacts.
+
+Request code never trains. When a model file is missing,
+ensure_artifacts() starts one background job per process and disease and
+returns at once, so the caller can show a "model warming" state. The job:
+
+1. takes an exclusive lock on `<model file>.lock` next to the artifacts,
+   so concurrent sessions, workers and instances build each model once;
+2. re-checks the artifact under the lock, as another process may have
+   built it while this one waited;
+3. trains with train_models.train() on the bundled CSV data and writes the
+   scaler and model with train_models.write_artifacts() (temp file + rename).
+
+A failed job is retried on a later ensure_artifacts() call after
+RETRY_SECONDS.
+"""
+import os
+import threading
+import time
+
+from inference import BASE_DIR, MODEL_ARTIFACTS
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+RETRY_SECONDS = float(os.getenv("MODEL_PROVISION_RETRY_SECONDS", "300"))
+
+
+class ModelWarming(Exception):
+    """A model is still being provisioned in the background."""
+
+    def __init__(self, disease):
+        super().__init__(f"The {disease} model is being prepared in the background.")
+        self.disease = disease
+
+
+def model_path(disease, base_dir=BASE_DIR):
+    return os.path.join(base_dir, MODEL_ARTIFACTS[disease][0])
+
+
+def artifacts_ready(disease, base_dir=BASE_DIR):
+    return os.path.exists(model_path(disease, base_dir))
+
+
+class _FileLock:
+    """Exclusive, blocking inter-process lock on a file; released if the holder dies."""
+
+    def __init__(self, path):
+        self.path = path
+        self._fh = None
+
+    def __enter__(self):
+        self._fh = open(self.path, "a+b")
+        if fcntl is not None:
+            fcntl.flock(self._fh.fileno(), fcntl.LOCK_EX)
+        else:
+            while True:
+                try:
+                    msvcrt.locking(self._fh.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:  # LK_LOCK gives up after ~10 s; keep waiting
+                    continue
+        return self
+
+    def __exit__(self, *exc):
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fh.fileno(), fcntl.LOCK_UN)
+            else:
+                self._fh.seek(0)
+                msvcrt.locking(self._fh.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._fh.close()
+
+
+def provision(disease, base_dir=BASE_DIR):
+    """Build the artifacts for `disease` unless present. Blocking; returns True if it trained."""
+    with _FileLock(model_path(disease, base_dir) + ".lock"):
+        if artifacts_ready(disease, base_dir):
+            return False
+        import train_models
+
+        model, scaler, _ = train_models.train(disease, base_dir)
+        train_models.write_artifacts(disease, model, scaler, base_dir)
+        return True
+
+
+class _Job:
+    def __init__(self):
+        self.done = threading.Event()
+        self.error = None
+        self.finished_at = None
+
+
+_jobs = {}
+_jobs_lock = threading.Lock()
+
+
+def _run(job, disease, base_dir):
+    try:
+        provision(disease, base_dir)
+    except Exception as exc:
+        job.error = exc
+    finally:
+        job.finished_at = time.monotonic()
+        job.done.set()
+
+
+def ensure_artifacts(disease, base_dir=BASE_DIR):
+    """True if the artifacts exist; otherwise start (or keep) the background build and return False."""
+    if artifacts_ready(disease, base_dir):
+        return True
+    key = (os.path.abspath(base_dir), disease)
+    with _jobs_lock:
+        job = _jobs.get(key)
+        retry = job is not None and job.done.is_set() and (
+            job.error is None or time.monotonic() - job.finished_at >= RETRY_SECONDS
+        )
+        if job is None or retry:
+            job = _jobs[key] = _Job()
+            threading.Thread(
+                target=_run, args=(job, disease, base_dir), name=f"provision-{disease}", daemon=True
+            ).start()
+    return False
+
+
+def wait_for_artifacts(disease, base_dir=BASE_DIR, timeout=None):
+    """Ensure the artifacts and block until they exist. Raises the job's error if it failed."""
+    if ensure_artifacts(disease, base_dir):
+        return True
+    job = _jobs[(os.path.abspath(base_dir), disease)]
+    if not job.done.wait(timeout):
+        return False
+    if job.error is not None:
+        raise job.error
+    return artifacts_ready(disease, base_dir)
@@ -0,0 +1,232 @@
+"""
+Salted password hashing for auth.py.
+
+New hashes use scrypt (hashlib, OpenSSL) with a random 16-byte salt and are
+stored as
+
+    scrypt$<n>$<r>$<p>$<salt b64>$<hash b64>
+
+with PBKDF2-HMAC-SHA256 (`pbkdf2_sha256$<iterations>$<salt>$<hash>`) as the
+fallback where OpenSSL lacks scrypt. Unsalted SHA-256 hex digests from
+earlier releases still verify and are reported as needing a rehash, so
+auth.authenticate_user upgrades them on the user's next successful login.
+Cost factors come from the environment and hashes made with other
+parameters are upgraded the same way.
+
+KDF calls run on a small per-process thread pool whose size bounds how many
+logins hash at once (and so peak CPU and scrypt memory, 128*n*r bytes
+each). verify_password, hash_password_pooled and burn_verification wait for
+their result, so for a synchronous caller the pool only limits concurrency.
+The Streamlit sign-in and registration forms instead hand the whole job to
+submit() and poll the returned future, so the script thread never waits on
+a KDF. Code already running on the pool calls the KDF inline rather than
+queueing behind itself. Successful
+verifications are remembered in a bounded LRU keyed by an HMAC of the
+stored hash and password under a per-process random key, so a user who
+signs in again from another tab does not pay the KDF twice; wrong passwords
+are never cached and always pay the full cost.
+"""
+import base64
+import hashlib
+import hmac
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+SCRYPT_N = int(os.getenv("PASSWORD_SCRYPT_N", str(2 ** 14)))
+SCRYPT_R = int(os.getenv("PASSWORD_SCRYPT_R", "8"))
+SCRYPT_P = int(os.getenv("PASSWORD_SCRYPT_P", "1"))
+PBKDF2_ITERATIONS = int(os.getenv("PASSWORD_PBKDF2_ITERATIONS", "600000"))
+SALT_BYTES = 16
+KEY_BYTES = 32
+
+HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+VERIFY_CACHE_SIZE = int(os.getenv("PASSWORD_VERIFY_CACHE_SIZE", "1024"))
+VERIFY_CACHE_TTL_SECONDS = float(os.getenv("PASSWORD_VERIFY_CACHE_TTL", "900"))
+
+SCRYPT_AVAILABLE = hasattr(hashlib, "scrypt")
+
+
+def _b64encode(raw):
+    return base64.b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _b64decode(text):
+    return base64.b64decode(text + "=" * (-len(text) % 4))
+
+
+def _scrypt(password, salt, n, r, p):
+    # OpenSSL refuses to allocate more than maxmem; allow what the parameters need.
+    return hashlib.scrypt(
+        password.encode("utf-8"), salt=salt, n=n, r=r, p=p, maxmem=256 * n * r * p + (1 << 20), dklen=KEY_BYTES
+    )
+
+
+def _pbkdf2(password, salt, iterations):
+    return hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations, dklen=KEY_BYTES)
+
+
+def hash_password(password):
+    """Hash a password with a fresh salt at the current cost factors."""
+    salt = secrets.token_bytes(SALT_BYTES)
+    if SCRYPT_AVAILABLE:
+        digest = _scrypt(password, salt, SCRYPT_N, SCRYPT_R, SCRYPT_P)
+        return f"scrypt${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}${_b64encode(salt)}${_b64encode(digest)}"
+    digest = _pbkdf2(password, salt, PBKDF2_ITERATIONS)
+    return f"pbkdf2_sha256${PBKDF2_ITERATIONS}${_b64encode(salt)}${_b64encode(digest)}"
+
+
+def is_legacy_hash(stored):
+    """True for the unsalted SHA-256 hex digests written by earlier releases."""
+    return len(stored) == 64 and all(ch in "0123456789abcdef" for ch in stored)
+
+
+def needs_rehash(stored):
+    """Whether a stored hash is legacy or uses other than the current parameters."""
+    parts = stored.split("$")
+    if SCRYPT_AVAILABLE:
+        return parts[:4] != ["scrypt", str(SCRYPT_N), str(SCRYPT_R), str(SCRYPT_P)]
+    return parts[:2] != ["pbkdf2_sha256", str(PBKDF2_ITERATIONS)]
+
+
+def _verify(password, stored):
+    if is_legacy_hash(stored):
+        candidate = hashlib.sha256(password.encode()).hexdigest()
+        return hmac.compare_digest(candidate, stored)
+
+    parts = stored.split("$")
+    try:
+        if parts[0] == "scrypt" and len(parts) == 6:
+            n, r, p = int(parts[1]), int(parts[2]), int(parts[3])
+            expected = _b64decode(parts[5])
+            return hmac.compare_digest(_scrypt(password, _b64decode(parts[4]), n, r, p), expected)
+        if parts[0] == "pbkdf2_sha256" and len(parts) == 4:
+            expected = _b64decode(parts[3])
+            return hmac.compare_digest(_pbkdf2(password, _b64decode(parts[2]), int(parts[1])), expected)
+    except (ValueError, TypeError):
+        return False
+    return False
+
+
+class VerificationCache:
+    """Bounded LRU of successful (stored hash, password) verifications."""
+
+    def __init__(self, max_entries=VERIFY_CACHE_SIZE, ttl_seconds=VERIFY_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._key = secrets.token_bytes(32)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _fingerprint(self, password, stored):
+        message = stored.encode("utf-8") + b"\0" + password.encode("utf-8")
+        return hmac.new(self._key, message, hashlib.sha256).digest()
+
+    def contains(self, password, stored):
+        fingerprint = self._fingerprint(password, stored)
+        now = time.monotonic()
+        with self._lock:
+            expires_at = self._entries.get(fingerprint)
+            if expires_at is not None and expires_at > now:
+                self._entries.move_to_end(fingerprint)
+                self.hits += 1
+                return True
+            if expires_at is not None:
+                del self._entries[fingerprint]
+            self.misses += 1
+            return False
+
+    def add(self, password, stored):
+        fingerprint = self._fingerprint(password, stored)
+        with self._lock:
+            self._entries[fingerprint] = time.monotonic() + self.ttl_seconds
+            self._entries.move_to_end(fingerprint)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+VERIFY_CACHE = VerificationCache()
+
+_pool = None
+_pool_lock = threading.Lock()
+_pool_thread = threading.local()
+
+
+def _mark_pool_thread():
+    _pool_thread.active = True
+
+
+def _executor():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="password-kdf",
+                                       initializer=_mark_pool_thread)
+            _pool.submit(_dummy_hash)
+        return _pool
+
+
+def submit(fn, *args):
+    """Start fn(*args) on the KDF pool and return its Future, for callers that poll."""
+    return _executor().submit(fn, *args)
+
+
+def _run(fn, *args):
+    """fn(*args) on the KDF pool, waiting for it; inline if already on the pool."""
+    if getattr(_pool_thread, "active", False):
+        return fn(*args)
+    return _executor().submit(fn, *args).result()
+
+
+def verify_password(password, stored, cache=VERIFY_CACHE):
+    """Check a password against a stored hash on the KDF pool.
+
+    Returns (ok, needs_rehash). Blocks until the verification is done.
+    """
+    if not stored:
+        return False, False
+    if cache is not None and cache.contains(password, stored):
+        return True, needs_rehash(stored)
+    ok = _run(_verify, password, stored)
+    if ok and cache is not None:
+        cache.add(password, stored)
+    return ok, ok and needs_rehash(stored)
+
+
+def hash_password_pooled(password):
+    """hash_password run on the KDF pool."""
+    return _run(hash_password, password)
+
+
+_dummy = None
+_dummy_lock = threading.Lock()
+
+
+def _dummy_hash():
+    """A hash of a random password, made once (on the pool, when it starts)."""
+    global _dummy
+    with _dummy_lock:
+        if _dummy is None:
+            _dummy = hash_password(secrets.token_hex(8))
+        return _dummy
+
+
+def _burn(password):
+    _verify(password, _dummy_hash())
+
+
+def burn_verification(password):
+    """Spend one verification's worth of KDF work, for unknown usernames.
+
+    Keeps the response time of "no such user" in line with "wrong password".
+    """
+    _run(_burn, password)
@@ -0,0 +1,180 @@
+"""
+Population statistics index over the bundled datasets.
+
+The result pages compare a patient's inputs with the people in
+diabetes.csv, heart.csv and parkinsons.csv. Rather than re-reading the CSVs
+(or drawing random samples) on every click, build_index() computes, per
+dataset and per stratum ("all" and each outcome class):
+
+- every feature column sorted ascending, for percentile lookups with
+  np.searchsorted;
+- means, standard deviations and QUANTILES;
+- HISTOGRAM_BINS-bin histograms on shared per-feature bin edges.
+
+The arrays are saved as one compressed .npz (POPULATION_STATS_PATH) together
+with a digest of the source CSVs, and rebuilt when a CSV changes. If the
+file cannot be written (read-only deployments) the index is kept in memory.
+
+In diabetes.csv a zero Glucose, BloodPressure, SkinThickness, Insulin or BMI
+means "not measured"; those zeros are left out of the statistics.
+"""
+import io
+import os
+import tempfile
+import threading
+
+import numpy as np
+
+from inference import BASE_DIR, _file_digest
+
+POPULATION_STATS_PATH = os.getenv("POPULATION_STATS_PATH", os.path.join(BASE_DIR, "population_stats.npz"))
+HISTOGRAM_BINS = 30
+QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+STRATA = ("all", "0", "1")
+
+MISSING_AS_ZERO = {
+    "diabetes": ("Glucose", "BloodPressure", "SkinThickness", "Insulin", "BMI"),
+}
+
+
+def _datasets():
+    from train_models import MODEL_SPECS
+
+    return {disease: spec[:3] for disease, spec in MODEL_SPECS.items()}
+
+
+def _source_digest(base_dir):
+    return "|".join(_file_digest(os.path.join(base_dir, dataset)) for dataset, _, _ in _datasets().values())
+
+
+def build_index(base_dir=BASE_DIR):
+    """Compute the index arrays from the CSVs in `base_dir`."""
+    import pandas as pd
+
+    arrays = {"source_digest": np.array(_source_digest(base_dir))}
+    for disease, (dataset, target, extra) in _datasets().items():
+        df = pd.read_csv(os.path.join(base_dir, dataset))
+        features = df.drop(columns=[*extra, target])
+        for column in MISSING_AS_ZERO.get(disease, ()):
+            features[column] = features[column].mask(features[column] == 0)
+        values = features.to_numpy(dtype=float)
+        outcome = df[target].to_numpy()
+
+        # Shared edges, so the strata's histograms can be overlaid.
+        edges = np.empty((HISTOGRAM_BINS + 1, values.shape[1]))
+        for j in range(values.shape[1]):
+            valid = values[~np.isnan(values[:, j]), j]
+            edges[:, j] = np.histogram_bin_edges(valid, bins=HISTOGRAM_BINS)
+        arrays[f"{disease}.columns"] = np.array(features.columns, dtype=str)
+        arrays[f"{disease}.edges"] = edges
+
+        for stratum in STRATA:
+            rows = values if stratum == "all" else values[outcome == int(stratum)]
+            # NaNs sort last; `count` marks where each column's valid values end.
+            arrays[f"{disease}.{stratum}.sorted"] = np.sort(rows, axis=0)
+            arrays[f"{disease}.{stratum}.count"] = (~np.isnan(rows)).sum(axis=0)
+            arrays[f"{disease}.{stratum}.mean"] = np.nanmean(rows, axis=0)
+            arrays[f"{disease}.{stratum}.std"] = np.nanstd(rows, axis=0)
+            arrays[f"{disease}.{stratum}.quantiles"] = np.nanquantile(rows, QUANTILES, axis=0)
+            arrays[f"{disease}.{stratum}.hist"] = np.stack(
+                [np.histogram(rows[:, j], bins=edges[:, j])[0] for j in range(rows.shape[1])], axis=1
+            )
+    return arrays
+
+
+def write_index(arrays, path=POPULATION_STATS_PATH):
+    """Write the index atomically (temp file in the same directory, then rename)."""
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, **arrays)
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp",
+                                    dir=os.path.dirname(path) or ".")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(buffer.getvalue())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class PopulationStats:
+    """Read-only lookups over an index produced by build_index()."""
+
+    def __init__(self, arrays):
+        self.arrays = arrays
+        self.columns = {
+            disease: {name: j for j, name in enumerate(arrays[f"{disease}.columns"].tolist())}
+            for disease in _datasets()
+        }
+
+    def _column(self, disease, feature):
+        return self.columns[disease][feature]
+
+    def _get(self, disease, stratum, name):
+        return self.arrays[f"{disease}.{stratum}.{name}"]
+
+    def count(self, disease, feature, stratum="all"):
+        """Number of people in the stratum with the feature measured."""
+        return int(self._get(disease, stratum, "count")[self._column(disease, feature)])
+
+    def mean(self, disease, feature, stratum="all"):
+        return float(self._get(disease, stratum, "mean")[self._column(disease, feature)])
+
+    def means(self, disease, features, stratum="all"):
+        return [self.mean(disease, feature, stratum) for feature in features]
+
+    def quantiles(self, disease, feature, stratum="all"):
+        """{quantile: value} for QUANTILES."""
+        values = self._get(disease, stratum, "quantiles")[:, self._column(disease, feature)]
+        return dict(zip(QUANTILES, values.tolist()))
+
+    def percentile(self, disease, feature, value, stratum="all"):
+        """Percentage of the stratum below `value` (ties count half), or None if not measured."""
+        j = self._column(disease, feature)
+        count = self.count(disease, feature, stratum)
+        if count == 0 or value is None or np.isnan(value):
+            return None
+        column = self._get(disease, stratum, "sorted")[:count, j]
+        below = np.searchsorted(column, value, side="left")
+        at_or_below = np.searchsorted(column, value, side="right")
+        return float((below + at_or_below) * 50.0 / count)
+
+    def value_range(self, disease, feature):
+        """(lowest, highest) measured value of the feature in the dataset."""
+        edges = self.arrays[f"{disease}.edges"][:, self._column(disease, feature)]
+        return float(edges[0]), float(edges[-1])
+
+    def histogram(self, disease, feature, stratum="all"):
+        """(bin edges, counts) on the feature's shared edges."""
+        j = self._column(disease, feature)
+        return self.arrays[f"{disease}.edges"][:, j], self._get(disease, stratum, "hist")[:, j]
+
+
+def load_index(path=POPULATION_STATS_PATH, base_dir=BASE_DIR):
+    """Load the .npz index, rebuilding (and re-saving) it if missing or stale."""
+    digest = _source_digest(base_dir)
+    if os.path.exists(path):
+        with np.load(path) as data:
+            arrays = {name: data[name] for name in data.files}
+        if str(arrays.get("source_digest")) == digest:
+            return PopulationStats(arrays)
+    arrays = build_index(base_dir)
+    try:
+        write_index(arrays, path)
+    except OSError:
+        pass  # read-only checkout: serve from memory
+    return PopulationStats(arrays)
+
+
+_stats = None
+_stats_lock = threading.Lock()
+
+
+def get_population_stats():
+    """The process-wide PopulationStats, loaded on first use."""
+    global _stats
+    with _stats_lock:
+        if _stats is None:
+            _stats = load_index()
+        return _stats
@@ -3,16 +3,31 @@ High-performance async reverse proxy for Streamlit.
 Sits in front of the Streamlit server, handles connection pooling,
 keep-alive reuse, and rate-limits new connections to prevent port exhaustion.
 
+GET /ready is answered from the readiness server of serve_streamlit.py
+(READY_URL), so a load balancer only routes to warmed instances.
+
+The login session cookie is set here, because Streamlit cannot set
+cookies: POST /_auth/session redeems a single-use handoff code (see
+session_store.py) and sets the token as an HttpOnly SESSION_COOKIE;
+POST /_auth/logout revokes and clears it. Both accept same-origin requests
+only. Run the proxy from the app directory (or set SESSION_DB) so it uses
+the app's users.db.
+
 Usage: python proxy.py  (runs on port 8080, forwards to Streamlit on 8503)
 """
 import asyncio
+import os
+from urllib.parse import urlsplit
 import aiohttp
 from aiohttp import web
 import logging
 
+from session_store import SESSION_COOKIE, get_session_store
+
 logging.basicConfig(level=logging.WARNING)
 
 STREAMLIT_URL = "http://127.0.0.1:8503"
+READY_URL = os.getenv("READY_URL", "http://127.0.0.1:8502/ready")
 
 session: aiohttp.ClientSession = None
 
@@ -54,6 +69,53 @@ async def proxy_handler(request: web.Request) -> web.Response:
         return web.Response(status=502, text=f"Bad Gateway: {e}")
 
 
+async def ready_handler(request: web.Request) -> web.Response:
+    """Relay the Streamlit process's warm-up status (503 until it is ready)."""
+    try:
+        async with session.get(READY_URL, timeout=aiohttp.ClientTimeout(total=5)) as resp:
+            return web.Response(status=resp.status, body=await resp.read(),
+                                content_type="application/json")
+    except Exception as e:
+        return web.Response(status=503, text=f"Not ready: {e}")
+
+
+def _same_origin(request: web.Request) -> bool:
+    """True if the browser says the request comes from a page on this host."""
+    origin = request.headers.get("Origin")
+    return bool(origin) and urlsplit(origin).netloc == request.host
+
+
+def _secure(request: web.Request) -> bool:
+    return request.secure or request.headers.get("X-Forwarded-Proto", "").lower() == "https"
+
+
+async def session_cookie_handler(request: web.Request) -> web.Response:
+    """Exchange a handoff code (request body) for an HttpOnly session cookie."""
+    if not _same_origin(request):
+        return web.Response(status=403)
+    code = (await request.text()).strip()
+    redeemed = await asyncio.to_thread(get_session_store().redeem_handoff, code)
+    if redeemed is None:
+        return web.Response(status=400)
+    token, max_age = redeemed
+    response = web.Response(status=204, headers={"Cache-Control": "no-store"})
+    response.set_cookie(SESSION_COOKIE, token, max_age=max_age, path="/", httponly=True,
+                        secure=_secure(request), samesite="Lax")
+    return response
+
+
+async def logout_handler(request: web.Request) -> web.Response:
+    """Revoke the cookie's session and clear the cookie."""
+    if not _same_origin(request):
+        return web.Response(status=403)
+    token = request.cookies.get(SESSION_COOKIE)
+    if token:
+        await asyncio.to_thread(get_session_store().revoke, token)
+    response = web.Response(status=204, headers={"Cache-Control": "no-store"})
+    response.del_cookie(SESSION_COOKIE, path="/")
+    return response
+
+
 async def on_startup(app):
     global session
     # Connector MUST be created inside the running event loop
@@ -73,6 +135,9 @@ async def on_cleanup(app):
 
 
 app = web.Application()
+app.router.add_get("/ready", ready_handler)
+app.router.add_post("/_auth/session", session_cookie_handler)
+app.router.add_post("/_auth/logout", logout_handler)
 app.router.add_route("*", "/{path_info:.*}", proxy_handler)
 app.on_startup.append(on_startup)
 app.on_cleanup.append(on_cleanup)
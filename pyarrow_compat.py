@@ -0,0 +1,86 @@
+"""
+Stand-in for `pyarrow.vendored` on pyarrow builds that ship without it.
+
+Some pyarrow wheels omit the vendored subpackage that pandas' Arrow
+integration imports. ensure_vendored() installs a minimal mock in that case
+only. The check looks for the subpackage on disk, so a healthy install does
+not pay for importing pyarrow just to find out.
+"""
+import importlib.util
+import os
+import sys
+
+
+class MockVersion:
+    def __init__(self):
+        self.version = '1.0.0'
+
+    def __str__(self):
+        return self.version
+
+    def __repr__(self):
+        return f"version('{self.version}')"
+
+
+class MockDocscrape:
+    class Reader:
+        def __init__(self, *args, **kwargs):
+            self.sections = {}
+
+        def read(self):
+            return {'Parameters': {}}
+
+        def __getattr__(self, name):
+            return lambda *args, **kwargs: {}
+
+    class NumpyDocString(dict):
+        def __init__(self, *args, **kwargs):
+            super().__init__()
+            # Initialize with empty Parameters section
+            self['Parameters'] = {}
+
+        def __getitem__(self, key):
+            # Return empty dict for any key
+            return {}
+
+        def __setitem__(self, key, value):
+            # Do nothing
+            pass
+
+        def __getattr__(self, name):
+            return lambda *args, **kwargs: {}
+
+
+def _vendored_missing():
+    spec = importlib.util.find_spec("pyarrow")
+    if spec is None or not spec.submodule_search_locations:
+        return False  # pyarrow itself is not installed; nothing to patch
+    return not any(
+        os.path.isdir(os.path.join(location, "vendored"))
+        for location in spec.submodule_search_locations
+    )
+
+
+def ensure_vendored():
+    """Install the mock if pyarrow is present but lacks `vendored`.
+
+    Returns True when the mock was installed.
+    """
+    if 'pyarrow.vendored' in sys.modules or not _vendored_missing():
+        return False
+    try:
+        import pyarrow
+
+        vendored_module = type(sys)('pyarrow.vendored')
+        vendored_module.docscrape = MockDocscrape()
+        vendored_module.version = MockVersion()
+
+        sys.modules['pyarrow.vendored'] = vendored_module
+        sys.modules['pyarrow.vendored.docscrape'] = vendored_module.docscrape
+        sys.modules['pyarrow.vendored.version'] = vendored_module.version
+        pyarrow.vendored = vendored_module
+        print("Mock pyarrow.vendored module created successfully.")
+        return True
+    except Exception as e:
+        print(f"Error applying pyarrow patch: {e}")
+        return False
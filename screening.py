@@ -0,0 +1,109 @@
+"""
+Combined multi-disease screening.
+
+One set of named fields (as posted to app.py / backend.py) is mapped onto
+each model's input vector, so a field the models share, such as `age`, is
+entered once. Every disease with all of its fields present is scored
+concurrently on a shared thread pool, and screen() returns when the slowest
+model is done rather than after the sum of the three. A disease with missing
+fields is reported as skipped rather than failing the whole screening.
+
+Predictions go through inference.predict_with_proba, so they share the
+prediction cache with the single-disease routes.
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from inference import PREDICTION_CACHE, positive_column, predict_with_proba
+
+SCREENING_WORKERS = int(os.getenv("SCREENING_WORKERS", "3"))
+
+# Field names per model, in model input order. diabetes and heart match the
+# single-disease routes in app.py; parkinsons follows the dataset columns.
+SCREENING_FIELDS = {
+    "diabetes": [
+        "pregnancies", "glucose", "blood_pressure", "skin_thickness", "insulin", "bmi",
+        "diabetes_pedigree", "age",
+    ],
+    "heart": [
+        "age", "sex", "cp", "trestbps", "chol", "fbs", "restecg", "thalach", "exang", "oldpeak",
+        "slope", "ca", "thal",
+    ],
+    "parkinsons": [
+        "fo", "fhi", "flo", "jitter_percent", "jitter_abs", "rap", "ppq", "ddp", "shimmer",
+        "shimmer_db", "apq3", "apq5", "apq", "dda", "nhr", "hnr", "rpde", "dfa", "spread1",
+        "spread2", "d2", "ppe",
+    ],
+}
+
+# (negative, positive) result labels, as returned by the single-disease routes.
+RESULT_LABELS = {
+    "diabetes": ("Not Diabetic", "Diabetic"),
+    "heart": ("No Heart Disease", "Heart Disease"),
+    "parkinsons": ("No Parkinson's Disease", "Parkinson's Disease"),
+}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=SCREENING_WORKERS, thread_name_prefix="screening")
+        return _executor
+
+
+def screening_vectors(fields):
+    """({disease: feature vector}, {disease: missing field names}) for named fields."""
+    vectors, missing = {}, {}
+    for disease, names in SCREENING_FIELDS.items():
+        absent = [name for name in names if fields.get(name) is None]
+        if absent:
+            missing[disease] = absent
+        else:
+            vectors[disease] = [float(fields[name]) for name in names]
+    return vectors, missing
+
+
+def _score(bundle, features, cache):
+    started = time.perf_counter()
+    prediction, proba = predict_with_proba(bundle, features, cache=cache)
+    return (int(prediction[0]), float(proba[0][positive_column(bundle)]),
+            round((time.perf_counter() - started) * 1000.0, 2))
+
+
+def screen(bundles, fields, cache=PREDICTION_CACHE, executor=None):
+    """Score every disease the fields cover, concurrently, and merge the results.
+
+    `bundles` maps a disease to its ModelBundle (None if unavailable).
+    Raises ValueError if a field is not a number.
+    """
+    started = time.perf_counter()
+    vectors, missing = screening_vectors(fields)
+    skipped = {disease: {"missing": names} for disease, names in missing.items()}
+    for disease in list(vectors):
+        if bundles.get(disease) is None:
+            skipped[disease] = {"error": "Model not available"}
+            del vectors[disease]
+
+    executor = executor or _get_executor()
+    futures = {disease: executor.submit(_score, bundles[disease], features, cache)
+               for disease, features in vectors.items()}
+    results = {}
+    for disease, future in futures.items():
+        label, probability, elapsed = future.result()
+        results[disease] = {
+            "prediction": RESULT_LABELS[disease][label == 1],
+            "positive": label == 1,
+            "probability": round(probability, 4),
+            "elapsed_ms": elapsed,
+        }
+    return {
+        "results": results,
+        "skipped": skipped,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000.0, 2),
+    }
@@ -0,0 +1,36 @@
+"""
+Start the Streamlit app with its models warming from process start.
+
+`streamlit run` only executes the app script once a browser session
+connects, so its first visitor would still find the models cold. This
+launcher starts warmup.start_streamlit_warmup() and a readiness server
+(GET /ready on READY_PORT: 503 while warming, 200 once every model has
+served a dummy batch) before handing over to Streamlit in the same process,
+so the bundles it warms are the ones st.cache_resource gives the pages.
+Point the load balancer's health check at /ready.
+
+Usage: python serve_streamlit.py [streamlit run options]
+       e.g. python serve_streamlit.py --server.port 8503
+"""
+import os
+import sys
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPT = os.path.join(BASE_DIR, "multiplediseaseprediction.py")
+READY_PORT = int(os.getenv("READY_PORT", "8502"))
+
+
+def main(args):
+    sys.path.insert(0, BASE_DIR)
+    import warmup
+    from streamlit.web import cli
+
+    state = warmup.start_streamlit_warmup()
+    warmup.serve_readiness(state, READY_PORT)
+    print(f"Readiness: http://0.0.0.0:{READY_PORT}/ready", file=sys.stderr)
+    sys.argv = ["streamlit", "run", SCRIPT, *args]
+    sys.exit(cli.main())
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,296 @@
+"""
+Server-side login sessions shared by every app process.
+
+A session token is `<session id>.<signature>`, the signature being a
+truncated HMAC-SHA256 of the id. The id maps to the signed-in user in a
+backend every instance can reach:
+
+- SQLiteSessionBackend: the `sessions` table of users.db (created by
+  db_migrations), opened in WAL mode so readers never block the writer.
+- MemorySessionBackend: a process-local stand-in for tests and single
+  process runs.
+
+SessionStore fronts the backend with a small TTL cache, so validating a
+known token is an HMAC check plus a dict lookup. Revocation on another
+instance is seen once the cached entry expires (CACHE_TTL_SECONDS);
+revocation on this instance is immediate.
+
+The signing key is SESSION_SECRET when set, otherwise a random key stored
+in the same database so all instances sharing it agree.
+
+Tokens never appear in URLs. The browser holds its token in an HttpOnly
+SESSION_COOKIE, which Streamlit can read but not set: after a login the app
+creates a single-use handoff code (HANDOFF_TTL_SECONDS), the page POSTs it
+to proxy.py, and the proxy redeems it for the token and sets the cookie.
+"""
+import base64
+import hashlib
+import hmac
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+SESSION_TTL_SECONDS = float(os.getenv("SESSION_TTL_SECONDS", str(12 * 3600)))
+REMEMBER_TTL_SECONDS = float(os.getenv("SESSION_REMEMBER_TTL_SECONDS", str(30 * 24 * 3600)))
+CACHE_TTL_SECONDS = float(os.getenv("SESSION_CACHE_TTL_SECONDS", "30"))
+CACHE_SIZE = int(os.getenv("SESSION_CACHE_SIZE", "4096"))
+PURGE_INTERVAL_SECONDS = 600.0
+SIGNATURE_BYTES = 16
+HANDOFF_TTL_SECONDS = 60.0
+SESSION_COOKIE = "mdp_session"
+
+
+class MemorySessionBackend:
+    """Process-local session backend."""
+
+    def __init__(self, secret=None):
+        self.secret = secret or secrets.token_bytes(32)
+        self._sessions = {}
+        self._handoffs = {}
+        self._lock = threading.Lock()
+
+    def save(self, session_id, user, expires_at):
+        with self._lock:
+            self._sessions[session_id] = (dict(user), expires_at)
+
+    def load(self, session_id):
+        with self._lock:
+            entry = self._sessions.get(session_id)
+        if entry is None:
+            return None
+        user, expires_at = entry
+        return dict(user), expires_at
+
+    def delete(self, session_id):
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def save_handoff(self, code, session_id, persistent, expires_at):
+        with self._lock:
+            self._handoffs[code] = (session_id, persistent, expires_at)
+
+    def take_handoff(self, code):
+        """(session id, persistent, expires_at) for a handoff code, which is deleted."""
+        with self._lock:
+            return self._handoffs.pop(code, None)
+
+    def purge_expired(self, now):
+        with self._lock:
+            for session_id in [key for key, (_, expires_at) in self._sessions.items() if expires_at <= now]:
+                del self._sessions[session_id]
+            for code in [key for key, (_, _, expires_at) in self._handoffs.items() if expires_at <= now]:
+                del self._handoffs[code]
+
+
+class SQLiteSessionBackend:
+    """Sessions in the `sessions` table of a shared SQLite database."""
+
+    def __init__(self, db_path='users.db', secret=None):
+        from db_migrations import ensure_schema
+
+        self.db_path = db_path
+        ensure_schema(db_path)
+        # One autocommit connection per process, shared by the script-runner
+        # threads; every statement is a single-row lookup or write.
+        self._conn = sqlite3.connect(db_path, timeout=10, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        # Persistent per database file; lets readers run alongside the writer.
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self.secret = secret or self._shared_secret(self._conn)
+
+    def _execute(self, sql, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchone()
+
+    @staticmethod
+    def _shared_secret(conn):
+        conn.execute(
+            "INSERT OR IGNORE INTO app_secrets (name, value) VALUES ('session_signing_key', ?)",
+            (secrets.token_hex(32),),
+        )
+        value = conn.execute("SELECT value FROM app_secrets WHERE name = 'session_signing_key'").fetchone()[0]
+        return bytes.fromhex(value)
+
+    def save(self, session_id, user, expires_at):
+        self._execute(
+            "INSERT OR REPLACE INTO sessions (id, user_id, username, role, created_at, expires_at)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (session_id, user['id'], user['username'], user.get('role', 'user'), time.time(), expires_at),
+        )
+
+    def load(self, session_id):
+        row = self._execute(
+            "SELECT user_id, username, role, expires_at FROM sessions WHERE id = ?", (session_id,)
+        )
+        if row is None:
+            return None
+        user_id, username, role, expires_at = row
+        return {'id': user_id, 'username': username, 'role': role}, expires_at
+
+    def delete(self, session_id):
+        self._execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+
+    def save_handoff(self, code, session_id, persistent, expires_at):
+        self._execute(
+            "INSERT INTO session_handoffs (code, session_id, persistent, expires_at) VALUES (?, ?, ?, ?)",
+            (code, session_id, int(persistent), expires_at),
+        )
+
+    def take_handoff(self, code):
+        """(session id, persistent, expires_at) for a handoff code, which is deleted."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT session_id, persistent, expires_at FROM session_handoffs WHERE code = ?", (code,)
+                ).fetchone()
+                self._conn.execute("DELETE FROM session_handoffs WHERE code = ?", (code,))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        if row is None:
+            return None
+        return row[0], bool(row[1]), row[2]
+
+    def purge_expired(self, now):
+        self._execute("DELETE FROM sessions WHERE expires_at <= ?", (now,))
+        self._execute("DELETE FROM session_handoffs WHERE expires_at <= ?", (now,))
+
+
+def _b64(raw):
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+class SessionStore:
+    """Signed session tokens over a backend, with a TTL cache in front."""
+
+    def __init__(self, backend, cache_ttl=CACHE_TTL_SECONDS, cache_size=CACHE_SIZE):
+        self.backend = backend
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._next_purge = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    def _sign(self, session_id):
+        digest = hmac.new(self.backend.secret, session_id.encode("ascii"), hashlib.sha256).digest()
+        return _b64(digest[:SIGNATURE_BYTES])
+
+    def _session_id(self, token):
+        """The id of a well-formed, correctly signed token, else None."""
+        if not token or not isinstance(token, str) or token.count(".") != 1:
+            return None
+        session_id, signature = token.split(".")
+        try:
+            expected = self._sign(session_id)
+        except UnicodeEncodeError:
+            return None
+        return session_id if hmac.compare_digest(signature, expected) else None
+
+    def create(self, user, remember=False):
+        """Start a session for `user` ({'id', 'username', 'role'}); returns its token."""
+        now = time.time()
+        session_id = _b64(secrets.token_bytes(24))
+        expires_at = now + (REMEMBER_TTL_SECONDS if remember else SESSION_TTL_SECONDS)
+        self.backend.save(session_id, user, expires_at)
+        self._remember(session_id, dict(user), expires_at, now)
+        if now >= self._next_purge:
+            self._next_purge = now + PURGE_INTERVAL_SECONDS
+            self.backend.purge_expired(now)
+        return f"{session_id}.{self._sign(session_id)}"
+
+    def validate(self, token):
+        """The user a token is signed in as, or None if invalid/expired/revoked."""
+        session_id = self._session_id(token)
+        if session_id is None:
+            return None
+        now = time.time()
+        with self._lock:
+            entry = self._cache.get(session_id)
+            if entry is not None:
+                cached_until, user, expires_at = entry
+                if cached_until > now and expires_at > now:
+                    self._cache.move_to_end(session_id)
+                    self.hits += 1
+                    return dict(user)
+                del self._cache[session_id]
+            self.misses += 1
+
+        loaded = self.backend.load(session_id)
+        if loaded is None:
+            return None
+        user, expires_at = loaded
+        if expires_at <= now:
+            self.backend.delete(session_id)
+            return None
+        self._remember(session_id, user, expires_at, now)
+        return dict(user)
+
+    def create_handoff(self, token, persistent=False):
+        """A single-use code that proxy.py exchanges for `token` (see redeem_handoff)."""
+        session_id = self._session_id(token)
+        if session_id is None:
+            raise ValueError("invalid session token")
+        code = _b64(secrets.token_bytes(24))
+        self.backend.save_handoff(code, session_id, persistent, time.time() + HANDOFF_TTL_SECONDS)
+        return code
+
+    def redeem_handoff(self, code):
+        """(token, cookie max-age) for an unused, unexpired handoff code, else None.
+
+        The max-age is the session's remaining lifetime for remembered
+        sessions, and None (a browser-session cookie) otherwise.
+        """
+        if not code or not isinstance(code, str):
+            return None
+        handoff = self.backend.take_handoff(code)
+        now = time.time()
+        if handoff is None or handoff[2] <= now:
+            return None
+        session_id, persistent, _ = handoff
+        token = f"{session_id}.{self._sign(session_id)}"
+        loaded = self.backend.load(session_id)
+        if loaded is None or loaded[1] <= now:
+            return None
+        return token, (int(loaded[1] - now) if persistent else None)
+
+    def revoke(self, token):
+        session_id = self._session_id(token)
+        if session_id is None:
+            return
+        with self._lock:
+            self._cache.pop(session_id, None)
+        self.backend.delete(session_id)
+
+    def _remember(self, session_id, user, expires_at, now):
+        with self._lock:
+            self._cache[session_id] = (now + self.cache_ttl, user, expires_at)
+            self._cache.move_to_end(session_id)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_session_store():
+    """The process-wide store; SESSION_BACKEND=memory selects the in-process stand-in."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            secret = os.getenv("SESSION_SECRET")
+            secret = secret.encode("utf-8") if secret else None
+            if os.getenv("SESSION_BACKEND", "sqlite").lower() == "memory":
+                backend = MemorySessionBackend(secret)
+            else:
+                backend = SQLiteSessionBackend(os.getenv("SESSION_DB", "users.db"), secret)
+            _store = SessionStore(backend)
+        return _store
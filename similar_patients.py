@@ -0,0 +1,204 @@
+"""
+Similar-patient search over the bundled training cohorts.
+
+NeighborIndex holds one disease's reference patients (the rows of
+diabetes.csv, heart.csv or parkinsons.csv, plus any appended labelled rows)
+in the model's standardized feature space, i.e. after the bundle's scaler.
+The cohorts are a few hundred rows, so queries are exact brute force:
+squared distances |q|^2 + |x|^2 - 2 q.x are computed with one matrix
+product per block of BLOCK_ROWS reference rows, and each block's k nearest
+are merged into the running result with np.argpartition. A batch of
+queries shares every block.
+
+append() writes new rows into spare capacity (doubling when full), so adding
+labelled patients costs O(new rows) and never rebuilds the index.
+
+Each index is persisted to `neighbors_<disease>.npz` next to the models,
+keyed on the bundle version and the CSV digest. When either changes the
+cohort is re-read and re-standardized, and appended rows are carried over.
+"""
+import os
+import threading
+
+import numpy as np
+
+from inference import BASE_DIR, _file_digest
+
+BLOCK_ROWS = int(os.getenv("NEIGHBOR_BLOCK_ROWS", "4096"))
+DEFAULT_K = 5
+
+
+def index_path(disease, base_dir=BASE_DIR):
+    return os.path.join(base_dir, f"neighbors_{disease}.npz")
+
+
+def _cohort(disease, base_dir):
+    """(feature names, raw rows, labels, CSV digest) from the bundled dataset."""
+    import pandas as pd
+
+    from train_models import MODEL_SPECS
+
+    dataset, target, extra, _ = MODEL_SPECS[disease]
+    path = os.path.join(base_dir, dataset)
+    df = pd.read_csv(path)
+    features = df.drop(columns=[*extra, target])
+    return (list(features.columns), features.to_numpy(dtype=float),
+            df[target].to_numpy(dtype=np.int64), _file_digest(path))
+
+
+class NeighborIndex:
+    """Exact k-nearest-neighbour search in a bundle's standardized feature space."""
+
+    def __init__(self, bundle, columns, raw, labels, n_cohort, source_digest):
+        self.bundle = bundle
+        self.version = bundle.version
+        self.columns = list(columns)
+        self.n_cohort = n_cohort
+        self.source_digest = source_digest
+        self._lock = threading.Lock()
+        self._size = 0
+        self._raw = np.empty((0, len(self.columns)))
+        self._points = np.empty((0, len(self.columns)))
+        self._norms = np.empty(0)
+        self._labels = np.empty(0, dtype=np.int64)
+        self._append(raw, labels)
+
+    @classmethod
+    def build(cls, bundle, disease, base_dir=BASE_DIR):
+        columns, raw, labels, digest = _cohort(disease, base_dir)
+        return cls(bundle, columns, raw, labels, len(raw), digest)
+
+    def __len__(self):
+        return self._size
+
+    def _append(self, raw, labels):
+        raw = np.atleast_2d(np.asarray(raw, dtype=float))
+        labels = np.asarray(labels, dtype=np.int64).reshape(-1)
+        if len(raw) != len(labels):
+            raise ValueError("rows and labels differ in length")
+        points = self.bundle.transform(raw)
+        with self._lock:
+            start, stop = self._size, self._size + len(raw)
+            if stop > len(self._raw):
+                capacity = max(stop, 2 * len(self._raw), 64)
+                self._raw = self._grow(self._raw, capacity)
+                self._points = self._grow(self._points, capacity)
+                self._norms = self._grow(self._norms, capacity)
+                self._labels = self._grow(self._labels, capacity)
+            self._raw[start:stop] = raw
+            self._points[start:stop] = points
+            self._norms[start:stop] = np.einsum("ij,ij->i", points, points)
+            self._labels[start:stop] = labels
+            self._size = stop
+
+    @staticmethod
+    def _grow(array, capacity):
+        grown = np.empty((capacity,) + array.shape[1:], dtype=array.dtype)
+        grown[:len(array)] = array
+        return grown
+
+    def append(self, rows, labels, path=None):
+        """Add labelled raw feature rows; also rewrites the saved index if `path` is given."""
+        self._append(rows, labels)
+        if path is not None:
+            self.save(path)
+
+    def query(self, rows, k=DEFAULT_K):
+        """(distances, indices), each (m, k), nearest first, for raw feature rows."""
+        queries = self.bundle.transform(np.atleast_2d(np.asarray(rows, dtype=float)))
+        with self._lock:
+            size = self._size
+            points, norms = self._points, self._norms
+        k = min(k, size)
+        query_norms = np.einsum("ij,ij->i", queries, queries)[:, None]
+        best_dist = np.empty((len(queries), 0))
+        best_index = np.empty((len(queries), 0), dtype=np.int64)
+        for start in range(0, size, BLOCK_ROWS):
+            stop = min(start + BLOCK_ROWS, size)
+            dist = query_norms + norms[start:stop] - 2.0 * (queries @ points[start:stop].T)
+            dist = np.concatenate([best_dist, dist], axis=1)
+            index = np.concatenate([best_index, np.broadcast_to(np.arange(start, stop), (len(queries), stop - start))], axis=1)
+            if dist.shape[1] > k:
+                keep = np.argpartition(dist, k - 1, axis=1)[:, :k]
+                dist = np.take_along_axis(dist, keep, axis=1)
+                index = np.take_along_axis(index, keep, axis=1)
+            best_dist, best_index = dist, index
+        order = np.argsort(best_dist, axis=1, kind="stable")
+        distances = np.sqrt(np.maximum(np.take_along_axis(best_dist, order, axis=1), 0.0))
+        return distances, np.take_along_axis(best_index, order, axis=1)
+
+    def rows(self, indices):
+        """(raw feature rows, labels) for indices returned by query()."""
+        return self._raw[indices], self._labels[indices]
+
+    def save(self, path):
+        from population_stats import write_index
+
+        with self._lock:
+            size = self._size
+            arrays = {
+                "version": np.array(self.version or ""),
+                "source_digest": np.array(self.source_digest),
+                "columns": np.array(self.columns, dtype=str),
+                "n_cohort": np.array(self.n_cohort),
+                "raw": self._raw[:size].copy(),
+                "labels": self._labels[:size].copy(),
+            }
+        write_index(arrays, path)
+
+    @classmethod
+    def load(cls, bundle, disease, path, base_dir=BASE_DIR):
+        """Load a saved index for `bundle`, rebuilding it (keeping appended rows) if stale."""
+        with np.load(path) as data:
+            saved = {name: data[name] for name in data.files}
+        columns, n_cohort = saved["columns"].tolist(), int(saved["n_cohort"])
+        digest = _file_digest(os.path.join(base_dir, _dataset(disease)))
+        if str(saved["source_digest"]) != digest:
+            fresh = cls.build(bundle, disease, base_dir)
+            fresh._append(saved["raw"][n_cohort:], saved["labels"][n_cohort:])
+            return fresh, True
+        # Points are re-standardized on load, so a new scaler only costs one pass.
+        index = cls(bundle, columns, saved["raw"], saved["labels"], n_cohort, digest)
+        return index, str(saved["version"]) != (bundle.version or "")
+
+
+def _dataset(disease):
+    from train_models import MODEL_SPECS
+
+    return MODEL_SPECS[disease][0]
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def get_neighbor_index(bundle, disease, base_dir=BASE_DIR):
+    """The NeighborIndex for a bundle, loaded from (or saved to) disk once per model version."""
+    key = (bundle.version, disease)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            path = index_path(disease, base_dir)
+            stale = True
+            if os.path.exists(path):
+                index, stale = NeighborIndex.load(bundle, disease, path, base_dir)
+            else:
+                index = NeighborIndex.build(bundle, disease, base_dir)
+            if stale:
+                try:
+                    index.save(path)
+                except OSError:
+                    pass  # read-only checkout: serve from memory
+            _indexes[key] = index
+        return index
+
+
+def similar_patients(bundle, disease, features, k=DEFAULT_K):
+    """The k nearest reference patients to one raw feature vector.
+
+    Returns (columns, raw rows (k, d), labels (k,), distances (k,)).
+    """
+    index = get_neighbor_index(bundle, disease)
+    distances, indices = index.query([features], k)
+    rows, labels = index.rows(indices[0])
+    return index.columns, rows, labels, distances[0]
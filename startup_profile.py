@@ -0,0 +1,134 @@
+"""
+Startup profiling for the Streamlit app.
+
+StageTimer records wall-clock time per stage of one script run. The app
+keeps the last completed run in LAST_RUN and, with STARTUP_PROFILE=1, logs
+it to stderr after every rerun.
+
+Run this module to profile a cold start of one page in a fresh interpreter:
+it executes multiplediseaseprediction.py through Streamlit's AppTest under
+`python -X importtime`, then summarizes the modules the script itself
+imported (Streamlit's own import cost is excluded, since `streamlit run`
+has already paid it before the first session connects) together with the
+stage timers.
+
+Usage: python startup_profile.py [page] [top_n]
+       page defaults to "login"; otherwise a page script such as
+       "app_pages/diabetes.py".
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPT = os.path.join(BASE_DIR, "multiplediseaseprediction.py")
+
+PROFILE_ENABLED = os.getenv("STARTUP_PROFILE", "0") == "1"
+
+# Last completed script run: {"page": ..., "stages": [(name, ms), ...], "total_ms": ...}
+LAST_RUN = None
+
+_SCRIPT_MARKER = "--- startup_profile: script run ---"
+
+
+class StageTimer:
+    """Wall-clock timings for the stages of one script run."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self._last = self.started
+        self.stages = []
+
+    def mark(self, name):
+        """Close the stage that ran since the previous mark."""
+        now = time.perf_counter()
+        self.stages.append((name, (now - self._last) * 1000.0))
+        self._last = now
+
+    def finish(self, page):
+        global LAST_RUN
+        total_ms = (time.perf_counter() - self.started) * 1000.0
+        LAST_RUN = {"page": page, "stages": self.stages, "total_ms": total_ms}
+        if PROFILE_ENABLED:
+            stages = " ".join(f"{name}={ms:.1f}" for name, ms in self.stages)
+            print(f"[startup] page={page} total={total_ms:.1f}ms {stages}", file=sys.stderr)
+        return LAST_RUN
+
+
+# Executed in the child interpreter started by main().
+_CHILD = """
+import json, os, sys, tempfile, warnings
+warnings.filterwarnings("ignore")
+page = sys.argv[1]
+import streamlit
+from streamlit.testing.v1 import AppTest
+os.chdir(tempfile.mkdtemp())  # keep users.db out of the repository
+at = AppTest.from_file(sys.argv[2], default_timeout=300)
+if page != "login":
+    at.session_state["logged_in"] = True
+    at.session_state["user"] = {"id": 1, "username": "admin", "role": "admin"}
+    at.switch_page(page)
+sys.stderr.write(%r + "\\n")
+sys.stderr.flush()
+at.run()
+import startup_profile
+print(json.dumps({"run": startup_profile.LAST_RUN, "exceptions": [e.message for e in at.exception]}))
+""" % _SCRIPT_MARKER
+
+
+def _parse_importtime(stderr):
+    """Top-level import entries recorded after the script started."""
+    lines = stderr.splitlines()
+    if _SCRIPT_MARKER in lines:
+        lines = lines[lines.index(_SCRIPT_MARKER) + 1:]
+    entries = []
+    for line in lines:
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = line.split("|", 2)
+        if not cumulative_us.strip().isdigit():
+            continue  # header row
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((depth, name.strip(), int(cumulative_us)))
+    min_depth = min((depth for depth, _, _ in entries), default=0)
+    return [(name, us) for depth, name, us in entries if depth == min_depth]
+
+
+def profile(page="login"):
+    child = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD, page, SCRIPT],
+        cwd=BASE_DIR,
+        env=dict(os.environ, PYTHONPATH=BASE_DIR),
+        capture_output=True,
+        text=True,
+    )
+    result_lines = [line for line in child.stdout.splitlines() if line.startswith("{")]
+    if child.returncode != 0 or not result_lines:
+        raise RuntimeError(f"profiling run failed:\n{child.stderr[-2000:]}")
+    result = json.loads(result_lines[-1])
+    return result, _parse_importtime(child.stderr)
+
+
+def main(page="login", top_n=12):
+    result, imports = profile(page)
+    run = result["run"] or {"stages": [], "total_ms": 0.0}
+    import_ms = sum(us for _, us in imports) / 1000.0
+
+    print(f"page: {page}")
+    print(f"script run (first paint): {run['total_ms']:.1f} ms, of which imports {import_ms:.1f} ms")
+    if result["exceptions"]:
+        print(f"exceptions: {result['exceptions']}")
+    print()
+    print(f"{'stage':<28}{'ms':>10}")
+    for name, ms in run["stages"]:
+        print(f"{name:<28}{ms:>10.1f}")
+    print()
+    print(f"{'import (cumulative)':<40}{'ms':>10}")
+    for name, us in sorted(imports, key=lambda item: item[1], reverse=True)[:top_n]:
+        print(f"{name:<40}{us / 1000.0:>10.1f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else "login", int(sys.argv[2]) if len(sys.argv) > 2 else 12)
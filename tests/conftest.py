@@ -0,0 +1,24 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture(autouse=True)
+def fast_kdf(monkeypatch):
+    """Cheap KDF parameters; hashes made here are not meant to be strong."""
+    import password_hashing
+
+    monkeypatch.setattr(password_hashing, "SCRYPT_N", 2 ** 4)
+    monkeypatch.setattr(password_hashing, "PBKDF2_ITERATIONS", 1000)
+    password_hashing.VERIFY_CACHE.clear()
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run in an empty directory, so the relative 'users.db' is a fresh database."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
@@ -0,0 +1,87 @@
+import sqlite3
+
+import pytest
+
+from db_migrations import LATEST_VERSION, PREDICTIONS_COLUMNS, USERS_COLUMNS, classify_result, migrate, schema_version
+
+
+def legacy_database(path):
+    """A users.db as written by the first releases."""
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE users (id INTEGER PRIMARY KEY AUTOINCREMENT, username TEXT UNIQUE NOT NULL, password TEXT NOT NULL);
+        CREATE TABLE predictions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER,
+            disease_type TEXT,
+            input_data TEXT,
+            prediction_result TEXT,
+            confidence REAL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        INSERT INTO users (username, password) VALUES ('bob', 'legacyhash');
+        INSERT INTO predictions (user_id, disease_type, input_data, prediction_result, confidence, created_at)
+        VALUES (1, 'Diabetes', '[1, 2]', 'The person is diabetic', 80.0, '2024-01-02 03:04:05'),
+               (1, 'Heart Disease', '[3]', 'The person does not have any heart disease', 90.0, '2024-01-03 00:00:00');
+    """)
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture
+def conn(tmp_path):
+    path = str(tmp_path / "users.db")
+    legacy_database(path)
+    conn = sqlite3.connect(path, isolation_level=None)
+    yield conn
+    conn.close()
+
+
+def columns(conn, table):
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+
+
+def test_legacy_schema_is_rebuilt(conn):
+    assert migrate(conn) == list(range(1, LATEST_VERSION + 1))
+    assert schema_version(conn) == LATEST_VERSION
+    assert columns(conn, "users") == list(USERS_COLUMNS)
+    assert columns(conn, "predictions") == list(PREDICTIONS_COLUMNS)
+    for table in ("sessions", "session_handoffs", "app_secrets", "drift_stats"):
+        assert columns(conn, table)
+
+
+def test_legacy_rows_are_kept_and_backfilled(conn):
+    migrate(conn)
+    assert conn.execute("SELECT id, username, password, role FROM users WHERE username = 'bob'").fetchone() == (
+        1, 'bob', 'legacyhash', 'user'
+    )
+    rows = conn.execute(
+        "SELECT user_id, prediction_type, result, confidence, is_positive, probability, created_at"
+        " FROM predictions ORDER BY id"
+    ).fetchall()
+    assert rows == [
+        (1, 'Diabetes', 'The person is diabetic', 80.0, 1, pytest.approx(0.8), '2024-01-02 03:04:05'),
+        (1, 'Heart Disease', 'The person does not have any heart disease', 90.0, 0, pytest.approx(0.1),
+         '2024-01-03 00:00:00'),
+    ]
+
+
+def test_admin_is_seeded(conn):
+    migrate(conn)
+    assert conn.execute("SELECT role FROM users WHERE username = 'admin'").fetchone() == ('admin',)
+
+
+def test_migrate_is_idempotent(conn):
+    migrate(conn)
+    before = conn.execute("SELECT * FROM predictions ORDER BY id").fetchall()
+    assert migrate(conn) == []
+    assert conn.execute("SELECT * FROM predictions ORDER BY id").fetchall() == before
+    assert conn.execute("SELECT COUNT(*) FROM users WHERE username = 'admin'").fetchone() == (1,)
+
+
+def test_classify_result():
+    assert classify_result("The person is diabetic") == 1
+    assert classify_result("The person has Parkinson's disease") == 1
+    assert classify_result("The person is not diabetic") == 0
+    assert classify_result("No significant indicators detected") == 0
+    assert classify_result(None) == 0
@@ -0,0 +1,133 @@
+import numpy as np
+import pytest
+
+import drift_monitor
+import inference
+from drift_monitor import DriftMonitor, FeatureStream
+
+
+def sample(rows=300, features=4, seed=0):
+    rng = np.random.default_rng(seed)
+    data = rng.normal(5.0, 3.0, size=(rows, features))
+    data[rng.random(data.shape) < 0.1] = np.nan
+    data[:5, 0] = [-100.0, 100.0, 0.0, 10.0, 5.0]  # under/overflow and both edges
+    return data
+
+
+def stream_over(rows):
+    stream = FeatureStream(np.zeros(4), np.full(4, 10.0), 8)
+    for row in rows:
+        stream.update(row)
+    return stream
+
+
+def test_merge_matches_a_single_stream():
+    data = sample()
+    whole = stream_over(data)
+    merged = stream_over(data[:100])
+    for part in (data[100:130], data[130:130], data[130:]):
+        merged.merge(*stream_over(part).totals())
+
+    assert merged.rows == whole.rows == len(data)
+    np.testing.assert_array_equal(merged.count, whole.count)
+    np.testing.assert_array_equal(merged.hist, whole.hist)
+    np.testing.assert_allclose(merged.mean, whole.mean, rtol=1e-12)
+    np.testing.assert_allclose(merged.m2, whole.m2, rtol=1e-10)
+
+
+def test_stream_moments_ignore_missing_values():
+    data = sample()
+    stream = stream_over(data)
+    np.testing.assert_array_equal(stream.count, (~np.isnan(data)).sum(axis=0))
+    np.testing.assert_allclose(stream.mean, np.nanmean(data, axis=0), rtol=1e-12)
+    np.testing.assert_allclose(stream.m2 / stream.count, np.nanvar(data, axis=0), rtol=1e-10)
+    np.testing.assert_array_equal(stream.hist.sum(axis=1), stream.count)
+
+
+@pytest.fixture
+def rows():
+    return np.random.default_rng(1).normal([3, 120, 70, 20, 80, 32, 0.5, 33], [3, 30, 12, 15, 110, 7, 0.3, 11],
+                                           size=(60, 8))
+
+
+def test_monitors_sharing_a_database_add_up(tmp_path, rows):
+    path = str(tmp_path / "users.db")
+    first, second = DriftMonitor(path), DriftMonitor(path)
+    for row in rows[:25]:
+        first.observe("diabetes", row)
+    for row in rows[25:]:
+        second.observe("diabetes", row)
+
+    # Unflushed counts are visible only to their own process.
+    assert first.snapshot("diabetes")["count"] == 25
+    assert second.snapshot("diabetes")["count"] == 35
+    first.flush()
+    second.flush()
+    second.flush()  # nothing pending: no change
+
+    single = DriftMonitor(str(tmp_path / "single.db"))
+    for row in rows:
+        single.observe("diabetes", row)
+    expected = single.snapshot("diabetes")
+    for monitor in (first, second, DriftMonitor(path)):
+        report = monitor.snapshot("diabetes")
+        assert report["count"] == len(rows)
+        for got, want in zip(report["features"], expected["features"]):
+            assert got["feature"] == want["feature"]
+            assert got["mean"] == pytest.approx(want["mean"], rel=1e-12)
+            assert got["std"] == pytest.approx(want["std"], rel=1e-9)
+            assert got["psi"] == pytest.approx(want["psi"], rel=1e-9)
+            assert got["missing"] == want["missing"]
+
+
+def test_zero_means_missing_for_listed_features(tmp_path, rows):
+    monitor = DriftMonitor(str(tmp_path / "users.db"))
+    row = rows[0].copy()
+    row[[1, 2, 3, 4, 5]] = 0.0
+    monitor.observe("diabetes", row)
+    report = monitor.snapshot("diabetes")
+    assert [feature["feature"] for feature in report["features"]] == ["Pregnancies", "DiabetesPedigreeFunction", "Age"]
+
+
+@pytest.fixture
+def fresh_monitor(monkeypatch):
+    """No monitor started yet in this process; both globals are restored afterwards."""
+    monkeypatch.setattr(drift_monitor, "_monitor", None)
+    monkeypatch.setattr(inference, "INPUT_MONITOR", None)
+
+
+def test_start_loads_every_baseline(tmp_path, fresh_monitor):
+    monitor = drift_monitor.start_drift_monitor(str(tmp_path / "users.db"), flush_seconds=3600)
+    assert inference.INPUT_MONITOR is monitor
+    assert set(monitor._baselines) == set(inference.MODEL_ARTIFACTS)
+
+
+def test_start_failure_is_logged_not_raised(tmp_path, fresh_monitor, caplog):
+    # A database in a directory that does not exist fails like a read-only filesystem.
+    assert drift_monitor.start_drift_monitor(str(tmp_path / "missing" / "users.db")) is None
+    assert inference.INPUT_MONITOR is None
+    assert "Drift monitoring is off" in caplog.text
+
+
+class _BrokenMonitor:
+    def observe(self, disease, features):
+        raise OSError("disk I/O error")
+
+
+class _Constant:
+    classes_ = [0, 1]
+
+    def predict(self, rows):
+        return [1] * len(rows)
+
+    def predict_proba(self, rows):
+        return [[0.25, 0.75]] * len(rows)
+
+
+def test_observe_errors_do_not_reach_the_prediction(fresh_monitor, monkeypatch, caplog):
+    monkeypatch.setattr(inference, "INPUT_MONITOR", _BrokenMonitor())
+    bundle = inference.ModelBundle(_Constant(), disease="diabetes")
+    prediction, proba = inference.predict_with_proba(bundle, [1.0] * 8, cache=None)
+    assert prediction[0] == 1
+    np.testing.assert_allclose(proba[0], [0.25, 0.75])
+    assert "Drift monitor failed" in caplog.text
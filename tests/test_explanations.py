@@ -0,0 +1,48 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import explanations
+from inference import MODEL_ARTIFACTS, load_bundle
+from tests.conftest import ROOT
+
+DATASETS = {
+    "diabetes": ("diabetes.csv", ["Outcome"]),
+    "heart": ("heart.csv", ["target"]),
+    "parkinsons": ("parkinsons.csv", ["name", "status"]),
+}
+
+
+def sample_rows(disease, count=40):
+    file_name, drop = DATASETS[disease]
+    frame = pd.read_csv(os.path.join(ROOT, file_name)).drop(columns=drop)
+    return frame.sample(n=min(count, len(frame)), random_state=0).to_numpy(dtype=float)
+
+
+@pytest.mark.parametrize("disease", sorted(MODEL_ARTIFACTS))
+def test_attributions_sum_to_the_prediction(disease):
+    bundle = load_bundle(disease)
+    rows = sample_rows(disease)
+    result = explanations.explain_batch(bundle, rows)
+    if result is None:
+        pytest.skip(f"no explainer for the {disease} model")
+    base_value, values = result
+    assert values.shape == rows.shape
+    positive = bundle.predict_proba(rows)[:, explanations._positive_index(bundle.model)]
+    np.testing.assert_allclose(base_value + values.sum(axis=1), positive, atol=1e-9)
+
+
+def test_heart_model_uses_tree_shap():
+    bundle = load_bundle("heart")
+    assert isinstance(explanations.get_explainer(bundle), explanations.TreeExplainer)
+
+
+def test_batch_matches_single_rows():
+    bundle = load_bundle("heart")
+    rows = sample_rows("heart", 5)
+    _, values = explanations.explain_batch(bundle, rows)
+    for row, expected in zip(rows, values):
+        _, single = explanations.explain(bundle, row, cache=None)
+        np.testing.assert_allclose(single, expected, atol=1e-12)
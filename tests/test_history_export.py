@@ -0,0 +1,104 @@
+import csv
+import json
+import os
+import sqlite3
+import stat
+from datetime import date
+
+import pytest
+
+import auth
+import history_export
+
+
+@pytest.fixture
+def exports(workdir, monkeypatch):
+    """users.db with two users' predictions, exporting into a fresh private directory."""
+    monkeypatch.setattr(history_export, "EXPORT_DIR", str(workdir / "exports"))
+    monkeypatch.setattr(history_export, "_export_dir", None)
+    auth.init_database()
+    conn = sqlite3.connect('users.db')
+    conn.executemany(
+        "INSERT INTO predictions (user_id, prediction_type, input_data, result, confidence, is_positive, probability,"
+        " created_at) VALUES (?, ?, '[]', ?, 80.0, ?, ?, ?)",
+        [
+            (1, 'Diabetes', 'The person is diabetic', 1, 0.8, '2024-01-01 09:00:00'),
+            (1, 'Heart Disease', 'No heart disease', 0, 0.2, '2024-01-02 23:59:59'),
+            (1, 'Diabetes', 'The person is not diabetic', 0, 0.2, '2024-01-03 00:00:00'),
+            (2, 'Diabetes', 'The person is diabetic', 1, 0.8, '2024-01-02 12:00:00'),
+        ],
+    )
+    conn.commit()
+    conn.close()
+    return workdir / "exports"
+
+
+def read_csv(path):
+    with open(path, newline="", encoding="utf-8") as fh:
+        return list(csv.DictReader(fh))
+
+
+def test_filters_and_user_isolation(exports):
+    rows = read_csv(history_export.export_predictions(1).path)
+    assert [row["Created At"] for row in rows] == ['2024-01-03 00:00:00', '2024-01-02 23:59:59', '2024-01-01 09:00:00']
+
+    diabetes = history_export.export_predictions(1, prediction_types=['Diabetes'])
+    assert diabetes.rows == 2
+    assert {row["Disease"] for row in read_csv(diabetes.path)} == {'Diabetes'}
+
+    # Date bounds are inclusive calendar days.
+    dated = history_export.export_predictions(1, date_start=date(2024, 1, 2), date_end=date(2024, 1, 2))
+    assert [row["Disease"] for row in read_csv(dated.path)] == ['Heart Disease']
+
+    assert history_export.export_predictions(1, prediction_types=[]).rows == 0
+    assert read_csv(history_export.export_predictions(1, prediction_types=[]).path) == []
+    assert history_export.export_predictions(2).rows == 1
+
+
+def test_jsonl_export(exports):
+    export = history_export.export_predictions(2, "jsonl")
+    with open(export.path, encoding="utf-8") as fh:
+        records = [json.loads(line) for line in fh]
+    assert [record["Prediction Result"] for record in records] == ['The person is diabetic']
+    assert export.file_name == "prediction_history.jsonl"
+
+
+def test_cache_reuse_and_invalidation(exports):
+    first = history_export.export_predictions(1)
+    again = history_export.export_predictions(1)
+    assert not first.cached and again.cached and again.path == first.path
+
+    auth.save_prediction(1, 'Diabetes', [], 'The person is diabetic', 70.0)
+    fresh = history_export.export_predictions(1)
+    assert not fresh.cached and fresh.rows == 4
+    # The superseded export for the same filters is dropped.
+    assert not os.path.exists(first.path)
+
+
+def test_export_dir_is_private(exports):
+    export = history_export.export_predictions(1)
+    assert stat.S_IMODE(os.stat(exports).st_mode) == 0o700
+    assert os.path.dirname(export.path) == str(exports)
+
+
+def test_loosened_file_is_not_reused(exports):
+    export = history_export.export_predictions(1)
+    os.chmod(export.path, 0o644)
+    assert not history_export.export_predictions(1).cached
+
+
+def test_shared_directory_is_refused(exports):
+    history_export.export_predictions(1)
+    os.chmod(exports, 0o755)
+    with pytest.raises(PermissionError):
+        history_export.export_predictions(1)
+
+
+def test_cache_cap_evicts_least_recently_used(exports, monkeypatch):
+    old = history_export.export_predictions(1)
+    size = os.path.getsize(old.path)
+    os.utime(old.path, (1, 1))
+    monkeypatch.setattr(history_export, "EXPORT_CACHE_BYTES", size + 1)
+    newer = history_export.export_predictions(2)
+    assert os.path.exists(newer.path)
+    assert not os.path.exists(old.path)
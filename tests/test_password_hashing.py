@@ -0,0 +1,98 @@
+import hashlib
+import sqlite3
+
+import auth
+import password_hashing
+from password_hashing import VerificationCache, hash_password, is_legacy_hash, needs_rehash, verify_password
+
+
+def stored_password(username):
+    conn = sqlite3.connect('users.db')
+    try:
+        return conn.execute("SELECT password FROM users WHERE username = ?", (username,)).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_hash_roundtrip_and_salting():
+    first, second = hash_password("s3cret"), hash_password("s3cret")
+    assert first != second
+    assert verify_password("s3cret", first, cache=None) == (True, False)
+    assert verify_password("wrong", first, cache=None) == (False, False)
+    assert not is_legacy_hash(first)
+
+
+def test_malformed_hashes_do_not_verify():
+    for stored in ("", "scrypt$x$8$1$AA$AA", "pbkdf2_sha256$1000", "plaintext"):
+        assert verify_password("s3cret", stored, cache=None) == (False, False)
+
+
+def test_needs_rehash_on_cost_change(monkeypatch):
+    stored = hash_password("s3cret")
+    assert not needs_rehash(stored)
+    monkeypatch.setattr(password_hashing, "SCRYPT_N", password_hashing.SCRYPT_N * 2)
+    monkeypatch.setattr(password_hashing, "PBKDF2_ITERATIONS", password_hashing.PBKDF2_ITERATIONS * 2)
+    assert needs_rehash(stored)
+    assert verify_password("s3cret", stored, cache=None) == (True, True)
+
+
+def test_legacy_sha256_verifies_and_needs_rehash():
+    legacy = hashlib.sha256(b"s3cret").hexdigest()
+    assert is_legacy_hash(legacy)
+    assert verify_password("s3cret", legacy, cache=None) == (True, True)
+    assert verify_password("wrong", legacy, cache=None) == (False, False)
+
+
+def test_cache_keeps_successes_only():
+    cache = VerificationCache()
+    stored = hash_password("s3cret")
+    assert verify_password("wrong", stored, cache=cache)[0] is False
+    assert not cache.contains("wrong", stored)
+    assert verify_password("s3cret", stored, cache=cache)[0] is True
+    assert cache.contains("s3cret", stored)
+
+
+def test_burn_verification_runs():
+    password_hashing.burn_verification("anything")
+
+
+def test_login_upgrades_legacy_hash(workdir):
+    auth.init_database()
+    legacy = hashlib.sha256(b"s3cret").hexdigest()
+    conn = sqlite3.connect('users.db')
+    conn.execute("INSERT INTO users (username, password) VALUES ('old', ?)", (legacy,))
+    conn.commit()
+    conn.close()
+
+    assert auth.authenticate_user("old", "wrong") is None
+    assert stored_password("old") == legacy
+
+    user = auth.authenticate_user("old", "s3cret")
+    assert user["username"] == "old" and user["role"] == "user"
+    upgraded = stored_password("old")
+    assert upgraded.startswith("scrypt$") or upgraded.startswith("pbkdf2_sha256$")
+    assert auth.authenticate_user("old", "s3cret")["id"] == user["id"]
+    assert stored_password("old") == upgraded
+
+
+def test_rehash_does_not_clobber_a_concurrent_password_change(workdir, monkeypatch):
+    auth.init_database()
+    legacy = hashlib.sha256(b"s3cret").hexdigest()
+    conn = sqlite3.connect('users.db')
+    conn.execute("INSERT INTO users (username, password) VALUES ('old', ?)", (legacy,))
+    conn.commit()
+    conn.close()
+    changed = hash_password("changed")
+
+    def verify_then_change(password, stored):
+        result = verify_password(password, stored, cache=None)
+        # Another request changes the password while this login is verifying.
+        other = sqlite3.connect('users.db')
+        other.execute("UPDATE users SET password = ? WHERE username = 'old'", (changed,))
+        other.commit()
+        other.close()
+        return result
+
+    monkeypatch.setattr(auth, "verify_password", verify_then_change)
+    assert auth.authenticate_user("old", "s3cret") is not None
+    assert stored_password("old") == changed
@@ -0,0 +1,92 @@
+import pytest
+
+import session_store
+from session_store import MemorySessionBackend, SessionStore, SQLiteSessionBackend
+
+USER = {'id': 7, 'username': 'alice', 'role': 'user'}
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return SessionStore(MemorySessionBackend())
+    return SessionStore(SQLiteSessionBackend(str(tmp_path / "users.db")))
+
+
+def test_create_and_validate(store):
+    token = store.create(USER)
+    assert store.validate(token) == USER
+    # Served again from the TTL cache.
+    assert store.validate(token) == USER
+    assert store.hits >= 1
+
+
+def test_tampered_and_malformed_tokens(store):
+    token = store.create(USER)
+    session_id, signature = token.split(".")
+    forged = signature[:-1] + ("A" if signature[-1] != "A" else "B")
+    for bad in (None, "", "no-dot", "a.b.c", f"{session_id}.{forged}", f"other.{signature}", "é.x"):
+        assert store.validate(bad) is None
+
+
+def test_expired_session(store, monkeypatch):
+    monkeypatch.setattr(session_store, "SESSION_TTL_SECONDS", 0.0)
+    token = store.create(USER)
+    assert store.validate(token) is None
+
+
+def test_remember_outlives_plain_session(store, monkeypatch):
+    monkeypatch.setattr(session_store, "SESSION_TTL_SECONDS", 0.0)
+    token = store.create(USER, remember=True)
+    assert store.validate(token) == USER
+
+
+def test_revoke(store):
+    token = store.create(USER)
+    store.validate(token)
+    store.revoke(token)
+    assert store.validate(token) is None
+    store.revoke("garbage")  # ignored
+
+
+def test_handoff_is_single_use(store):
+    token = store.create(USER)
+    code = store.create_handoff(token)
+    assert store.redeem_handoff(code) == (token, None)
+    assert store.redeem_handoff(code) is None
+    assert store.redeem_handoff("bogus") is None
+    assert store.redeem_handoff(None) is None
+    with pytest.raises(ValueError):
+        store.create_handoff(token + "x")
+
+
+def test_persistent_handoff_max_age(store):
+    token = store.create(USER, remember=True)
+    redeemed_token, max_age = store.redeem_handoff(store.create_handoff(token, persistent=True))
+    assert redeemed_token == token
+    assert session_store.REMEMBER_TTL_SECONDS - 5 <= max_age <= session_store.REMEMBER_TTL_SECONDS
+
+
+def test_handoff_for_revoked_session(store):
+    token = store.create(USER)
+    code = store.create_handoff(token)
+    store.revoke(token)
+    assert store.redeem_handoff(code) is None
+
+
+def test_expired_handoff(store, monkeypatch):
+    monkeypatch.setattr(session_store, "HANDOFF_TTL_SECONDS", 0.0)
+    token = store.create(USER)
+    assert store.redeem_handoff(store.create_handoff(token)) is None
+
+
+def test_sqlite_sessions_are_shared_between_instances(tmp_path):
+    path = str(tmp_path / "users.db")
+    first = SessionStore(SQLiteSessionBackend(path))
+    second = SessionStore(SQLiteSessionBackend(path))
+    token = first.create(USER)
+    assert second.validate(token) == USER
+    assert second.redeem_handoff(first.create_handoff(token)) == (token, None)
+    second.revoke(token)
+    first._cache.clear()
+    assert first.validate(token) is None
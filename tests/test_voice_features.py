@@ -0,0 +1,106 @@
+import io
+import math
+import os
+import warnings
+import wave
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests.conftest import ROOT
+from voice_features import FEATURE_NAMES, extract_features, out_of_training_range
+
+F0 = 130.0
+JITTER = 0.005
+SHIMMER = 0.04
+
+
+def synthetic_vowel(rate=44100, seconds=3.0, jitter=JITTER, shimmer=SHIMMER, seed=0):
+    """A 16-bit mono WAV of a pulse train with normal period / amplitude perturbations through two formants."""
+    rng = np.random.default_rng(seed)
+    n = int(seconds * rate)
+    onsets = np.cumsum((1.0 + jitter * rng.standard_normal(int(seconds * F0 * 1.1))) / F0)
+    onsets = onsets[onsets < seconds]
+    amplitudes = 1.0 + shimmer * rng.standard_normal(len(onsets))
+    # Each pulse is split over its two neighbouring samples, so onsets are not rounded to the sample grid.
+    position = onsets * rate
+    index = position.astype(np.intp)
+    fraction = position - index
+    pulses = np.zeros(n + 1)
+    np.add.at(pulses, index, amplitudes * (1.0 - fraction))
+    np.add.at(pulses, index + 1, amplitudes * fraction)
+    t = np.arange(int(0.012 * rate)) / rate
+    formants = np.exp(-400 * t) * np.sin(2 * np.pi * 700 * t) + 0.6 * np.exp(-300 * t) * np.sin(2 * np.pi * 250 * t)
+    size = n + len(formants)
+    voice = np.fft.irfft(np.fft.rfft(pulses[:n], size) * np.fft.rfft(formants, size), size)[:n]
+    voice = 0.6 * voice / np.abs(voice).max() + 0.01 * rng.standard_normal(n)
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as out:
+        out.setnchannels(1)
+        out.setsampwidth(2)
+        out.setframerate(rate)
+        out.writeframes((np.clip(voice, -1.0, 1.0) * 32767).astype("<i2").tobytes())
+    buffer.seek(0)
+    return buffer
+
+
+def measures(source):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        return dict(zip(FEATURE_NAMES, extract_features(source)))
+
+
+@pytest.mark.parametrize("rate", [8000, 16000, 44100])
+def test_known_f0_and_jitter(rate):
+    values = measures(synthetic_vowel(rate))
+    assert values["MDVP:Fo(Hz)"] == pytest.approx(F0, rel=0.01)
+    # E|x - y| = 2 sigma / sqrt(pi) for independent normal perturbations.
+    spread = 2.0 / math.sqrt(math.pi)
+    assert values["MDVP:Jitter(%)"] == pytest.approx(JITTER * spread, rel=0.25)
+    assert values["MDVP:Shimmer"] == pytest.approx(SHIMMER * spread, rel=0.25)
+    assert all(math.isfinite(value) for value in values.values())
+
+
+def test_more_jitter_measures_higher():
+    steady = measures(synthetic_vowel(jitter=0.002))
+    shaky = measures(synthetic_vowel(jitter=0.02))
+    assert shaky["MDVP:Jitter(%)"] > 3.0 * steady["MDVP:Jitter(%)"]
+    assert shaky["MDVP:RAP"] > steady["MDVP:RAP"]
+
+
+def test_block_size_does_not_change_the_perturbation_measures():
+    # F0 through HNR are running sums; the nonlinear measures sample a fixed number of points per block.
+    whole = extract_features(synthetic_vowel(), block_seconds=10.0)
+    blocks = extract_features(synthetic_vowel(), block_seconds=0.5)
+    np.testing.assert_allclose(blocks[:16], whole[:16], rtol=0.01)
+
+
+def test_rejects_silence_and_non_wav():
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as out:
+        out.setnchannels(1)
+        out.setsampwidth(2)
+        out.setframerate(16000)
+        out.writeframes(b"\0\0" * 32000)
+    buffer.seek(0)
+    with pytest.raises(ValueError):
+        extract_features(buffer)
+    with pytest.raises(ValueError):
+        extract_features(io.BytesIO(b"not a wav file"))
+
+
+def test_training_rows_are_in_range():
+    rows = pd.read_csv(os.path.join(ROOT, "parkinsons.csv"))[FEATURE_NAMES].to_numpy()
+    assert all(out_of_training_range(row) == [] for row in rows[::20])
+
+
+def test_out_of_range_measures_are_listed():
+    row = pd.read_csv(os.path.join(ROOT, "parkinsons.csv"))[FEATURE_NAMES].iloc[0].to_list()
+    row[FEATURE_NAMES.index("spread2")] = 0.001
+    row[FEATURE_NAMES.index("D2")] = 10.0
+    outside = out_of_training_range(row)
+    assert [name for name, *_ in outside] == ["spread2", "D2"]
+    for _, value, low, high in outside:
+        assert not low <= value <= high
@@ -0,0 +1,134 @@
+"""
+Theme stylesheet pipeline for the Streamlit app.
+
+The interface CSS lives in styles/*.css. Each bundle is concatenated,
+minified and written once per process to static/theme-<bundle>.<hash>.css,
+which Streamlit serves from app/static/ when server.enableStaticServing is
+on. Pages then reference the bundle with a ~100-byte <link> tag instead of
+re-sending tens of kilobytes of <style> in every rerun's delta stream; the
+content hash in the file name lets browsers cache it for the session and
+picks up edits without a manual cache bust.
+
+Streamlit drops any element a rerun does not re-emit, so the tag itself is
+still written on every rerun; only the stylesheet body is fetched once.
+"""
+import functools
+import hashlib
+import os
+import re
+import tempfile
+
+import streamlit as st
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STYLES_DIR = os.path.join(BASE_DIR, "styles")
+# Must sit next to the main script: Streamlit serves <script dir>/static.
+STATIC_DIR = os.path.join(BASE_DIR, "static")
+STATIC_URL = "app/static"
+
+# Bundle name -> source files, in cascade order.
+BUNDLES = {
+    "login": ("base.css", "login.css"),
+    "app": ("base.css", "app_theme.css", "app_overrides.css"),
+}
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_STRING_RE = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')""")
+_IMPORT_RE = re.compile(r"@import\s+(?:url\([^)]*\)|\"[^\"]*\"|'[^']*')[^;]*;")
+_SPACE_RE = re.compile(r"\s+")
+_PUNCT_RE = re.compile(r"\s*([{};,>])\s*")
+_COLON_RE = re.compile(r":\s+")
+
+
+def minify_css(css):
+    """Strip comments and redundant whitespace, hoisting @import rules.
+
+    Quoted strings are left untouched. @import is only valid before every
+    other rule, so imports from later source files are moved to the top.
+    """
+    css = _COMMENT_RE.sub("", css)
+    imports = []
+    for rule in _IMPORT_RE.findall(css):
+        if rule not in imports:
+            imports.append(rule)
+    css = _IMPORT_RE.sub("", css)
+
+    parts = _STRING_RE.split(css)
+    for i in range(0, len(parts), 2):
+        chunk = _SPACE_RE.sub(" ", parts[i])
+        chunk = _PUNCT_RE.sub(r"\1", chunk)
+        parts[i] = _COLON_RE.sub(":", chunk)
+    body = "".join(parts).replace(";}", "}").strip()
+    return "".join(imports) + body
+
+
+def _read_sources(names):
+    chunks = []
+    for name in names:
+        with open(os.path.join(STYLES_DIR, name), encoding="utf-8") as fh:
+            chunks.append(fh.read())
+    return "\n".join(chunks)
+
+
+def _write_atomic(path, text):
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+@functools.lru_cache(maxsize=None)
+def build_bundle(name):
+    """Build a bundle once per process. Returns (file name, minified CSS)."""
+    css = minify_css(_read_sources(BUNDLES[name]))
+    digest = hashlib.sha256(css.encode("utf-8")).hexdigest()[:12]
+    filename = f"theme-{name}.{digest}.css"
+
+    os.makedirs(STATIC_DIR, exist_ok=True)
+    path = os.path.join(STATIC_DIR, filename)
+    if not os.path.exists(path):
+        _write_atomic(path, '@charset "UTF-8";' + css)
+    # Drop builds of this bundle from earlier source revisions.
+    for stale in os.listdir(STATIC_DIR):
+        if stale.startswith(f"theme-{name}.") and stale.endswith(".css") and stale != filename:
+            try:
+                os.remove(os.path.join(STATIC_DIR, stale))
+            except OSError:
+                pass
+    return filename, css
+
+
+def _static_css_supported():
+    """Whether this Streamlit serves app/static/*.css as text/css.
+
+    The Tornado-based servers before Streamlit 1.57 mark everything outside a
+    short image/font allow-list as text/plain with nosniff, which browsers
+    refuse to apply as a stylesheet; the Starlette server that replaced them
+    uses the file's real content type. requirements pin 1.57 or later, so the
+    inline fallback only matters for older local installs.
+    """
+    if not st.get_option("server.enableStaticServing"):
+        return False
+    try:
+        from streamlit.web.server.app_static_file_handler import SAFE_APP_STATIC_FILE_EXTENSIONS
+    except ImportError:
+        return True
+    return ".css" in SAFE_APP_STATIC_FILE_EXTENSIONS
+
+
+def stylesheet_markup(name):
+    """HTML that applies a bundle: a <link> when static serving can deliver
+    it, otherwise the minified CSS inline."""
+    filename, css = build_bundle(name)
+    if _static_css_supported():
+        return f'<link rel="stylesheet" href="{STATIC_URL}/{filename}">'
+    return f"<style>{css}</style>"
+
+
+def apply_stylesheet(name):
+    st.markdown(stylesheet_markup(name), unsafe_allow_html=True)
@@ -4,66 +4,87 @@ Run this script once to produce:
   - diabetes_model.sav
   - heart_disease_model.sav
   - parkinsons_model.sav
+together with the StandardScaler each was trained with (*_scaler.pkl).
+
+train() and write_artifacts() are also used by model_provisioning.py to
+build a missing model in the background. Artifacts are written to a temp
+file in the same directory and renamed into place, so a reader never sees a
+partially written pickle.
 """
-import os, pickle
+import os, pickle, tempfile
 import pandas as pd  # type: ignore
 from sklearn.preprocessing import StandardScaler  # type: ignore
 from sklearn.model_selection import train_test_split  # type: ignore
 from sklearn.svm import SVC  # type: ignore
 from sklearn.ensemble import RandomForestClassifier  # type: ignore
 
+from inference import MODEL_ARTIFACTS
+
 BASE = os.path.dirname(os.path.abspath(__file__))
 
-# --- Diabetes -----------------------------------------------
-print("Training diabetes model...")
-df = pd.read_csv(os.path.join(BASE, "diabetes.csv"))
-X = df.drop(columns="Outcome")
-y = df["Outcome"]
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42, stratify=y)
-scaler = StandardScaler()
-X_train = scaler.fit_transform(X_train)
-X_test = scaler.transform(X_test)
-
-model = SVC(kernel="rbf", probability=True, random_state=42)
-model.fit(X_train, y_train)
-acc = model.score(X_test, y_test)
-print(f"  accuracy: {acc:.4f}")
-pickle.dump(model, open(os.path.join(BASE, "diabetes_model.sav"), "wb"))
-pickle.dump(scaler, open(os.path.join(BASE, "diabetes_scaler.pkl"), "wb"))
-
-# --- Heart Disease ------------------------------------------
-print("Training heart-disease model...")
-df = pd.read_csv(os.path.join(BASE, "heart.csv"))
-X = df.drop(columns="target")
-y = df["target"]
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42, stratify=y)
-scaler = StandardScaler()
-X_train = scaler.fit_transform(X_train)
-X_test = scaler.transform(X_test)
-
-model = RandomForestClassifier(n_estimators=200, random_state=42)
-model.fit(X_train, y_train)
-acc = model.score(X_test, y_test)
-print(f"  accuracy: {acc:.4f}")
-pickle.dump(model, open(os.path.join(BASE, "heart_disease_model.sav"), "wb"))
-pickle.dump(scaler, open(os.path.join(BASE, "heart_disease_scaler.pkl"), "wb"))
-
-# --- Parkinson's -------------------------------------------
-print("Training Parkinsons model...")
-df = pd.read_csv(os.path.join(BASE, "parkinsons.csv"))
-X = df.drop(columns=["name", "status"])
-y = df["status"]
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42, stratify=y)
-scaler = StandardScaler()
-X_train = scaler.fit_transform(X_train)
-X_test = scaler.transform(X_test)
-
-model = SVC(kernel="rbf", probability=True, random_state=42)
-model.fit(X_train, y_train)
-acc = model.score(X_test, y_test)
-print(f"  accuracy: {acc:.4f}")
-pickle.dump(model, open(os.path.join(BASE, "parkinsons_model.sav"), "wb"))
-pickle.dump(scaler, open(os.path.join(BASE, "parkinsons_scaler.pkl"), "wb"))
-
-print("All three models saved successfully.")
+# disease -> (dataset, target column, other non-feature columns, estimator)
+MODEL_SPECS = {
+    "diabetes": ("diabetes.csv", "Outcome", [],
+                 lambda: SVC(kernel="rbf", probability=True, random_state=42)),
+    "heart": ("heart.csv", "target", [],
+              lambda: RandomForestClassifier(n_estimators=200, random_state=42)),
+    "parkinsons": ("parkinsons.csv", "status", ["name"],
+                   lambda: SVC(kernel="rbf", probability=True, random_state=42)),
+}
+
+
+def train(disease, base_dir=BASE):
+    """Fit the model and scaler for `disease`; returns (model, scaler, test accuracy)."""
+    dataset, target, extra, make_model = MODEL_SPECS[disease]
+    df = pd.read_csv(os.path.join(base_dir, dataset))
+    X = df.drop(columns=[*extra, target])
+    y = df[target]
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42, stratify=y)
+    scaler = StandardScaler()
+    X_train = scaler.fit_transform(X_train)
+    X_test = scaler.transform(X_test)
+
+    model = make_model()
+    model.fit(X_train, y_train)
+    return model, scaler, model.score(X_test, y_test)
+
+
+def _atomic_pickle(obj, path):
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp",
+                                    dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            pickle.dump(obj, fh)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_artifacts(disease, model, scaler, base_dir=BASE):
+    """Atomically write a model and its scaler.
+
+    The scaler goes first: the model file appearing is what marks the pair
+    as complete for model_provisioning.
+    """
+    model_file, scaler_file = MODEL_ARTIFACTS[disease]
+    _atomic_pickle(scaler, os.path.join(base_dir, scaler_file))
+    _atomic_pickle(model, os.path.join(base_dir, model_file))
+
+
+def main():
+    labels = {"diabetes": "diabetes", "heart": "heart-disease", "parkinsons": "Parkinsons"}
+    for disease in MODEL_SPECS:
+        print(f"Training {labels[disease]} model...")
+        model, scaler, acc = train(disease)
+        print(f"  accuracy: {acc:.4f}")
+        write_artifacts(disease, model, scaler)
+
+    print("All three models saved successfully.")
+
 
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,456 @@
+"""
+Shared rendering helpers for the Streamlit entry point and its pages.
+"""
+import base64
+import os
+
+import streamlit as st
+
+from inference import positive_column
+
+# Add missing functions
+def calculate_confidence(prediction_proba):
+    """Calculate confidence percentage from prediction probability"""
+    import numpy as np
+    try:
+        # Get the highest probability
+        max_proba = np.max(prediction_proba)
+        return max_proba * 100
+    except Exception as e:
+        st.error(f"Error calculating confidence: {str(e)}")
+        return 50.0  # Default 50% confidence
+
+def positive_probability(model, prediction_proba):
+    """Probability of the positive class (label 1) from `model`'s predict_proba output."""
+    return float(prediction_proba[0][positive_column(model)])
+
+def show_result_popup(diagnosis, confidence, is_positive):
+    """Show an animated full-width result banner."""
+    if is_positive:
+        bg   = "linear-gradient(135deg, #450a0a 0%, #7f1d1d 55%, #991b1b 100%)"
+        border_color = "rgba(239, 68, 68, 0.60)"
+        glow  = "0 0 0 1px rgba(239,68,68,0.18), 0 24px 60px rgba(185, 28, 28, 0.28)"
+        icon  = "⚠️"
+        badge = "HIGH RISK"
+        badge_bg = "rgba(239,68,68,0.22)"
+        badge_color = "#fca5a5"
+        text_color = "#fff1f1"
+        extra_css = """
+            @keyframes pulseBorder {
+                0%, 100% { box-shadow: 0 0 0 1px rgba(239,68,68,0.18), 0 24px 60px rgba(185,28,28,0.28); }
+                50%       { box-shadow: 0 0 0 4px rgba(239,68,68,0.30), 0 28px 70px rgba(185,28,28,0.38); }
+            }"""
+    else:
+        bg   = "linear-gradient(135deg, #052e16 0%, #14532d 55%, #166534 100%)"
+        border_color = "rgba(34, 197, 94, 0.50)"
+        glow  = "0 0 0 1px rgba(34,197,94,0.18), 0 24px 60px rgba(22, 101, 52, 0.28)"
+        icon  = "✅"
+        badge = "LOW RISK"
+        badge_bg = "rgba(34,197,94,0.18)"
+        badge_color = "#86efac"
+        text_color = "#f0fdf4"
+        extra_css = """
+            @keyframes shimmerResult {
+                0%   { background-position: -600px 0; }
+                100% { background-position: 600px 0; }
+            }"""
+
+    conf_pct = min(100, max(0, confidence))
+    conf_bar_color = "#86efac" if not is_positive else "#fca5a5"
+
+    st.markdown(f"""
+<style>
+    {extra_css}
+    .result-banner {{
+        animation: riseIn 0.45s ease both;
+    }}
+</style>
+<div class="result-banner" style="
+        background: {bg};
+        border: 1px solid {border_color};
+        border-radius: 20px;
+        padding: 22px 26px;
+        margin: 16px 0 20px;
+        box-shadow: {glow};
+        animation: riseIn 0.45s ease both;
+    ">
+<div style="display:flex; align-items:center; justify-content:space-between; flex-wrap:wrap; gap:1rem;">
+<div style="display:flex; align-items:center; gap:0.75rem;">
+<span style="font-size:2rem; line-height:1;">{icon}</span>
+<div>
+<span style="
+                        display:inline-block;
+                        background:{badge_bg};
+                        color:{badge_color};
+                        border:1px solid {badge_color}33;
+                        border-radius:999px;
+                        padding:0.25rem 0.75rem;
+                        font-size:0.7rem;
+                        font-weight:800;
+                        letter-spacing:0.10em;
+                        text-transform:uppercase;
+                        margin-bottom:6px;
+                    ">{badge}</span>
+<p style="margin:0; color:{text_color}; font-size:1.3rem; font-weight:700; font-family:'Space Grotesk',sans-serif; letter-spacing:-0.02em;">{diagnosis}</p>
+</div>
+</div>
+<div style="text-align:right;">
+<p style="margin:0 0 6px; color:{badge_color}; font-size:0.78rem; font-weight:700; letter-spacing:0.06em; text-transform:uppercase;">Model Confidence</p>
+<p style="margin:0; color:{text_color}; font-size:2rem; font-weight:800; font-family:'Space Grotesk',sans-serif; letter-spacing:-0.04em;">{confidence:.1f}%</p>
+<div style="margin-top:6px; height:6px; border-radius:6px; background:rgba(255,255,255,0.12); overflow:hidden;">
+<div style="height:100%; width:{conf_pct}%; background:{conf_bar_color}; border-radius:6px; transition:width 0.6s ease;"></div>
+</div>
+</div>
+</div>
+</div>
+    """, unsafe_allow_html=True)
+
+def render_page_hero(title, subtitle, tag_text=""):
+    """Render a consistent page hero banner."""
+    badge_html = f"<span class='tag'>{tag_text}</span>" if tag_text else ""
+    st.markdown(
+        f"""
+<section class="page-hero">
+    {badge_html}
+<h1>{title}</h1>
+<p>{subtitle}</p>
+</section>
+        """,
+        unsafe_allow_html=True
+    )
+
+def render_feature_grid(items):
+    """Render a responsive feature-card grid."""
+    cards_html: list[str] = []
+    for item in items:
+        tag = item.get("tag", "")
+        tag_html = f"<span class='tag'>{tag}</span>" if tag else ""
+        cards_html.append(
+            str(f"""
+<article class="feature-card">
+    {tag_html}
+<h4>{item['title']}</h4>
+<p>{item['body']}</p>
+</article>
+            """)
+        )
+    st.markdown(f"<section class='feature-grid'>{''.join(cards_html)}</section>", unsafe_allow_html=True)
+
+def render_doc_grid(items):
+    """Render documentation-style content cards."""
+    cards_html: list[str] = []
+    for item in items:
+        title = item["title"]
+        body = item["body"]
+        cards_html.append(
+            str(f"""
+<article class="doc-card">
+<h3>{title}</h3>
+<p>{body}</p>
+</article>
+            """)
+        )
+    st.markdown(f"<section class='doc-grid'>{''.join(cards_html)}</section>", unsafe_allow_html=True)
+
+# Function to download and save image
+def download_image(url, filename):
+    """Download an image from URL and save it to the images directory"""
+    # Create images directory if it doesn't exist
+    images_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'images')
+    if not os.path.exists(images_dir):
+        os.makedirs(images_dir)
+    
+    file_path = os.path.join(images_dir, filename)
+    
+    # If file already exists, return its path
+    if os.path.exists(file_path):
+        return file_path
+    
+    try:
+        import requests
+        response = requests.get(url, stream=True)
+        response.raise_for_status()  # Raise an exception for HTTP errors
+        
+        with open(file_path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=8192):
+                f.write(chunk)
+        
+        st.success(f"Downloaded {filename}")
+        return file_path
+    except Exception as e:
+        st.error(f"Error downloading {filename}: {str(e)}")
+
+# Function to add a background image
+def add_bg_from_local(image_file):
+    with open(image_file, "rb") as image_file:
+        encoded_string = base64.b64encode(image_file.read())
+    st.markdown(
+    f"""
+<style>
+    .stApp {{
+        background-image: url(data:image/{"png"};base64,{encoded_string.decode()});
+        background-size: cover;
+        background-position: center;
+        background-repeat: no-repeat;
+        background-attachment: fixed;
+    }}
+</style>
+    """,
+    unsafe_allow_html=True
+    )
+
+# Keep background consistent with the theme to preserve readability.
+
+# Function to display a styled header
+def styled_header(text, level=1):
+    if level == 1:
+        st.markdown(f"<h1 style='text-align: center; color: var(--ui-ink); padding-bottom: 14px; font-size: 2.2rem; letter-spacing:-0.03em;'>{text}</h1>", unsafe_allow_html=True)
+    elif level == 2:
+        st.markdown(f"<h2 style='color: var(--ui-ink); padding-bottom: 6px; font-size: 1.7rem; letter-spacing:-0.02em;'>{text}</h2>", unsafe_allow_html=True)
+    elif level == 3:
+        st.markdown(f"<h3 style='color: var(--ui-ink); padding-bottom: 4px; font-size: 1.25rem;'>{text}</h3>", unsafe_allow_html=True)
+
+# Function to display a styled success message
+def styled_success(text):
+    st.markdown(f"<div class='success-message'>{text}</div>", unsafe_allow_html=True)
+
+# Function to display a styled warning message
+def styled_warning(text):
+    st.markdown(f"<div class='warning-message'>{text}</div>", unsafe_allow_html=True)
+
+# Function to display a styled info box
+def styled_info(text):
+    st.markdown(f"<div class='info-box'>{text}</div>", unsafe_allow_html=True)
+
+# Function to create a styled card
+def styled_card(title, content, icon=""):
+    icon_markup = f"<span style='margin-right:6px;'>{icon}</span>" if icon else ""
+    st.markdown(f"""
+<div class="prediction-card" style="padding: 16px;">
+<h3 style="color: var(--ui-ink); font-size: 1.3rem; margin-bottom: 8px;">{icon_markup}{title}</h3>
+<p style="color: var(--ui-muted); font-size: 1rem; line-height: 1.5; margin: 0;">{content}</p>
+</div>
+    """, unsafe_allow_html=True)
+
+# Add new functions for interactive popups
+def show_welcome_popup():
+    """Show a welcome popup when the app starts"""
+    # Initialize welcome popup state if not exists
+    if 'welcome_popup_shown' not in st.session_state:
+        st.session_state.welcome_popup_shown = False
+    
+    # Show popup if not dismissed yet
+    if not st.session_state.welcome_popup_shown:
+        with st.container():
+            st.markdown("""
+<div style="
+                background: white;
+                padding: 30px;
+                border-radius: 15px;
+                box-shadow: 0 4px 20px rgba(0,0,0,0.2);
+                max-width: 500px;
+                width: 100%;
+                text-align: center;
+                margin: 0 auto;">
+<h2 style="color: #1e3a8a; margin-bottom: 20px;">Welcome to Health AI</h2>
+<p style="color: #333; margin-bottom: 20px; line-height: 1.6;">
+                    Your personal health prediction assistant. We use advanced AI to help you understand potential health risks.
+</p>
+</div>
+            """, unsafe_allow_html=True)
+            
+            if st.button("Get Started", key="welcome_close_btn"):
+                st.session_state.welcome_popup_shown = True
+                st.rerun()
+
+def show_tip_popup(tip_title, tip_content):
+    """Show a floating tip popup"""
+    # Initialize tip popup state if not exists
+    if 'tip_popup_shown' not in st.session_state:
+        st.session_state.tip_popup_shown = False
+    
+    # Show tip if not dismissed yet
+    if not st.session_state.tip_popup_shown:
+        with st.sidebar.container():
+            st.markdown(f"""
+<div style="
+                background: white;
+                padding: 15px;
+                border-radius: 10px;
+                box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+                max-width: 300px;
+                border-left: 4px solid #1e40af;">
+<h4 style="color: #1e3a8a; margin: 0 0 10px 0;">{tip_title}</h4>
+<p style="color: #333; margin: 0; font-size: 0.9rem;">{tip_content}</p>
+</div>
+            """, unsafe_allow_html=True)
+            
+            if st.button("Dismiss Tip", key="tip_close_btn"):
+                st.session_state.tip_popup_shown = True
+                st.rerun()
+
+def show_help_button():
+    """Show a floating help button with popup content"""
+    # Initialize help popup state if not exists
+    if 'help_popup_shown' not in st.session_state:
+        st.session_state.help_popup_shown = False
+    
+    # Create a container for the help button
+    with st.sidebar:
+        if st.button("Help", key="help_button"):
+            st.session_state.help_popup_shown = not st.session_state.help_popup_shown
+            st.rerun()
+        
+        # Show help content if button was clicked
+        if st.session_state.help_popup_shown:
+            st.markdown("""
+<div class="helper-card" style="margin-top: 0.75rem;">
+<h4>Need help?</h4>
+<ul style="margin: 0; padding-left: 20px;">
+<li>Use the sidebar to navigate</li>
+<li>Enter your health parameters</li>
+<li>Get instant predictions</li>
+<li>View detailed analysis</li>
+</ul>
+</div>
+            """, unsafe_allow_html=True)
+            
+            if st.button("Close Help", key="help_close_btn"):
+                st.session_state.help_popup_shown = False
+                st.rerun()
+
+def add_tooltip(element_id, tooltip_text):
+    """Add a tooltip to an element"""
+    tooltip_css = f"""
+<style>
+            #{element_id} {{
+                position: relative;
+            }}
+            #{element_id}:hover::after {{
+                content: "{tooltip_text}";
+                position: absolute;
+                bottom: 100%;
+                left: 50%;
+                transform: translateX(-50%);
+                padding: 8px;
+                background: #1e3a8a;
+                color: white;
+                border-radius: 5px;
+                font-size: 0.9rem;
+                white-space: nowrap;
+                z-index: 1000;
+            }}
+</style>
+    """
+    st.markdown(tooltip_css, unsafe_allow_html=True)
+
+def count_form_run(form_name):
+    """Count a script or fragment run that rendered a prediction form.
+
+    The run that first draws the form is not counted, so the number recorded
+    by finish_prediction_reruns() is the reruns the user's input cost.
+    """
+    counts = st.session_state.setdefault('form_reruns', {})
+    counts[form_name] = counts.get(form_name, -1) + 1
+
+def finish_prediction_reruns(form_name):
+    """Record the reruns one completed prediction took and start counting afresh.
+
+    The history is kept in st.session_state['prediction_reruns'][form_name];
+    with STARTUP_PROFILE=1 each value is also logged to stderr.
+    """
+    import sys
+    from startup_profile import PROFILE_ENABLED
+
+    counts = st.session_state.setdefault('form_reruns', {})
+    reruns = counts.get(form_name, 0)
+    counts[form_name] = 0
+    st.session_state.setdefault('prediction_reruns', {}).setdefault(form_name, []).append(reruns)
+    if PROFILE_ENABLED:
+        print(f"[reruns] form={form_name} reruns_per_prediction={reruns}", file=sys.stderr)
+    return reruns
+
+def show_feature_attributions(bundle, disease, features):
+    """Chart how much each input moved this prediction's positive-class probability."""
+    from charts import plot_feature_importance
+    from explanations import FEATURE_LABELS, explain, top_attributions
+
+    explanation = explain(bundle, features)
+    if explanation is None:
+        st.info("Per-patient feature contributions are not available for this model.")
+        return
+    base_value, values = explanation
+    labels, scores = top_attributions(FEATURE_LABELS[disease], values)
+    st.plotly_chart(plot_feature_importance(labels, scores, x_label='Contribution (percentage points)'))
+    st.caption(
+        f"Percentage-point change in predicted risk from each input, relative to an average "
+        f"patient ({base_value * 100:.1f}%). Positive values push towards a positive result."
+    )
+
+
+OUTCOME_NAMES = {
+    "diabetes": "Diabetes",
+    "heart": "Heart disease",
+    "parkinsons": "Parkinson's",
+}
+
+
+def show_similar_patients(bundle, disease, features, k=5):
+    """Table the k most similar patients in the bundled dataset and their outcomes."""
+    import pandas as pd
+
+    from similar_patients import similar_patients
+
+    columns, rows, labels, distances = similar_patients(bundle, disease, features, k)
+    if not len(labels):
+        return
+    table = pd.DataFrame(rows, columns=columns)
+    table.insert(0, "Outcome", [OUTCOME_NAMES[disease] if label == 1 else "Negative" for label in labels])
+    table.insert(1, "Distance", distances.round(2))
+    positives = int((labels == 1).sum())
+    st.caption(
+        f"{positives} of the {len(labels)} most similar patients in the reference dataset had a positive "
+        f"diagnosis. Distance is measured on the model's standardized inputs."
+    )
+    st.dataframe(table, hide_index=True)
+
+
+# (CSV column, label) per disease for the what-if tab, and the pair swept
+# together on a 2-D grid (indices into that list).
+WHAT_IF_FEATURES = {
+    "diabetes": ([("Glucose", "Glucose"), ("BMI", "BMI"), ("BloodPressure", "Blood Pressure")], (0, 1)),
+    "heart": ([("chol", "Cholesterol"), ("trestbps", "Resting Blood Pressure")], (0, 1)),
+}
+WHAT_IF_POINTS = 50
+
+
+def show_what_if(bundle, disease, features):
+    """Chart how the predicted risk responds to the disease's key inputs."""
+    from charts import plot_what_if_curves, plot_what_if_surface
+    from inference import value_grid, what_if_curves, what_if_surface
+    from population_stats import get_population_stats
+
+    population = get_population_stats()
+    swept, (first, second) = WHAT_IF_FEATURES[disease]
+    grids = {}
+    for column, _ in swept:
+        index = population.columns[disease][column]
+        grids[index] = value_grid(*population.value_range(disease, column), WHAT_IF_POINTS, include=features[index])
+    curves = what_if_curves(bundle, features, grids)
+    indices = list(grids)
+    st.plotly_chart(plot_what_if_curves(
+        [label for _, label in swept],
+        [curves[index][0] for index in indices],
+        [curves[index][1] for index in indices],
+        [features[index] for index in indices],
+    ))
+
+    i, j = indices[first], indices[second]
+    surface = what_if_surface(bundle, features, (i, grids[i]), (j, grids[j]))
+    st.plotly_chart(plot_what_if_surface(
+        swept[first][1], grids[i], swept[second][1], grids[j], surface, current=(features[i], features[j])
+    ))
+    st.caption(
+        "Predicted risk with one or two inputs changed and everything else kept as entered, "
+        "over the range seen in the reference dataset."
+    )
@@ -0,0 +1,459 @@
+"""
+Parkinson's voice measures from a sustained-vowel WAV recording.
+
+extract_features() turns a PCM WAV file (path or file object) into the 22
+values the Parkinson's model takes, in parkinsons.csv column order
+(FEATURE_NAMES). The recording is read with the stdlib `wave` module as a
+stream of fixed-size blocks (iter_wav_blocks) and fed to a
+VoiceFeatureExtractor, which keeps running sums rather than the signal, so
+memory stays bounded by the block size however long the recording is.
+
+Per block, all in NumPy:
+
+- F0 and voicing per FRAME_SECONDS frame from the normalized autocorrelation
+  (Boersma's window-corrected method, one batched FFT for every frame of the
+  block). The autocorrelation peak r also gives HNR = 10 log10(r / (1 - r))
+  and NHR = (1 - r) / r.
+- Pitch marks: samples of the lightly smoothed signal that are the maximum
+  within +-0.7 local periods (one O(n) sliding maximum), refined by
+  parabolic interpolation. Their
+  spacing is the period sequence and their heights the amplitude sequence.
+- Jitter / shimmer as MDVP defines them: mean absolute differences of
+  consecutive periods / amplitudes, and of each value against its 3-, 5- or
+  11-point moving average, computed with sliding windows. The last ten
+  values of a voiced run are carried into the next block, so no window is
+  lost or counted twice at a block boundary.
+- On voiced blocks, resampled to about NONLINEAR_RATE: recurrence period
+  histogram (RPDE), detrended-fluctuation sums per scale (DFA) and
+  correlation sums per radius (D2), each a fixed-size accumulator.
+
+The measures follow the definitions behind the dataset (MDVP; Little et al.,
+2007 and 2009), but MDVP is proprietary and the dataset does not publish its
+exact settings, so values will differ somewhat from the training data.
+spread1, spread2 and PPE are computed from the frame F0 contour (capped at
+CONTOUR_LIMIT frames): spread1 = ln(std of the AR(2)-whitened ln F0),
+spread2 = std of log2 F0 and PPE = normalized entropy of the whitened
+contour in semitones.
+
+Because of that, a perfectly clean recording can still land outside the
+values the model was trained on; out_of_training_range() lists the
+measures that do, so callers can say so next to the prediction.
+"""
+import math
+import wave
+
+import numpy as np
+
+FEATURE_NAMES = [
+    "MDVP:Fo(Hz)", "MDVP:Fhi(Hz)", "MDVP:Flo(Hz)", "MDVP:Jitter(%)", "MDVP:Jitter(Abs)", "MDVP:RAP",
+    "MDVP:PPQ", "Jitter:DDP", "MDVP:Shimmer", "MDVP:Shimmer(dB)", "Shimmer:APQ3", "Shimmer:APQ5",
+    "MDVP:APQ", "Shimmer:DDA", "NHR", "HNR", "RPDE", "DFA", "spread1", "spread2", "D2", "PPE",
+]
+
+F0_MIN = 65.0
+F0_MAX = 600.0
+FRAME_SECONDS = 0.05
+BLOCK_SECONDS = 1.0
+VOICING_THRESHOLD = 0.45
+# Autocorrelation penalty per octave of lag, so period doubling loses close calls. Higher than
+# Praat's 0.01, which also smooths the track with a path finder.
+OCTAVE_COST = 0.04
+SILENCE_RMS = 0.003
+# Moving-average length applied before pitch marking.
+SMOOTH_SECONDS = 0.0005
+# Shortest recording accepted, in voiced frames.
+MIN_VOICED_FRAMES = 10
+
+# Nonlinear measures run on the signal resampled to about this rate.
+NONLINEAR_RATE = 11025
+EMBED_DELAY_SECONDS = 0.0014
+RPDE_DIMENSION = 4
+RPDE_RADIUS = 0.12
+RPDE_MAX_PERIOD = 256
+RPDE_POINTS = 512
+DFA_SCALES = (22, 26, 30, 35, 40, 44)
+D2_DIMENSION = 10
+D2_POINTS = 300
+D2_RADII = np.logspace(-2.0, 0.3, 24)
+
+CONTOUR_LIMIT = 20000
+PPE_SEMITONES = 3.0
+PPE_BINS = 60
+
+
+def _pcm_to_float(raw, width, channels):
+    """Interleaved PCM bytes to mono float64 in [-1, 1]."""
+    if width == 1:
+        samples = np.frombuffer(raw, dtype=np.uint8).astype(np.float64) - 128.0
+    elif width == 3:
+        bytes3 = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        samples = (bytes3[:, 0] | (bytes3[:, 1] << 8) | (bytes3[:, 2] << 16)).astype(np.float64)
+        samples[samples >= 1 << 23] -= 1 << 24
+    else:
+        samples = np.frombuffer(raw, dtype={2: "<i2", 4: "<i4"}[width]).astype(np.float64)
+    samples /= float(1 << (8 * width - 1))
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    return samples
+
+
+def iter_wav_blocks(source, block_seconds=BLOCK_SECONDS):
+    """Yield (sample rate, mono block) from a PCM WAV, block_seconds at a time.
+
+    Blocks are a whole number of analysis frames; a trailing partial frame is dropped.
+    Raises ValueError for files that are not 8/16/24/32-bit PCM WAV.
+    """
+    try:
+        reader = wave.open(source, "rb")
+    except (wave.Error, EOFError) as e:
+        raise ValueError("Not a PCM WAV file") from e
+    with reader:
+        rate, width, channels = reader.getframerate(), reader.getsampwidth(), reader.getnchannels()
+        if width not in (1, 2, 3, 4):
+            raise ValueError(f"Unsupported sample width: {width} bytes")
+        frame = int(round(FRAME_SECONDS * rate))
+        block = max(1, int(round(block_seconds / FRAME_SECONDS))) * frame
+        while True:
+            raw = reader.readframes(block)
+            samples = _pcm_to_float(raw, width, channels)
+            samples = samples[:len(samples) // frame * frame]
+            if not len(samples):
+                break
+            yield rate, samples
+
+
+def _sliding_max(x, half):
+    """max(x[i - half : i + half + 1]) for every i (van Herk / Gil-Werman, O(n))."""
+    width = 2 * half + 1
+    padded = np.concatenate([np.full(half, -np.inf), x, np.full(half + width, -np.inf)])
+    rows = padded[:len(padded) // width * width].reshape(-1, width)
+    forward = np.maximum.accumulate(rows, axis=1).ravel()
+    backward = np.maximum.accumulate(rows[:, ::-1], axis=1)[:, ::-1].ravel()
+    return np.maximum(backward[:len(x)], forward[width - 1:width - 1 + len(x)])
+
+
+def _embed(x, dimension, delay):
+    """Time-delay embedding, one row per point."""
+    count = len(x) - (dimension - 1) * delay
+    if count <= 0:
+        return np.empty((0, dimension))
+    return x[np.arange(count)[:, None] + delay * np.arange(dimension)]
+
+
+class _Perturbation:
+    """Running MDVP perturbation sums over the voiced runs of one sequence."""
+
+    WINDOWS = (3, 5, 11)
+
+    def __init__(self, log_ratio=False):
+        self.log_ratio = log_ratio
+        self.carry = np.empty(0)
+        self.total = 0.0
+        self.count = 0
+        self.diff = np.zeros(2)  # (sum |v[i+1] - v[i]|, count)
+        self.ratio = np.zeros(2)  # (sum |20 log10(v[i+1] / v[i])|, count)
+        self.quotients = {k: np.zeros(2) for k in self.WINDOWS}
+
+    def add(self, values, continues):
+        """Add a voiced run's values; `continues` joins them to the previous run."""
+        if not len(values):
+            return
+        if not continues:
+            self.carry = np.empty(0)
+        self.total += values.sum()
+        self.count += len(values)
+        # The carried tail is shorter than every window, so each window here includes a new value.
+        joined = np.concatenate([self.carry, values])
+        recent = joined[-(len(values) + 1):]
+        if len(recent) > 1:
+            self.diff += (np.abs(np.diff(recent)).sum(), len(recent) - 1)
+            if self.log_ratio:
+                self.ratio += (np.abs(20.0 * np.log10(recent[1:] / recent[:-1])).sum(), len(recent) - 1)
+        for k in self.WINDOWS:
+            recent = joined[-(len(values) + k - 1):]
+            if len(recent) >= k:
+                windows = np.lib.stride_tricks.sliding_window_view(recent, k)
+                self.quotients[k] += (np.abs(windows[:, k // 2] - windows.mean(axis=1)).sum(), len(windows))
+        self.carry = joined[-(max(self.WINDOWS) - 1):]
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else math.nan
+
+    def relative(self, sums):
+        """Mean of the summed terms over the sequence mean."""
+        return sums[0] / sums[1] / self.mean if sums[1] else math.nan
+
+
+class VoiceFeatureExtractor:
+    """Streaming accumulator for the 22 voice measures at one sample rate."""
+
+    def __init__(self, sample_rate):
+        self.rate = sample_rate
+        self.frame = int(round(FRAME_SECONDS * sample_rate))
+        self.lag_min = max(2, int(sample_rate / F0_MAX))
+        # Up to half a frame the window's own autocorrelation stays above ~0.17, so dividing by it
+        # is well conditioned; it falls to zero towards a full frame.
+        self.lag_max = min(int(math.ceil(sample_rate / F0_MIN)), self.frame // 2)
+        self.nfft = 1 << int(math.ceil(math.log2(2 * self.frame)))
+        self.window = np.hanning(self.frame)
+        window_ac = np.fft.irfft(np.abs(np.fft.rfft(self.window, self.nfft)) ** 2)
+        # Only the searched lags are corrected.
+        self.window_ac = window_ac[self.lag_min:self.lag_max + 1] / window_ac[0]
+        self.octave_penalty = OCTAVE_COST * np.log2(np.arange(self.lag_min, self.lag_max + 1) * F0_MIN / sample_rate)
+        # Samples kept from the previous block so peaks near its end see a full window.
+        self.margin = int(0.7 * sample_rate / F0_MIN) + 2
+        self.tail = np.empty(0)
+        self.tail_period = math.nan
+        self.position = 0  # absolute index of the first sample not yet in the tail
+        self.last_mark = None  # (absolute position, amplitude) of the last accepted pitch mark
+
+        self.periods = _Perturbation()
+        self.amplitudes = _Perturbation(log_ratio=True)
+        self.frames = 0
+        self.voiced = 0
+        self.hnr = 0.0
+        self.nhr = 0.0
+        self.contour = []
+        self.contour_stride = 1
+        self.contour_skip = 0
+
+        self.decimate = max(1, int(round(sample_rate / NONLINEAR_RATE)))
+        self.delay = max(1, int(round(EMBED_DELAY_SECONDS * sample_rate / self.decimate)))
+        self.rpde_hist = np.zeros(RPDE_MAX_PERIOD + 1, dtype=np.int64)
+        self.dfa = np.zeros((len(DFA_SCALES), 2))
+        self.d2_counts = np.zeros(len(D2_RADII), dtype=np.int64)
+        self.d2_pairs = 0
+
+    def _pitch(self, block):
+        """Per-frame (period in samples, autocorrelation peak, voiced) for one block."""
+        frames = block.reshape(-1, self.frame)
+        frames = frames - frames.mean(axis=1, keepdims=True)
+        rms = np.sqrt((frames ** 2).mean(axis=1))
+        spectrum = np.fft.rfft(frames * self.window, self.nfft, axis=1)
+        ac = np.fft.irfft(np.abs(spectrum) ** 2, self.nfft, axis=1)
+        lags = ac[:, self.lag_min:self.lag_max + 1] / np.maximum(ac[:, :1], 1e-20) / self.window_ac
+        best = (lags - self.octave_penalty).argmax(axis=1)
+        # Parabolic interpolation around the peak (clamped at the lag range ends).
+        inner = np.clip(best, 1, lags.shape[1] - 2)
+        rows = np.arange(len(lags))
+        left, mid, right = lags[rows, inner - 1], lags[rows, inner], lags[rows, inner + 1]
+        curvature = left - 2.0 * mid + right
+        shift = np.where(curvature < 0, 0.5 * (left - right) / np.where(curvature < 0, curvature, -1.0), 0.0)
+        shift = np.where(inner == best, np.clip(shift, -0.5, 0.5), 0.0)
+        peak = np.where(inner == best, mid - 0.25 * (left - right) * shift, lags[rows, best])
+        period = self.lag_min + best + shift
+        voiced = (peak > VOICING_THRESHOLD) & (rms > SILENCE_RMS)
+        if voiced.any():
+            # Fold octave jumps back onto the block's typical period.
+            octaves = np.round(np.log2(period / np.median(period[voiced])))
+            period = period / 2.0 ** np.clip(octaves, -1, 1)
+        return period, np.clip(peak, 1e-6, 1.0 - 1e-6), voiced
+
+    def _marks(self, block, period):
+        """Add the periods and amplitudes between pitch marks in this block."""
+        rate, frame, margin = self.rate, self.frame, self.margin
+        signal = np.concatenate([self.tail, block])
+        start = self.position - len(self.tail)
+        local = np.concatenate([np.full(len(self.tail), self.tail_period), np.repeat(period, frame)])
+        self.tail, self.tail_period = signal[-2 * margin:], period[-1]
+        self.position += len(block)
+        if np.isnan(local).all():
+            self.last_mark = None
+            return
+
+        signal = signal - signal.mean()
+        # A short moving average keeps broadband noise from shifting the peaks.
+        width = max(1, int(round(SMOOTH_SECONDS * rate)))
+        signal = np.convolve(signal, np.full(width, 1.0 / width), mode="same")
+        half = max(1, int(0.7 * np.nanmin(local)))
+        peaks = np.zeros(len(signal), dtype=bool)
+        centre = slice(margin, len(signal) - margin)
+        peaks[centre] = signal[centre] >= _sliding_max(signal, half)[centre]
+        peaks[1:] &= signal[1:] > signal[:-1]
+        peaks &= ~np.isnan(local) & (signal > 0)
+        index = np.flatnonzero(peaks)
+        if not len(index):
+            self.last_mark = None
+            return
+        left, mid, right = signal[index - 1], signal[index], signal[index + 1]
+        curvature = left - 2.0 * mid + right
+        shift = np.where(curvature < 0, 0.5 * (left - right) / np.where(curvature < 0, curvature, -1.0), 0.0)
+        positions = start + index + np.clip(shift, -0.5, 0.5)
+        heights = mid - 0.25 * (left - right) * shift
+        expected = local[index]
+
+        if self.last_mark is not None:
+            positions = np.concatenate([[self.last_mark[0]], positions])
+            heights = np.concatenate([[self.last_mark[1]], heights])
+            expected = np.concatenate([[expected[0]], expected])
+        self.last_mark = (positions[-1], heights[-1])
+        spacing = np.diff(positions)
+        # A mark more than 30% off the local period ends the voiced run.
+        valid = np.abs(spacing - expected[1:]) < 0.3 * expected[1:]
+        edges = np.flatnonzero(np.diff(np.concatenate([[False], valid, [False]]).astype(np.int8)))
+        for run_start, run_stop in zip(edges[::2], edges[1::2]):
+            continues = run_start == 0 and len(spacing) > len(index) - 1
+            self.periods.add(spacing[run_start:run_stop] / rate, continues)
+            self.amplitudes.add(heights[run_start + 1:run_stop + 1], continues)
+
+    def _nonlinear(self, block):
+        """RPDE, DFA and D2 accumulators on one voiced block."""
+        q = self.decimate
+        x = block[:len(block) // q * q].reshape(-1, q).mean(axis=1)
+        x = x - x.mean()
+        scale = np.abs(x).max()
+        if scale <= 0:
+            return
+        x = x / scale
+
+        points = _embed(x[:RPDE_POINTS + (RPDE_DIMENSION - 1) * self.delay + RPDE_MAX_PERIOD], RPDE_DIMENSION,
+                        self.delay)
+        origins = len(points) - RPDE_MAX_PERIOD
+        if origins > 0:
+            ahead = np.arange(origins)[:, None] + np.arange(1, RPDE_MAX_PERIOD + 1)
+            offsets = points[ahead] - points[:origins, None]
+            inside = np.einsum("ijk,ijk->ij", offsets, offsets) < RPDE_RADIUS ** 2
+            # First return to the ball after having left it.
+            returned = inside & np.logical_or.accumulate(~inside, axis=1)
+            first = returned.argmax(axis=1)
+            self.rpde_hist += np.bincount(first[returned.any(axis=1)] + 1, minlength=RPDE_MAX_PERIOD + 1)
+
+        profile = np.cumsum(x)
+        for j, n in enumerate(DFA_SCALES):
+            segments = profile[:len(profile) // n * n].reshape(-1, n)
+            if not len(segments):
+                continue
+            t = np.arange(n) - (n - 1) / 2.0
+            slope = segments @ t / (t @ t)
+            residual = segments - segments.mean(axis=1, keepdims=True) - slope[:, None] * t
+            self.dfa[j] += ((residual ** 2).sum(), residual.size)
+
+        points = _embed(x, D2_DIMENSION, self.delay)
+        if len(points) >= 2:
+            points = points[np.linspace(0, len(points) - 1, min(D2_POINTS, len(points))).astype(np.intp)]
+            norms = np.einsum("ij,ij->i", points, points)
+            squared = (norms[:, None] + norms - 2.0 * (points @ points.T))[np.triu_indices(len(points), 1)]
+            self.d2_counts += np.searchsorted(np.sort(squared), D2_RADII ** 2)
+            self.d2_pairs += len(squared)
+
+    def _add_contour(self, f0):
+        for value in f0:
+            self.contour_skip += 1
+            if self.contour_skip < self.contour_stride:
+                continue
+            self.contour_skip = 0
+            self.contour.append(value)
+            if len(self.contour) >= CONTOUR_LIMIT:
+                self.contour = self.contour[::2]
+                self.contour_stride *= 2
+
+    def feed(self, block):
+        """Add one block (a whole number of frames) of mono samples."""
+        block = np.asarray(block, dtype=float)
+        if not len(block):
+            return
+        period, peak, voiced = self._pitch(block)
+        self.frames += len(period)
+        self.voiced += int(voiced.sum())
+        self.hnr += (10.0 * np.log10(peak[voiced] / (1.0 - peak[voiced]))).sum()
+        self.nhr += ((1.0 - peak[voiced]) / peak[voiced]).sum()
+        self._add_contour(self.rate / period[voiced])
+        self._marks(block, np.where(voiced, period, np.nan))
+        if voiced.mean() >= 0.5:
+            self._nonlinear(block)
+
+    def _contour_measures(self):
+        """(spread1, spread2, PPE) from the frame F0 contour."""
+        log_f0 = np.log(np.asarray(self.contour))
+        if len(log_f0) > 3:
+            design = np.column_stack([log_f0[1:-1], log_f0[:-2], np.ones(len(log_f0) - 2)])
+            coefficients = np.linalg.lstsq(design, log_f0[2:], rcond=None)[0]
+            residual = log_f0[2:] - design @ coefficients
+        else:
+            residual = log_f0 - log_f0.mean()
+        spread1 = math.log(max(residual.std(), 1e-6))
+        spread2 = float((log_f0 / math.log(2.0)).std())
+        semitones = np.clip(residual * 12.0 / math.log(2.0), -PPE_SEMITONES, PPE_SEMITONES)
+        counts = np.histogram(semitones, bins=PPE_BINS, range=(-PPE_SEMITONES, PPE_SEMITONES))[0]
+        p = counts[counts > 0] / counts.sum()
+        ppe = float(-(p * np.log(p)).sum() / math.log(PPE_BINS))
+        return spread1, spread2, ppe
+
+    def features(self):
+        """The 22 measures in FEATURE_NAMES order.
+
+        Raises ValueError if the recording has too little voiced sound.
+        """
+        if self.voiced < MIN_VOICED_FRAMES or self.periods.count < 2 or self.amplitudes.diff[1] == 0:
+            raise ValueError("Not enough voiced sound: record a steady 'aaah' of at least a second")
+        contour = np.asarray(self.contour)
+        fo, fhi, flo = contour.mean(), *np.percentile(contour, [99.0, 1.0])
+
+        periods, amplitudes = self.periods, self.amplitudes
+        jitter_abs = periods.diff[0] / periods.diff[1]
+        rap = periods.relative(periods.quotients[3])
+        apq3 = amplitudes.relative(amplitudes.quotients[3])
+
+        recurrences = self.rpde_hist[1:].astype(float)
+        if recurrences.sum():
+            p = recurrences[recurrences > 0] / recurrences.sum()
+            rpde = float(-(p * np.log(p)).sum() / math.log(RPDE_MAX_PERIOD))
+        else:
+            rpde = math.nan
+        measured = self.dfa[:, 1] > 0
+        if measured.sum() >= 2:
+            fluctuation = np.sqrt(self.dfa[measured, 0] / self.dfa[measured, 1])
+            alpha = np.polyfit(np.log(np.asarray(DFA_SCALES)[measured]), np.log(fluctuation), 1)[0]
+            dfa = 1.0 / (1.0 + math.exp(-alpha))
+        else:
+            dfa = math.nan
+        correlation = self.d2_counts / max(self.d2_pairs, 1)
+        # Fit the scaling region, away from the noise floor and the attractor's size.
+        scaling = (correlation > 1e-3) & (correlation < 0.3)
+        if scaling.sum() >= 2:
+            d2 = float(np.polyfit(np.log(D2_RADII[scaling]), np.log(correlation[scaling]), 1)[0])
+        else:
+            d2 = math.nan
+        spread1, spread2, ppe = self._contour_measures()
+
+        values = [
+            fo, fhi, flo,
+            jitter_abs / periods.mean, jitter_abs, rap, periods.relative(periods.quotients[5]), 3.0 * rap,
+            amplitudes.relative(amplitudes.diff), amplitudes.ratio[0] / amplitudes.ratio[1], apq3,
+            amplitudes.relative(amplitudes.quotients[5]), amplitudes.relative(amplitudes.quotients[11]), 3.0 * apq3,
+            self.nhr / self.voiced, self.hnr / self.voiced,
+            rpde, dfa, spread1, spread2, d2, ppe,
+        ]
+        values = [float(value) for value in values]
+        if any(math.isnan(value) for value in values):
+            raise ValueError("Not enough voiced sound: record a steady 'aaah' of at least a second")
+        return values
+
+
+def extract_features(source, block_seconds=BLOCK_SECONDS):
+    """The 22 Parkinson's model inputs (FEATURE_NAMES order) for a WAV path or file object.
+
+    Raises ValueError for unreadable or mostly unvoiced recordings.
+    """
+    extractor = None
+    for rate, block in iter_wav_blocks(source, block_seconds):
+        if extractor is None:
+            extractor = VoiceFeatureExtractor(rate)
+        extractor.feed(block)
+    if extractor is None:
+        raise ValueError("The recording is empty")
+    return extractor.features()
+
+
+def out_of_training_range(values):
+    """(name, value, lowest, highest) for each measure outside the range of the Parkinson's training data."""
+    from population_stats import get_population_stats
+
+    stats = get_population_stats()
+    outside = []
+    for name, value in zip(FEATURE_NAMES, values):
+        low, high = stats.value_range("parkinsons", name)
+        if not low <= value <= high:
+            outside.append((name, value, low, high))
+    return outside
@@ -0,0 +1,240 @@
+"""
+Background warm-up for the model-serving processes.
+
+The first prediction in a fresh process used to pay for unpickling the
+model, sklearn's first-call paths (lazy imports, input validation set-up)
+and, in Streamlit, plotly's figure validators. start_warmup() does all of
+that on a daemon thread when the process starts:
+
+1. build any missing artifact (model_provisioning), then load every model
+   bundle through the caller's loaders (the Streamlit st.cache_resource
+   loaders, or inference.load_bundle for the APIs), so the loaded bundles
+   are the ones requests will use;
+2. run a dummy batch of WARMUP_BATCH_ROWS rows, drawn around the training
+   means, through the scale-and-predict path, and one row through
+   inference.predict_with_proba without touching the prediction cache;
+3. build the model's explainer (explanations.py) and explain one row, and
+   load its similar-patient index (similar_patients.py);
+4. optionally load the population index (population_stats.py) and build one
+   throwaway figure per plotly builder.
+
+WarmupState records per-stage timings. Its ready flag backs the /ready
+endpoints: app.py and backend.py serve it themselves, and serve_readiness()
+runs a small HTTP server for Streamlit, which cannot add routes (see
+serve_streamlit.py).
+"""
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DISEASES = ("diabetes", "heart", "parkinsons")
+WARMUP_BATCH_ROWS = int(os.getenv("WARMUP_BATCH_ROWS", "32"))
+
+
+class WarmupState:
+    """Progress of the warm-up thread, safe to read from any thread."""
+
+    def __init__(self):
+        self.status = "pending"
+        self.bundles = {}
+        self.stages = []
+        self.errors = {}
+        self.started_at = None
+        self.finished_at = None
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self):
+        return self.status == "ready"
+
+    def wait(self, timeout=None):
+        """Block until the warm-up has finished; returns whether it is ready."""
+        self._done.wait(timeout)
+        return self.ready
+
+    def record(self, stage, started):
+        with self._lock:
+            self.stages.append((stage, round((time.perf_counter() - started) * 1000.0, 1)))
+
+    def fail(self, stage, exc):
+        with self._lock:
+            self.errors[stage] = f"{type(exc).__name__}: {exc}"
+
+    def finish(self):
+        self.finished_at = time.time()
+        self.status = "failed" if self.errors else "ready"
+        self._done.set()
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "status": self.status,
+                "ready": self.ready,
+                "models": sorted(self.bundles),
+                "stages_ms": dict(self.stages),
+                "errors": dict(self.errors),
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+            }
+
+
+def dummy_batch(bundle, rows=WARMUP_BATCH_ROWS):
+    """Rows around the training distribution, or None if the bundle has no scaler."""
+    import numpy as np
+
+    if bundle.scaler is None:
+        return None
+    rng = np.random.default_rng(0)
+    mean = np.asarray(bundle.scaler.mean_, dtype=float)
+    scale = np.asarray(bundle.scaler.scale_, dtype=float)
+    return mean + rng.standard_normal((rows, mean.size)) * scale
+
+
+def warm_bundle(bundle):
+    """Exercise the batch and single-row prediction and explanation paths once."""
+    from explanations import explain
+    from inference import predict_with_proba
+
+    batch = dummy_batch(bundle)
+    if batch is None:
+        return
+    bundle.predict_with_proba(batch)
+    predict_with_proba(bundle, batch[0], cache=None, monitor=False)
+    explain(bundle, batch[0], cache=None)
+
+
+def build_figures():
+    """Load the population index and build one figure per builder, to load plotly's validators."""
+    import plotly.io as pio
+
+    import charts
+    from population_stats import get_population_stats
+
+    get_population_stats()
+
+    # Throwaway figures bypass the figure cache.
+    pio.to_json(charts.plot_feature_importance.uncached(["Warm-up", "Figure"], [1.0, -1.0]))
+    charts.plot_prediction_proba.uncached([0.5, 0.5])
+    charts.create_metrics_chart.uncached([1.0], ["Warm-up"], [(0.0, 2.0)])
+    charts.create_distribution_plot.uncached([0.0, 1.0], [("Warm-up", [1])], "Warm-up", normal_range=(0.0, 1.0))
+    charts.create_comparison_chart.uncached([1.0], [1.0], ["Warm-up"])
+    charts.plot_prediction_distribution.uncached(["Warm-up"], [1])
+    charts.plot_what_if_curves.uncached(["Warm-up"], [[0.0, 1.0]], [[0.2, 0.8]], [0.5])
+    charts.plot_what_if_surface.uncached("x", [0.0, 1.0], "y", [0.0, 1.0], [[0.2, 0.4], [0.6, 0.8]])
+
+
+def run_warmup(loaders, figures=False, state=None):
+    """Warm up synchronously.
+
+    `loaders` maps a disease to a zero-argument bundle loader; it may also be
+    a callable returning that mapping, resolved here so heavy imports happen
+    on the warm-up thread.
+    """
+    from model_provisioning import wait_for_artifacts
+    from similar_patients import get_neighbor_index
+
+    state = state or WarmupState()
+    state.status = "warming"
+    state.started_at = time.time()
+    if callable(loaders):
+        started = time.perf_counter()
+        try:
+            loaders = loaders()
+        except Exception as exc:
+            state.fail("imports", exc)
+            loaders = {}
+        state.record("imports", started)
+    for disease, loader in loaders.items():
+        started = time.perf_counter()
+        try:
+            # A missing artifact is built first (see model_provisioning);
+            # /ready stays 503 meanwhile.
+            wait_for_artifacts(disease)
+            bundle = loader()
+            warm_bundle(bundle)
+            get_neighbor_index(bundle, disease)
+            state.bundles[disease] = bundle
+        except Exception as exc:
+            state.fail(disease, exc)
+        state.record(disease, started)
+    if figures:
+        started = time.perf_counter()
+        try:
+            build_figures()
+        except Exception as exc:
+            state.fail("figures", exc)
+        state.record("figures", started)
+    state.finish()
+    return state
+
+
+_state = None
+_state_lock = threading.Lock()
+
+
+def start_warmup(loaders, figures=False):
+    """Start the warm-up thread once per process and return its WarmupState."""
+    global _state
+    with _state_lock:
+        if _state is None:
+            _state = WarmupState()
+            threading.Thread(
+                target=run_warmup, args=(loaders, figures, _state), name="warmup", daemon=True
+            ).start()
+        return _state
+
+
+def api_loaders(base_dir=None):
+    """Loaders for the Flask and FastAPI services: plain inference.load_bundle."""
+    import functools
+
+    from inference import BASE_DIR, load_bundle
+
+    return {disease: functools.partial(load_bundle, disease, base_dir or BASE_DIR) for disease in DISEASES}
+
+
+def streamlit_loaders():
+    """The pages' st.cache_resource loaders, so warmed bundles are shared with sessions."""
+    import model_loaders
+
+    return {
+        "diabetes": model_loaders.load_diabetes_model,
+        "heart": model_loaders.load_heart_disease_model,
+        "parkinsons": model_loaders.load_parkinsons_model,
+    }
+
+
+def start_streamlit_warmup():
+    """Warm the Streamlit app's models and figures (no-op after the first call)."""
+    return start_warmup(streamlit_loaders, figures=True)
+
+
+class _ReadinessHandler(BaseHTTPRequestHandler):
+    state = None
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/ready":
+            self.send_error(404)
+            return
+        body = json.dumps(self.state.snapshot()).encode("utf-8")
+        self.send_response(200 if self.state.ready else 503)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_readiness(state, port, host="0.0.0.0"):
+    """Serve GET /ready for `state` on a daemon thread (200 when ready, else 503)."""
+    handler = type("ReadinessHandler", (_ReadinessHandler,), {"state": state})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="readiness", daemon=True).start()
+    return server